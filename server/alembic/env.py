@@ -0,0 +1,78 @@
+"""
+    Date Written: 10/19/2026 at 10:00 PM
+
+    Alembic environment, runs the migrations on the application database
+    (settings.DATABASE_URL, asyncpg) against the metadata of every model.
+
+    Run from the server directory:
+        alembic upgrade head
+        alembic revision --autogenerate -m "..."
+    A database created by Base.metadata.create_all before the migrations
+    existed is stamped first:
+        alembic stamp 0001_baseline
+"""
+
+import asyncio
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import pool
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import async_engine_from_config
+
+from app.configs.settings import settings
+from app.db.base import Base
+from app.db.model_registry import import_all_models
+
+config = context.config
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+# the application settings win over the url of alembic.ini
+config.set_main_option("sqlalchemy.url", settings.DATABASE_URL)
+
+import_all_models()
+target_metadata = Base.metadata
+
+
+def run_migrations_offline() -> None:
+    """Emit the SQL (alembic upgrade head --sql) without a database connection."""
+    context.configure(
+        url=config.get_main_option("sqlalchemy.url"),
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def do_run_migrations(connection: Connection) -> None:
+    context.configure(connection=connection, target_metadata=target_metadata)
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+async def run_async_migrations() -> None:
+    connectable = async_engine_from_config(
+        config.get_section(config.config_ini_section, {}),
+        prefix="sqlalchemy.",
+        poolclass=pool.NullPool,
+    )
+
+    async with connectable.connect() as connection:
+        await connection.run_sync(do_run_migrations)
+
+    await connectable.dispose()
+
+
+def run_migrations_online() -> None:
+    asyncio.run(run_async_migrations())
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,86 @@
+"""indexes for repository queries
+
+Revision ID: 0002_query_indexes
+Revises: 0001_baseline
+Create Date: 2026-10-19 17:19:19.859063
+
+Foreign key and filter columns of the enrollment, student, scheduling and
+face recognition queries (see scripts/explain_advisor.py). The unique
+constraints already index (student_id, class_section_id, term_id),
+(curriculum_course_id, term_id), (curriculum_id, course_id),
+(professor_id, class_section_id) and (room_code, building_id), only their
+leading column helps a lookup, the other columns get their own index.
+
+Built CONCURRENTLY outside of the migration transaction, live tables
+keep taking writes. A failed concurrent build leaves an INVALID index
+behind under the same name, which IF NOT EXISTS would skip and the planner
+ignores: an invalid index is dropped first, so a failed run can be repeated.
+
+Databases stamped at the baseline but created by create_all before the
+class_schedule indexes were declared miss those two, they are created here
+too (IF NOT EXISTS) and left to the baseline on downgrade.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002_query_indexes'
+down_revision: Union[str, Sequence[str], None] = '0001_baseline'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index name, table, columns)
+INDEXES = (
+    ('ix_class_section_course_offering_status', 'class_section', ['course_offering_id', 'status']),
+    ('ix_course_offering_term_status', 'course_offering', ['term_id', 'status']),
+    ('ix_curriculum_program_id', 'curriculum', ['program_id']),
+    ('ix_curriculum_course_course_id', 'curriculum_course', ['course_id']),
+    ('ix_enrollment_class_section_id', 'enrollment', ['class_section_id']),
+    ('ix_enrollment_student_term', 'enrollment', ['student_id', 'term_id']),
+    ('ix_enrollment_term_status', 'enrollment', ['term_id', 'status']),
+    ('ix_face_encoding_user_active', 'face_encoding', ['user_id', 'is_active']),
+    ('ix_professor_class_section_class_section_id', 'professor_class_section', ['class_section_id']),
+    ('ix_program_department_id', 'program', ['department_id']),
+    ('ix_room_building_id', 'room', ['building_id']),
+    ('ix_student_program_id', 'student', ['program_id']),
+    ('ix_term_status', 'term', ['status']),
+)
+
+# declared in the baseline
+BASELINE_INDEXES = (
+    ('ix_class_schedule_class_section_id', 'class_schedule', ['class_section_id']),
+    ('ix_class_schedule_room_day_start', 'class_schedule', ['room_id', 'day_of_week', 'start_time']),
+)
+
+
+def _drop_if_invalid(name: str, table: str) -> None:
+    """Drop the leftover of a failed CREATE INDEX CONCURRENTLY."""
+    invalid = op.get_bind().execute(
+        sa.text("SELECT NOT indisvalid FROM pg_index WHERE indexrelid = to_regclass(:name)"),
+        {"name": name}
+    ).scalar()
+    if invalid:
+        op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, columns in BASELINE_INDEXES + INDEXES:
+            _drop_if_invalid(name, table)
+            op.create_index(
+                name, table, columns, unique=False,
+                postgresql_concurrently=True, if_not_exists=True
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,59 @@
+"""timetable solver jobs
+
+Revision ID: 0004_timetable_solver_jobs
+Revises: 0003_table_versions
+Create Date: 2026-10-20 05:10:00.000000
+
+Timetable solver jobs and their proposals, stored so that any worker
+answers the polls, cancels and commits of a job. The partial unique index
+allows one QUEUED or RUNNING job per term across workers.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0004_timetable_solver_jobs'
+down_revision: Union[str, Sequence[str], None] = '0003_table_versions'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('timetable_solver_job',
+    sa.Column('id', sa.String(length=36), nullable=False),
+    sa.Column('submitted_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('status', sa.Enum('QUEUED', 'RUNNING', 'DONE', 'FAILED', 'COMMITTED', 'CANCELLED', name='timetablejobstatus'), nullable=False),
+    sa.Column('request', sa.JSON(), nullable=False),
+    sa.Column('requested_by', sa.String(length=255), nullable=True),
+    sa.Column('requested_by_id', sa.String(length=36), nullable=True),
+    sa.Column('progress', sa.Float(), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('sections_total', sa.Integer(), nullable=False),
+    sa.Column('meetings_total', sa.Integer(), nullable=False),
+    sa.Column('meetings_assigned', sa.Integer(), nullable=False),
+    sa.Column('elapsed_seconds', sa.Float(), nullable=False),
+    sa.Column('started_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('heartbeat_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('completed_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('proposal', sa.JSON(), nullable=True),
+    sa.Column('unassigned', sa.JSON(), nullable=True),
+    sa.Column('error', sa.String(length=255), nullable=True),
+    sa.Column('term_id', sa.String(length=36), nullable=False),
+    sa.ForeignKeyConstraint(['term_id'], ['term.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_timetable_solver_job_completed_at', 'timetable_solver_job', ['completed_at'], unique=False)
+    op.create_index('uq_timetable_solver_job_active_term', 'timetable_solver_job', ['term_id'], unique=True, postgresql_where=sa.text("status IN ('QUEUED', 'RUNNING')"))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('uq_timetable_solver_job_active_term', table_name='timetable_solver_job', postgresql_where=sa.text("status IN ('QUEUED', 'RUNNING')"))
+    op.drop_index('ix_timetable_solver_job_completed_at', table_name='timetable_solver_job')
+    op.drop_table('timetable_solver_job')
+    sa.Enum(name='timetablejobstatus').drop(op.get_bind(), checkfirst=True)
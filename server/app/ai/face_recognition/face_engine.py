@@ -0,0 +1,131 @@
+"""
+    Date Written: 10/19/2026 at 11:55 PM
+
+    Face detection / encoding / distance on image bytes, used in-process by
+    FaceRecognitionAI and by the face inference worker.
+    Imports face_recognition (dlib), cv2 and numpy at module load: only
+    import it where the face stack is meant to be loaded.
+"""
+
+from collections import defaultdict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import cv2
+import face_recognition
+import numpy as np
+
+from app.ai.face_recognition.face_inference_protocol import IMAGE_INVALID, IMAGE_OK, Location
+from app.utils.metrics import face_stage_duration
+
+# Resize large images for performance
+IMAGE_SIZE = (600, 600)
+
+
+def decode_image(image_bytes: bytes, size: Tuple[int, int] = IMAGE_SIZE) -> Optional[np.ndarray]:
+    """
+        Convert the uploaded file bytes to a numpy array (RGB format).
+
+        Line-by-line explanation:
+        1. Convert bytes to numpy array
+        2. Decode image using OpenCV (JPEG/PNG → BGR)
+        3. Resize if too large
+        4. Convert BGR to RGB (face_recognition expects RGB)
+    """
+    try:
+        # Convert bytes to numpy array
+        nparr = np.frombuffer(image_bytes, np.uint8)
+
+        # Decode image (JPEG/PNG → BGR)
+        image_bgr = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
+
+        if image_bgr is None:
+            return None
+
+        # Resize if too large (performance optimization)
+        height, width = image_bgr.shape[:2]
+        if width > size[0] or height > size[1]:
+            image_bgr = cv2.resize(image_bgr, size)
+
+        # Convert BGR to RGB (face_recognition expects RGB)
+        return cv2.cvtColor(image_bgr, cv2.COLOR_BGR2RGB)
+
+    except Exception as e:
+        print(f"Error decoding image: {e}")
+        return None
+
+
+def detect_faces(images: Sequence[np.ndarray], model: str = "hog") -> List[List[Location]]:
+    """
+        Face locations of every image. The CNN model detects a batch of
+        same-shape images in one call (batch_face_locations), HOG has no
+        batched form and runs image by image.
+    """
+    if model != "cnn":
+        return [face_recognition.face_locations(image, model=model) for image in images]
+
+    by_shape: Dict[tuple, List[int]] = defaultdict(list)
+    for i, image in enumerate(images):
+        by_shape[image.shape].append(i)
+
+    locations: List[List[Location]] = [[] for _ in images]
+    for indexes in by_shape.values():
+        found = face_recognition.batch_face_locations([images[i] for i in indexes], batch_size=len(indexes))
+        for i, image_locations in zip(indexes, found):
+            locations[i] = image_locations
+    return locations
+
+
+def encode_images(
+    images: Sequence[bytes], size: Tuple[int, int] = IMAGE_SIZE, model: str = "hog"
+) -> List[Tuple[int, List[Tuple[Location, np.ndarray]]]]:
+    """(image status, [(location, encoding)] of every face found) of every image."""
+    decoded = []
+    for image_bytes in images:
+        with face_stage_duration.labels("decode").time():
+            decoded.append(decode_image(image_bytes, size))
+    valid = [i for i, image in enumerate(decoded) if image is not None]
+
+    with face_stage_duration.labels("detect").time():
+        found = detect_faces([decoded[i] for i in valid], model)
+
+    results = [(IMAGE_INVALID, [])] * len(images)
+    with face_stage_duration.labels("encode").time():
+        for i, locations in zip(valid, found):
+            # every face of the image in one call
+            encodings = face_recognition.face_encodings(decoded[i], locations) if locations else []
+            results[i] = (IMAGE_OK, list(zip(locations, encodings)))
+    return results
+
+
+def compare_images(
+    items: Sequence[Tuple[bytes, Sequence[Sequence[float]]]], size: Tuple[int, int] = IMAGE_SIZE, model: str = "hog"
+) -> List[Tuple[int, int, List[float]]]:
+    """
+        (image status, face count, distance to every known encoding) of every
+        (image, known encodings). Distances only when exactly one face was
+        found and encoded.
+    """
+    results = []
+    encoded = encode_images([image for image, _ in items], size, model)
+    with face_stage_duration.labels("compare").time():
+        for (_, known_encodings), (status, faces) in zip(items, encoded):
+            if status != IMAGE_OK or len(faces) != 1 or not known_encodings:
+                results.append((status, len(faces), []))
+                continue
+
+            known = np.asarray(known_encodings, dtype=np.float64)
+            results.append((status, 1, face_recognition.face_distance(known, faces[0][1]).tolist()))
+    return results
+
+
+def encode_image(
+    image_bytes: bytes, size: Tuple[int, int] = IMAGE_SIZE, model: str = "hog"
+) -> Tuple[int, List[Tuple[Location, np.ndarray]]]:
+    return encode_images([image_bytes], size, model)[0]
+
+
+def compare_image(
+    image_bytes: bytes, known_encodings: Sequence[Sequence[float]], size: Tuple[int, int] = IMAGE_SIZE,
+    model: str = "hog"
+) -> Tuple[int, int, List[float]]:
+    return compare_images([(image_bytes, known_encodings)], size, model)[0]
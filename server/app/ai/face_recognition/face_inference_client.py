@@ -0,0 +1,121 @@
+"""
+    Date Written: 10/20/2026 at 12:30 AM
+
+    Async client of the face inference worker (face_inference_worker), one
+    Unix socket connection per API worker, requests pipelined on it and
+    matched back by request id. Opened on first use, reopened after a
+    failure. Stdlib only, no numpy in the API workers.
+"""
+
+import asyncio
+import itertools
+from array import array
+from typing import Dict, List, Optional, Sequence
+
+from app.ai.face_recognition.face_inference_protocol import *
+from app.configs.settings import settings
+from app.exceptions.customed_exception import ServiceUnavailableException
+
+
+class FaceInferenceClient:
+    def __init__(self, socket_path: str, timeout: float):
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._reader_task: Optional[asyncio.Task] = None
+        self._connect_lock = asyncio.Lock()
+        self._write_lock = asyncio.Lock()
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._ids = itertools.count(1)
+
+
+    async def encode(self, images: Sequence[bytes]) -> List[EncodeResult]:
+        """Faces (location, float64 encoding) of every image, in one job."""
+        payload = await self._request(OP_ENCODE, pack_encode_request(images))
+        return unpack_encode_response(payload, len(images))
+
+
+    async def compare(self, image: bytes, known_encodings: Sequence[Sequence[float]]) -> CompareResult:
+        """Distance of the face of the image to every known encoding."""
+        payload = await self._request(OP_COMPARE, pack_compare_request(image, known_encodings))
+        return unpack_compare_response(payload)
+
+
+    async def close(self) -> None:
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            self._reader_task = None
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        self._fail_pending(ConnectionError("face inference client closed"))
+
+
+    async def _request(self, op: int, payload: bytes) -> bytes:
+        request_id = next(self._ids) % 2**32
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        try:
+            await self._connect()
+            async with self._write_lock:
+                self._writer.write(frame(request_id, op, payload))
+                await self._writer.drain()
+
+            status, response = await asyncio.wait_for(future, self.timeout)
+        except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError) as e:
+            raise ServiceUnavailableException(f"Face recognition service unavailable ({type(e).__name__}).")
+        finally:
+            self._pending.pop(request_id, None)
+
+        if status != STATUS_OK:
+            raise ServiceUnavailableException(f"Face recognition failed: {response.decode(errors='replace')}")
+        return response
+
+
+    async def _connect(self) -> None:
+        if self._writer is not None and not self._writer.is_closing():
+            return
+        async with self._connect_lock:
+            if self._writer is not None and not self._writer.is_closing():
+                return
+            self._reader, self._writer = await asyncio.wait_for(
+                asyncio.open_unix_connection(self.socket_path), self.timeout
+            )
+            self._reader_task = asyncio.create_task(self._read_responses(self._reader))
+
+
+    async def _read_responses(self, reader: asyncio.StreamReader) -> None:
+        try:
+            while True:
+                request_id, status, length = HEADER.unpack(await reader.readexactly(HEADER.size))
+                payload = await reader.readexactly(length)
+                future = self._pending.get(request_id)
+                # None: the caller timed out meanwhile
+                if future is not None and not future.done():
+                    future.set_result((status, payload))
+        except (OSError, asyncio.IncompleteReadError) as e:
+            # worker restarted or gone: fail the waiting calls, reconnect on the next one
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+            self._fail_pending(e)
+
+
+    def _fail_pending(self, error: Exception) -> None:
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(error)
+
+
+def float64_encoding(stored: bytes) -> array:
+    """A stored encoding (numpy float64 bytes) as floats, without numpy."""
+    encoding = array("d")
+    encoding.frombytes(stored)
+    return encoding
+
+
+face_inference_client = (
+    FaceInferenceClient(settings.FACE_INFERENCE_SOCKET, settings.FACE_INFERENCE_TIMEOUT_SECONDS)
+    if settings.FACE_INFERENCE_SOCKET else None
+)
@@ -0,0 +1,165 @@
+"""
+    Date Written: 10/19/2026 at 11:45 PM
+
+    Binary framing between the API workers and the face inference worker
+    (Unix socket), stdlib only: the API side never imports numpy.
+
+    Frame: header (request id u32, op or status u8, payload length u32)
+    then the payload, big endian. Requests of one connection are pipelined,
+    responses come back in any order with the request id.
+
+    ENCODE request: image count u16, then per image: length u32, bytes
+        (the encoded file, JPEG/PNG, as uploaded)
+    ENCODE response: per image: status u8, face count u8, then per face:
+        location 4 x i32 (top, right, bottom, left), encoding 128 x f32
+    COMPARE request: image length u32, image bytes, encoding count u16,
+        encodings 128 x f32 each
+    COMPARE response: status u8, face count u8, distance count u16,
+        distances f32 (only when exactly one face was found)
+    ERROR response: utf-8 message
+"""
+
+import struct
+from array import array
+from dataclasses import dataclass
+from typing import List, Sequence, Tuple
+
+HEADER = struct.Struct("!IBI")
+ENCODING_SIZE = 128
+VECTOR = struct.Struct(f"!{ENCODING_SIZE}f")
+
+# request ops
+OP_ENCODE = 1
+OP_COMPARE = 2
+
+# response status of a frame
+STATUS_OK = 0
+STATUS_ERROR = 1
+
+# status of one image
+IMAGE_OK = 0
+IMAGE_INVALID = 1
+
+MAX_PAYLOAD = 64 * 1024 * 1024
+
+Location = Tuple[int, int, int, int]
+
+
+@dataclass
+class DetectedFace:
+    location: Location
+    # float64 values, array has tobytes() like the numpy arrays it replaces
+    encoding: array
+
+
+@dataclass
+class EncodeResult:
+    status: int
+    faces: List[DetectedFace]
+
+
+@dataclass
+class CompareResult:
+    status: int
+    face_count: int
+    distances: List[float]
+
+
+class ProtocolError(Exception):
+    pass
+
+
+def frame(request_id: int, code: int, payload: bytes) -> bytes:
+    return HEADER.pack(request_id, code, len(payload)) + payload
+
+
+def floats_to_f32(values: Sequence[float]) -> bytes:
+    if len(values) != ENCODING_SIZE:
+        raise ProtocolError(f"encoding of {len(values)} values, {ENCODING_SIZE} expected")
+    return VECTOR.pack(*values)
+
+
+def f32_to_floats(data: bytes) -> array:
+    return array("d", VECTOR.unpack(data))
+
+
+class Reader:
+    def __init__(self, payload: bytes):
+        self.payload = memoryview(payload)
+        self.offset = 0
+
+    def take(self, size: int) -> bytes:
+        if self.offset + size > len(self.payload):
+            raise ProtocolError("truncated payload")
+        chunk = self.payload[self.offset:self.offset + size].tobytes()
+        self.offset += size
+        return chunk
+
+    def unpack(self, fmt: str) -> tuple:
+        return struct.unpack("!" + fmt, self.take(struct.calcsize("!" + fmt)))
+
+
+# ENCODE
+
+def pack_encode_request(images: Sequence[bytes]) -> bytes:
+    parts = [struct.pack("!H", len(images))]
+    for image in images:
+        parts.append(struct.pack("!I", len(image)))
+        parts.append(image)
+    return b"".join(parts)
+
+
+def unpack_encode_request(payload: bytes) -> List[bytes]:
+    reader = Reader(payload)
+    (count,) = reader.unpack("H")
+    return [reader.take(reader.unpack("I")[0]) for _ in range(count)]
+
+
+def pack_encode_response(results: Sequence[Tuple[int, Sequence[Tuple[Location, Sequence[float]]]]]) -> bytes:
+    parts = []
+    for status, faces in results:
+        parts.append(struct.pack("!BB", status, len(faces)))
+        for location, encoding in faces:
+            parts.append(struct.pack("!4i", *location))
+            parts.append(floats_to_f32(encoding))
+    return b"".join(parts)
+
+
+def unpack_encode_response(payload: bytes, image_count: int) -> List[EncodeResult]:
+    reader = Reader(payload)
+    results = []
+    for _ in range(image_count):
+        status, face_count = reader.unpack("BB")
+        faces = [
+            DetectedFace(location=reader.unpack("4i"), encoding=f32_to_floats(reader.take(VECTOR.size)))
+            for _ in range(face_count)
+        ]
+        results.append(EncodeResult(status=status, faces=faces))
+    return results
+
+
+# COMPARE
+
+def pack_compare_request(image: bytes, encodings: Sequence[Sequence[float]]) -> bytes:
+    return b"".join([
+        struct.pack("!I", len(image)), image,
+        struct.pack("!H", len(encodings)),
+        *(floats_to_f32(encoding) for encoding in encodings)
+    ])
+
+
+def unpack_compare_request(payload: bytes) -> Tuple[bytes, List[array]]:
+    reader = Reader(payload)
+    image = reader.take(reader.unpack("I")[0])
+    (count,) = reader.unpack("H")
+    return image, [f32_to_floats(reader.take(VECTOR.size)) for _ in range(count)]
+
+
+def pack_compare_response(status: int, face_count: int, distances: Sequence[float]) -> bytes:
+    return struct.pack(f"!BBH{len(distances)}f", status, face_count, len(distances), *distances)
+
+
+def unpack_compare_response(payload: bytes) -> CompareResult:
+    reader = Reader(payload)
+    status, face_count, count = reader.unpack("BBH")
+    return CompareResult(status=status, face_count=face_count, distances=list(reader.unpack(f"{count}f")))
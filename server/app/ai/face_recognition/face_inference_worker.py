@@ -0,0 +1,214 @@
+"""
+    Date Written: 10/20/2026 at 12:10 AM
+
+    Face inference worker: a standalone process owning the face stack
+    (dlib models, cv2, numpy), serving ENCODE / COMPARE jobs of the API
+    workers over a Unix socket (see face_inference_protocol).
+        - asyncio front: reads the pipelined frames of every connection
+        - micro-batching: images of concurrent requests (any connection)
+          are grouped for a few ms (--batch-wait-ms) or up to --batch-size
+          and detected / encoded in one pool job
+        - process pool: runs the CPU work, each process loads the models
+          once and can be pinned to CPUs (--cpus), scaled with --processes
+          independently of the API workers
+
+    Run next to the API (FACE_INFERENCE_SOCKET=/run/mis/face.sock there):
+        python -m app.ai.face_recognition.face_inference_worker \\
+            --socket /run/mis/face.sock --processes 2 --cpus 2,3 --batch-size 8 --batch-wait-ms 5
+"""
+
+import argparse
+import asyncio
+import os
+import signal
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Set, Tuple
+
+from app.ai.face_recognition.face_inference_protocol import *
+from app.utils.micro_batcher import MicroBatcher
+
+DEFAULT_IMAGE_SIZE = (600, 600)
+
+
+# ============================================
+# POOL PROCESSES (face stack loaded here only)
+# ============================================
+def _init_process(cpus: Optional[Set[int]]) -> None:
+    if cpus:
+        os.sched_setaffinity(0, cpus)
+    # load the models before the first job
+    from app.ai.face_recognition import face_engine  # noqa: F401
+
+
+def _encode_batch(images: List[bytes], image_size: Tuple[int, int], model: str) -> List[tuple]:
+    from app.ai.face_recognition.face_engine import encode_images
+
+    # plain ints / floats back to the front, it never loads numpy
+    return [
+        (status, [(tuple(int(v) for v in location), encoding.tolist()) for location, encoding in faces])
+        for status, faces in encode_images(images, image_size, model)
+    ]
+
+
+def _compare_batch(items: List[tuple], image_size: Tuple[int, int], model: str) -> List[tuple]:
+    from app.ai.face_recognition.face_engine import compare_images
+
+    return compare_images(items, image_size, model)
+
+
+# ============================================
+# ASYNCIO FRONT
+# ============================================
+class FaceInferenceWorker:
+    def __init__(
+        self,
+        socket_path: str,
+        processes: int = 1,
+        cpus: Optional[Set[int]] = None,
+        image_size: Tuple[int, int] = DEFAULT_IMAGE_SIZE,
+        model: str = "hog",
+        batch_size: int = 8,
+        batch_wait: float = 0.005,
+    ):
+        self.socket_path = socket_path
+        self.processes = processes
+        self.cpus = cpus
+        self.image_size = image_size
+        self.model = model
+        self._pool: Optional[ProcessPoolExecutor] = None
+        # one batch per pool process at a time, the others wait and grow
+        self._encode_batcher = MicroBatcher(self._in_pool(_encode_batch), batch_size, batch_wait, processes)
+        self._compare_batcher = MicroBatcher(self._in_pool(_compare_batch), batch_size, batch_wait, processes)
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._connections: Set[asyncio.StreamWriter] = set()
+        self._handlers: Set[asyncio.Task] = set()
+        self.jobs_done = 0
+
+
+    async def start(self) -> None:
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.processes, initializer=_init_process, initargs=(self.cpus,)
+        )
+        # a stale socket file of a previous run
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+        self._server = await asyncio.start_unix_server(self._serve_connection, path=self.socket_path)
+        os.chmod(self.socket_path, 0o660)
+        print(f"face inference worker on {self.socket_path}, {self.processes} process(es)")
+
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            # open connections end their read loop on EOF
+            for writer in list(self._connections):
+                writer.close()
+            await asyncio.gather(*list(self._handlers), return_exceptions=True)
+            await self._server.wait_closed()
+            self._server = None
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+
+    def _in_pool(self, batch_job):
+        async def run(items: list) -> list:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._pool, batch_job, items, self.image_size, self.model
+            )
+        return run
+
+
+    async def _serve_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        write_lock = asyncio.Lock()
+        pending: Set[asyncio.Task] = set()
+        self._connections.add(writer)
+        self._handlers.add(asyncio.current_task())
+        try:
+            while True:
+                try:
+                    request_id, op, length = HEADER.unpack(await reader.readexactly(HEADER.size))
+                except asyncio.IncompleteReadError:
+                    break
+                if length > MAX_PAYLOAD:
+                    # the stream can not be resynchronized, drop the client
+                    break
+                payload = await reader.readexactly(length)
+
+                task = asyncio.create_task(self._run_job(request_id, op, payload, writer, write_lock))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+        finally:
+            for task in pending:
+                task.cancel()
+            writer.close()
+            self._connections.discard(writer)
+            self._handlers.discard(asyncio.current_task())
+
+
+    async def _run_job(
+        self, request_id: int, op: int, payload: bytes, writer: asyncio.StreamWriter, write_lock: asyncio.Lock
+    ) -> None:
+        try:
+            if op == OP_ENCODE:
+                results = await asyncio.gather(
+                    *(self._encode_batcher.submit(image) for image in unpack_encode_request(payload))
+                )
+                result = pack_encode_response(results)
+            elif op == OP_COMPARE:
+                result = pack_compare_response(*await self._compare_batcher.submit(unpack_compare_request(payload)))
+            else:
+                raise ProtocolError(f"unknown op {op}")
+            response = frame(request_id, STATUS_OK, result)
+            self.jobs_done += 1
+        except Exception as e:
+            response = frame(request_id, STATUS_ERROR, f"{type(e).__name__}: {e}".encode())
+
+        async with write_lock:
+            writer.write(response)
+            await writer.drain()
+
+
+def parse_cpus(value: str) -> Set[int]:
+    """'2,3' or '0-3'."""
+    cpus = set()
+    for part in value.split(","):
+        start, _, end = part.partition("-")
+        cpus.update(range(int(start), int(end or start) + 1))
+    return cpus
+
+
+async def main(args) -> None:
+    worker = FaceInferenceWorker(
+        socket_path=args.socket,
+        processes=args.processes,
+        cpus=parse_cpus(args.cpus) if args.cpus else None,
+        image_size=(args.image_size, args.image_size),
+        model=args.model,
+        batch_size=args.batch_size,
+        batch_wait=args.batch_wait_ms / 1000,
+    )
+    stopped = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stopped.set)
+
+    await worker.start()
+    try:
+        await stopped.wait()
+    finally:
+        await worker.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--socket", required=True)
+    parser.add_argument("--processes", type=int, default=1)
+    parser.add_argument("--cpus", help="CPUs of the pool processes, e.g. 2,3 or 2-5")
+    parser.add_argument("--image-size", type=int, default=DEFAULT_IMAGE_SIZE[0])
+    parser.add_argument("--model", choices=["hog", "cnn"], default="hog")
+    parser.add_argument("--batch-size", type=int, default=8, help="1 for no batching")
+    parser.add_argument("--batch-wait-ms", type=float, default=5)
+    asyncio.run(main(parser.parse_args()))
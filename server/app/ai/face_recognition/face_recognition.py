@@ -1,24 +1,79 @@
 """
     Date written: 12/20/2025 at 7:11 AM
+    
+    face_recognition (dlib and its models), numpy and cv2 are imported on
+    first use, workers that never serve face traffic never load them
+    (see load_face_stack, FACE_RECOGNITION_PRELOAD). With FACE_INFERENCE_SOCKET
+    set the work runs in the face inference worker and the API workers never
+    load them.
 """
 
 import os
+import time
 import uuid
-import face_recognition
-import numpy as np
-import cv2
 import base64
-from typing import List, Optional, Dict
+import asyncio
+import binascii
+import importlib
+from typing import List, Optional, Dict, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.models.face_recognitions.face_encoding import FaceEncoding
 from app.configs.settings import settings
 from app.repository.face_recognition_repository import FaceRecognitionRepository
+from app.ai.face_recognition.face_inference_client import face_inference_client, float64_encoding
+from app.ai.face_recognition.face_inference_protocol import IMAGE_OK
+from app.utils.micro_batcher import MicroBatcher
+from app.utils.metrics import face_request_duration, face_verifications
+
+FACE_STACK_MODULES = ("numpy", "cv2", "face_recognition", "app.ai.face_recognition.face_engine")
+IMAGE_SIZE = (600, 600)
+
+
+def load_face_stack() -> None:
+    """
+        Import the face stack now (slow, seconds: dlib loads its models).
+        Called in a thread at startup by pods serving face traffic, the first
+        request then does not pay for it.
+    """
+    for module in FACE_STACK_MODULES:
+        importlib.import_module(module)
+
+
+# imported in the worker thread, not on the event loop: the first import takes seconds
+def _encode_images(images: List[bytes]) -> List[Tuple]:
+    from app.ai.face_recognition import face_engine
+    return face_engine.encode_images(images, IMAGE_SIZE, settings.FACE_DETECTION_MODEL)
+
+
+def _compare_images(items: List[Tuple]) -> List[Tuple]:
+    from app.ai.face_recognition import face_engine
+    return face_engine.compare_images(items, IMAGE_SIZE, settings.FACE_DETECTION_MODEL)
+
+
+async def _encode_batch(images: List[bytes]) -> List[Tuple]:
+    return await asyncio.to_thread(_encode_images, images)
+
+
+async def _compare_batch(items: List[Tuple]) -> List[Tuple]:
+    return await asyncio.to_thread(_compare_images, items)
+
+
+# concurrent requests of this worker (e.g. a class verifying at exam start) encoded together
+face_encode_batcher = MicroBatcher(
+    _encode_batch, settings.FACE_BATCH_MAX_SIZE, settings.FACE_BATCH_MAX_WAIT_MS / 1000,
+    settings.FACE_BATCH_MAX_CONCURRENCY
+)
+face_compare_batcher = MicroBatcher(
+    _compare_batch, settings.FACE_BATCH_MAX_SIZE, settings.FACE_BATCH_MAX_WAIT_MS / 1000,
+    settings.FACE_BATCH_MAX_CONCURRENCY
+)
+
 
 class FaceRecognitionAI:
     """
         AI/Service for face encoding and verification.
-        Uses face_recognition library (dlib + OpenCV).
+        Uses face_recognition library (dlib + OpenCV), see face_engine.
     """
     
     def __init__(self, db: AsyncSession):
@@ -28,7 +83,7 @@ class FaceRecognitionAI:
         # Configuration
         self.TOLERANCE = 0.6  # Lower = stricter (0.6 is default)
         self.MIN_FACE_SIZE = 100  # Minimum face dimension in pixels
-        self.IMAGE_SIZE = (600, 600)  # Resize large images for performance
+        self.IMAGE_SIZE = IMAGE_SIZE  # Resize large images for performance
     
     
     # ============================================
@@ -56,33 +111,29 @@ class FaceRecognitionAI:
                     "message": "Face registered successfully"
                 }
         """
+        # Detect and encode faces (in-process or face inference worker)
+        image_ok, faces = await self._encode_image(self._decode_base64(image_base64))
         
-        # Decode base64 to numpy array
-        image_array = self._decode_base64_image(image_base64)
-        
-        if image_array is None:
+        if not image_ok:
             return {
                 "success": False,
                 "message": "Invalid image format"
             }
         
-        # Detect face locations
-        face_locations = face_recognition.face_locations(image_array)
-        
-        if len(face_locations) == 0:
+        if len(faces) == 0:
             return {
                 "success": False,
                 "message": "No face detected. Please ensure your face is clearly visible."
             }
         
-        if len(face_locations) > 1:
+        if len(faces) > 1:
             return {
                 "success": False,
                 "message": "Multiple faces detected. Please ensure only your face is visible."
             }
         
         # Check face size (quality control)
-        top, right, bottom, left = face_locations[0]
+        (top, right, bottom, left), encoding = faces[0]  # First (and only) face
         face_width = right - left
         face_height = bottom - top
         
@@ -92,17 +143,6 @@ class FaceRecognitionAI:
                 "message": f"Face too small. Please move closer to the camera."
             }
         
-        # Generate encoding
-        encodings = face_recognition.face_encodings(image_array, face_locations)
-        
-        if len(encodings) == 0:
-            return {
-                "success": False,
-                "message": "Could not generate face encoding. Please try again with better lighting."
-            }
-        
-        encoding = encodings[0]  # First (and only) face
-        
         # Calculate quality score (based on face size and clarity)
         quality_score = self._calculate_quality_score(face_width, face_height)
         
@@ -149,68 +189,56 @@ class FaceRecognitionAI:
                 "message": "Face verified"
             }
         """
-        
         # Get user's stored encodings
         stored_encodings = await self.face_recognition_repo.get_all_user_encodings(user_id)
         
         if not stored_encodings:
+            face_verifications.labels("not_registered").inc()
             return {
                 "verified": False,
                 "message": "No face registered. Please register your face first."
             }
         
-        # Decode captured image
-        image_array = self._decode_base64_image(image_base64)
+        # Detect, encode and compare the captured face with ALL stored encodings (if multiple angles)
+        image_ok, face_count, distances = await self._compare_image(
+            self._decode_base64(image_base64), stored_encodings
+        )
         
-        if image_array is None:
+        if not image_ok:
+            face_verifications.labels("invalid_image").inc()
             return {
                 "verified": False,
                 "message": "Invalid image format"
             }
         
-        # Detect face in captured image
-        face_locations = face_recognition.face_locations(image_array)
-        
-        if len(face_locations) == 0:
+        if face_count == 0:
+            face_verifications.labels("no_face").inc()
             return {
                 "verified": False,
                 "message": "No face detected. Please ensure your face is clearly visible."
             }
         
-        if len(face_locations) > 1:
+        if face_count > 1:
+            face_verifications.labels("multiple_faces").inc()
             return {
                 "verified": False,
                 "message": "Multiple faces detected. Please ensure only your face is visible."
             }
         
-        # Generate encoding for captured face
-        current_encodings = face_recognition.face_encodings(image_array, face_locations)
-        
-        if len(current_encodings) == 0:
+        if len(distances) == 0:
+            face_verifications.labels("not_encoded").inc()
             return {
                 "verified": False,
                 "message": "Could not process face. Please try again with better lighting."
             }
         
-        current_encoding = current_encodings[0]
-        
-        # Compare with ALL stored encodings (if multiple angles)
-        best_match = None
-        best_distance = float('inf')
-        
-        for stored in stored_encodings:
-            stored_array = stored.get_encoding_array()
-            
-            # Calculate face distance (lower = more similar)
-            distance = face_recognition.face_distance([stored_array], current_encoding)[0]
-            
-            if distance < best_distance:
-                best_distance = distance
-                best_match = stored
+        # Face distance (lower = more similar)
+        best_distance, best_match = min(zip(distances, stored_encodings), key=lambda pair: pair[0])
         
         # Determine if verified
         verified = best_distance <= self.TOLERANCE
         confidence = 1.0 - best_distance  # Convert distance to confidence
+        face_verifications.labels("verified" if verified else "rejected").inc()
         
         if verified:
             return {
@@ -232,49 +260,64 @@ class FaceRecognitionAI:
     # ============================================
     # HELPER METHODS
     # ============================================
-    def _decode_base64_image(self, base64_string: str) -> Optional[np.ndarray]:
+    def _decode_base64(self, base64_string: str) -> Optional[bytes]:
         """
-            Convert base64 string to numpy array (BGR format).
-            
-            Line-by-line explanation:
-            1. Remove data URL prefix if present (e.g., "data:image/jpeg;base64,")
-            2. Decode base64 to bytes
-            3. Convert bytes to numpy array
-            4. Decode image using OpenCV (JPEG/PNG → BGR)
-            5. Convert BGR to RGB (face_recognition expects RGB)
+            Image file bytes of a base64 string, None if it is not base64.
+            Removes the data URL prefix if present (e.g., "data:image/jpeg;base64,").
         """
         try:
             # Remove data URL prefix
             if ',' in base64_string:
                 base64_string = base64_string.split(',')[1]
             
-            # Decode base64 to bytes
-            image_bytes = base64.b64decode(base64_string)
-            
-            # Convert bytes to numpy array
-            nparr = np.frombuffer(image_bytes, np.uint8)
-            
-            # Decode image (JPEG/PNG → BGR)
-            image_bgr = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
-            
-            if image_bgr is None:
-                return None
-            
-            # Resize if too large (performance optimization)
-            height, width = image_bgr.shape[:2]
-            if width > self.IMAGE_SIZE[0] or height > self.IMAGE_SIZE[1]:
-                image_bgr = cv2.resize(image_bgr, self.IMAGE_SIZE)
-            
-            # Convert BGR to RGB (face_recognition expects RGB)
-            image_rgb = cv2.cvtColor(image_bgr, cv2.COLOR_BGR2RGB)
-            
-            return image_rgb
-            
-        except Exception as e:
+            return base64.b64decode(base64_string)
+        
+        except (binascii.Error, ValueError) as e:
             print(f"Error decoding image: {e}")
             return None
     
     
+    async def _encode_image(self, image_bytes: Optional[bytes]) -> Tuple[bool, List[Tuple]]:
+        """
+            (image decoded, [(location, encoding)] of every face found).
+            Face inference worker when configured, else in-process (micro-batched, in a thread).
+        """
+        if image_bytes is None:
+            return False, []
+        
+        started = time.perf_counter()
+        if face_inference_client is not None:
+            result = (await face_inference_client.encode([image_bytes]))[0]
+            face_request_duration.labels("encode", "worker").observe(time.perf_counter() - started)
+            return result.status == IMAGE_OK, [(face.location, face.encoding) for face in result.faces]
+        
+        status, faces = await face_encode_batcher.submit(image_bytes)
+        face_request_duration.labels("encode", "in_process").observe(time.perf_counter() - started)
+        return status == IMAGE_OK, faces
+    
+    
+    async def _compare_image(
+        self, image_bytes: Optional[bytes], stored_encodings: List[FaceEncoding]
+    ) -> Tuple[bool, int, List[float]]:
+        """(image decoded, face count, distance to every stored encoding when exactly one face)."""
+        if image_bytes is None:
+            return False, 0, []
+        
+        started = time.perf_counter()
+        if face_inference_client is not None:
+            result = await face_inference_client.compare(
+                image_bytes, [float64_encoding(stored.encoding) for stored in stored_encodings]
+            )
+            face_request_duration.labels("compare", "worker").observe(time.perf_counter() - started)
+            return result.status == IMAGE_OK, result.face_count, result.distances
+        
+        status, face_count, distances = await face_compare_batcher.submit(
+            (image_bytes, [stored.get_encoding_array() for stored in stored_encodings])
+        )
+        face_request_duration.labels("compare", "in_process").observe(time.perf_counter() - started)
+        return status == IMAGE_OK, face_count, distances
+    
+    
     def _calculate_quality_score(self, face_width: int, face_height: int) -> float:
         """
             Calculate quality score based on face size.
@@ -2,18 +2,22 @@
     Date Written: 12/22/2025 at 4:32 PM
 """
 
-from typing import List
-from fastapi import APIRouter, Depends
+from typing import Dict, List
+from fastapi import APIRouter, Depends, File, Query, UploadFile
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.middleware.role_checker import role_required
+from app.middleware.conditional_get import conditional_get
 from app.models.enums.user_state import UserRole
 from app.models.users.registrar import Registrar
 from app.schemas.academic_structure_schema import *
 from app.db.db_session import get_async_db
 from app.middleware.current_user import get_current_user
 from app.services.academic_structure_service import AcademicStructureService
+from app.services.timetable_solver_service import timetable_solver_jobs
+from app.services.reference_data_cache import reference_data_cache
+from app.utils.json_response import ModelListResponse
 
 
 academic_structure_router = APIRouter(
@@ -43,11 +47,15 @@ async def register_building(
     
 @academic_structure_router.get("/list-buildings", response_model=List[BuildingResponseSchema])
 async def list_buildings(
+    envelope: bool = Query(default=False, description="One request log per response: {request_log, items}"),
     db: AsyncSession = Depends(get_async_db),
-    allowed_roles = Depends(role_required([UserRole.ADMINISTRATOR]))
+    allowed_roles = Depends(role_required([UserRole.ADMINISTRATOR])),
+    cache_headers = Depends(conditional_get(["building"], max_age=60))
 ):
     service = AcademicStructureService(db)
-    return await service.list_buildings()
+    return ModelListResponse(
+        await service.list_buildings(), BuildingResponseSchema, headers=cache_headers, envelope=envelope
+    )
     
     
 @academic_structure_router.post("/register-room", response_model=List[RoomResponseSchema])
@@ -73,11 +81,16 @@ async def register_room(
 @academic_structure_router.get("/list-rooms/building/{building_id}", response_model=List[RoomResponseSchema])
 async def list_rooms_by_building(
     building_id: str,
+    envelope: bool = Query(default=False, description="One request log per response: {request_log, items}"),
     db: AsyncSession = Depends(get_async_db),
-    allowed_roles = Depends(role_required([UserRole.ADMINISTRATOR]))
+    allowed_roles = Depends(role_required([UserRole.ADMINISTRATOR])),
+    cache_headers = Depends(conditional_get(["room", "building"], max_age=60))
 ):
     service = AcademicStructureService(db)
-    return await service.list_rooms_by_building(building_id)
+    return ModelListResponse(
+        await service.list_rooms_by_building(building_id), RoomResponseSchema, headers=cache_headers,
+        envelope=envelope
+    )
 
 
 @academic_structure_router.post("/register-department", response_model=DepartmentResponseSchema)
@@ -155,7 +168,8 @@ async def register_program(
 async def list_programs_by_department(
     department_id: str,
     db: AsyncSession = Depends(get_async_db),
-    allowed_roles = Depends(role_required([UserRole.REGISTRAR, UserRole.DEAN]))
+    allowed_roles = Depends(role_required([UserRole.REGISTRAR, UserRole.DEAN])),
+    cache_headers = Depends(conditional_get(["program", "department"], max_age=60))
 ):
     service = AcademicStructureService(db)
     return await service.list_programs_by_department(department_id)
@@ -185,7 +199,8 @@ async def register_curriculum(
 async def list_curriculums_by_program(
     program_id: str,
     db: AsyncSession = Depends(get_async_db),
-    allowed_roles = Depends(role_required([UserRole.REGISTRAR, UserRole.DEAN]))
+    allowed_roles = Depends(role_required([UserRole.REGISTRAR, UserRole.DEAN])),
+    cache_headers = Depends(conditional_get(["curriculum", "program", "department"], max_age=60))
 ):
     service = AcademicStructureService(db)
     return await service.list_curriculums_by_program(program_id)
@@ -232,7 +247,8 @@ async def register_course(
 @academic_structure_router.get("/list-courses", response_model=List[CourseResponseSchema])    
 async def list_courses(
     db: AsyncSession = Depends(get_async_db),
-    allowed_roles = Depends(role_required([UserRole.REGISTRAR, UserRole.DEAN, UserRole.PROGRAM_CHAIR]))
+    allowed_roles = Depends(role_required([UserRole.REGISTRAR, UserRole.DEAN, UserRole.PROGRAM_CHAIR])),
+    cache_headers = Depends(conditional_get(["course"], max_age=60))
 ):
     service = AcademicStructureService(db)
     return await service.list_courses()
@@ -480,3 +496,174 @@ async def list_class_schedule_by_section(
     return await service.list_class_schedule_by_section(
         class_section_id
     )
+
+
+@academic_structure_router.get(
+    "/list-schedule-conflicts/term/{term_id}",
+    response_model=List[ScheduleConflictResponseSchema]
+)
+async def list_term_schedule_conflicts(
+    term_id: str,
+    db: AsyncSession = Depends(get_async_db),
+    allowed_roles = Depends(role_required([UserRole.REGISTRAR, UserRole.DEAN, UserRole.PROGRAM_CHAIR]))
+):
+    """
+        List every room, professor and class section schedule conflict of the term.
+    """
+    service = AcademicStructureService(db)
+    return await service.list_term_schedule_conflicts(term_id)
+
+
+@academic_structure_router.post(
+    "/import/schedules/term/{term_id}",
+    response_model=ScheduleImportResponseSchema
+)
+async def import_term_schedules(
+    term_id: str,
+    schedule_import: ScheduleImportRequestSchema,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Registrar = Depends(get_current_user),
+    allowed_roles = Depends(role_required([UserRole.REGISTRAR, UserRole.DEAN, UserRole.PROGRAM_CHAIR]))
+):
+    """
+        Bulk import of the term timetable.
+        Every row is validated like a single schedule assignment and checked for
+        room, professor and class section conflicts against the other rows and
+        the stored schedules of the term. Valid rows are inserted in one transaction,
+        the rest are reported per row with their conflicts.
+    """
+    service = AcademicStructureService(db)
+    return await service.import_term_schedules(
+        term_id=term_id,
+        schedules=schedule_import.schedules,
+        requested_by=current_user.first_name + " " + current_user.last_name
+    )
+
+
+@academic_structure_router.post(
+    "/import/schedules/term/{term_id}/csv",
+    response_model=ScheduleImportResponseSchema
+)
+async def import_term_schedule_csv(
+    term_id: str,
+    file: UploadFile = File(...),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Registrar = Depends(get_current_user),
+    allowed_roles = Depends(role_required([UserRole.REGISTRAR, UserRole.DEAN, UserRole.PROGRAM_CHAIR]))
+):
+    """
+        Bulk import of the term timetable from a CSV file with the columns
+        class_section_id, room_id, day_of_week, start_time, end_time.
+    """
+    service = AcademicStructureService(db)
+    return await service.import_term_schedule_csv(
+        term_id=term_id,
+        content=await file.read(),
+        requested_by=current_user.first_name + " " + current_user.last_name
+    )
+
+
+@academic_structure_router.post(
+    "/solver/timetable/term/{term_id}",
+    response_model=TimetableSolverJobResponseSchema,
+    status_code=202
+)
+async def solve_term_timetable(
+    term_id: str,
+    solver_request: TimetableSolverRequestSchema,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Registrar = Depends(get_current_user),
+    allowed_roles = Depends(role_required([UserRole.REGISTRAR, UserRole.DEAN, UserRole.PROGRAM_CHAIR]))
+):
+    """
+        Start a background timetable solver job for the unscheduled class sections of the term.
+        Assigns day, time and room to every weekly meeting without room, professor
+        or class section conflicts, within the time budget.
+        Poll /solver/timetable/job/{job_id} for progress and the proposed schedule.
+        One running job per term across all workers.
+    """
+    requested_by = current_user.first_name + " " + current_user.last_name
+    job = await timetable_solver_jobs.submit(
+        db=db,
+        term_id=term_id,
+        request=solver_request,
+        requested_by=requested_by,
+        requested_by_id=current_user.id
+    )
+    return timetable_solver_jobs.format_job_response(job, requested_by=requested_by)
+
+
+@academic_structure_router.get(
+    "/solver/timetable/job/{job_id}",
+    response_model=TimetableSolverJobResponseSchema
+)
+async def get_timetable_solver_job(
+    job_id: str,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Registrar = Depends(get_current_user),
+    allowed_roles = Depends(role_required([UserRole.REGISTRAR, UserRole.DEAN, UserRole.PROGRAM_CHAIR]))
+):
+    """
+        Read the progress of a timetable solver job and its proposed schedule once DONE.
+        Jobs are stored in the database, any worker answers (progress is saved
+        with every solver heartbeat).
+    """
+    job = await timetable_solver_jobs.get_job(db, job_id)
+    return timetable_solver_jobs.format_job_response(
+        job, requested_by=current_user.first_name + " " + current_user.last_name
+    )
+
+
+@academic_structure_router.post(
+    "/solver/timetable/job/{job_id}/cancel",
+    response_model=TimetableSolverJobResponseSchema
+)
+async def cancel_timetable_solver_job(
+    job_id: str,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Registrar = Depends(get_current_user),
+    allowed_roles = Depends(role_required([UserRole.REGISTRAR, UserRole.DEAN, UserRole.PROGRAM_CHAIR]))
+):
+    """
+        Cancel a queued or running timetable solver job, from any worker.
+        The worker running the job stops the solver at its next heartbeat.
+    """
+    job = await timetable_solver_jobs.cancel(db, job_id)
+    return timetable_solver_jobs.format_job_response(
+        job, requested_by=current_user.first_name + " " + current_user.last_name
+    )
+
+
+@academic_structure_router.post(
+    "/solver/timetable/job/{job_id}/commit",
+    response_model=ScheduleImportResponseSchema
+)
+async def commit_timetable_solver_job(
+    job_id: str,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Registrar = Depends(get_current_user),
+    allowed_roles = Depends(role_required([UserRole.REGISTRAR, UserRole.DEAN, UserRole.PROGRAM_CHAIR]))
+):
+    """
+        Commit the reviewed proposal of a finished solver job to the term timetable.
+        The proposal goes through the bulk timetable import, rows conflicting with
+        schedules stored since the proposal was made are rejected and reported.
+    """
+    return await timetable_solver_jobs.commit(
+        db=db,
+        job_id=job_id,
+        requested_by=current_user.first_name + " " + current_user.last_name
+    )
+
+
+@academic_structure_router.get(
+    "/reference-cache/metrics",
+    response_model=Dict[str, ReferenceCacheTableMetricsSchema]
+)
+async def get_reference_cache_metrics(
+    allowed_roles = Depends(role_required([UserRole.ADMINISTRATOR, UserRole.REGISTRAR]))
+):
+    """
+        Size and hit rate of every table of the reference data cache (this worker only).
+    """
+    return reference_data_cache.metrics()
@@ -0,0 +1,42 @@
+"""
+    Date Written: 10/20/2026 at 3:00 AM
+"""
+
+from typing import List
+
+from fastapi import APIRouter, Depends, Query
+
+from app.db.slow_query_log import slow_query_log
+from app.middleware.role_checker import role_required
+from app.models.enums.user_state import UserRole
+from app.schemas.diagnostics_schema import SlowQueryResponseSchema
+
+
+diagnostics_router = APIRouter(
+    prefix="/api/diagnostics",
+    tags=["API's for performance diagnostics"]
+)
+
+
+@diagnostics_router.get("/slow-queries", response_model=List[SlowQueryResponseSchema])
+async def list_slow_queries(
+    limit: int = Query(50, ge=1, le=1000),
+    allowed_roles = Depends(role_required([UserRole.ADMINISTRATOR]))
+):
+    """
+        Latest statements over SLOW_QUERY_THRESHOLD_MS (this worker only), newest
+        first, with the calling repository method, the route and, for a sample,
+        the EXPLAIN plan.
+    """
+    return slow_query_log.entries(limit)
+
+
+@diagnostics_router.delete("/slow-queries")
+async def clear_slow_queries(
+    allowed_roles = Depends(role_required([UserRole.ADMINISTRATOR]))
+):
+    """
+        Empty the slow query log of this worker (e.g. after deploying a fix).
+    """
+    slow_query_log.clear()
+    return {"message": "Slow query log cleared."}
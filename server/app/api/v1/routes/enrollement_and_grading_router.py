@@ -3,7 +3,7 @@
 """
 
 from typing import List
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -15,8 +15,12 @@ from app.schemas.enrollments_and_gradings_schema import *
 from app.db.db_session import get_async_db
 from app.middleware.current_user import get_current_user
 from app.services.enrollment_grading_service import EnrollmentGradingService
+from app.services.enrollment_admission_queue import enrollment_admission_queue
+from app.configs.settings import settings
+from app.exceptions.customed_exception import ForbiddenAccessException
 from app.models.users.student import Student
 from app.models.users.base_user import BaseUser
+from app.utils.json_response import ModelListResponse
 
 enrollment_grading_router = APIRouter(
     prefix="/api/enrollment",
@@ -43,6 +47,23 @@ async def get_allowed_section(
     )
 
 
+@enrollment_grading_router.get("/allowed-sections/fitting", response_model=List[AllowedEnrollSectionResponseSchema])
+async def get_fitting_allowed_section(
+    current_user: Student = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    allowed_roles = Depends(role_required([UserRole.REGISTRAR, UserRole.DEAN, UserRole.PROGRAM_CHAIR, UserRole.STUDENT]))
+):
+    """
+        Read the allowed sections to enroll that fit the student's current timetable
+        (no schedule clash with the sections already enrolled in the same term).
+    """
+    service = EnrollmentGradingService(db)
+    return await service.get_student_fitting_sections(
+        student_id=current_user.id,
+        requested_by=current_user.first_name + " " + current_user.last_name
+    )
+
+
 @enrollment_grading_router.post(
     "/student/{student_id}/class_section/{class_section_id}", 
     response_model=EnrollmentResponseSchema
@@ -76,8 +97,97 @@ async def enroll_student_class_section(
     )
 
 
+@enrollment_grading_router.post(
+    "/student/{student_id}/batch",
+    response_model=BatchEnrollmentResponseSchema
+)
+async def enroll_student_class_sections_batch(
+    student_id: str,
+    request: BatchEnrollmentRequestSchema,
+    current_user: Student = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    allowed_roles = Depends(role_required([
+        UserRole.REGISTRAR, UserRole.DEAN,
+        UserRole.PROGRAM_CHAIR, UserRole.STUDENT
+    ]))
+):
+    """
+        Student batch enrollment (many class sections in one request).
+        Validations (per section):
+            Same validations as the single enrollment
+            No schedule collision among the requested sections
+            and the student's current sections of the same term
+        Returns a per section report, the valid sections are enrolled
+        in one transaction.
+    """
+    service = EnrollmentGradingService(db)
+    return await service.enroll_student_class_sections_batch(
+        student_id=student_id,
+        class_section_ids=request.class_section_ids,
+        requested_by=current_user.first_name + " " + current_user.last_name
+    )
+
+
+@enrollment_grading_router.post(
+    "/queue/student/{student_id}/class_section/{class_section_id}",
+    response_model=EnrollmentTicketResponseSchema,
+    status_code=202
+)
+async def queue_student_class_section_enrollment(
+    student_id: str,
+    class_section_id: str,
+    current_user: Student = Depends(get_current_user),
+    allowed_roles = Depends(role_required([
+        UserRole.REGISTRAR, UserRole.DEAN,
+        UserRole.PROGRAM_CHAIR, UserRole.STUDENT
+    ]))
+):
+    """
+        Queued student enrollment (for enrollment rush hours).
+            Returns a ticket right away, the enrollment itself runs in the
+            admission queue with the same validations as the direct endpoint.
+            Poll /queue/ticket/{ticket_id} for the outcome.
+    """
+    requested_by = current_user.first_name + " " + current_user.last_name
+    ticket = enrollment_admission_queue.submit(
+        student_id=student_id,
+        class_section_id=class_section_id,
+        requested_by=requested_by,
+        requested_by_id=current_user.id
+    )
+    return enrollment_admission_queue.format_ticket_response(ticket, requested_by=requested_by)
+
+
+@enrollment_grading_router.get("/queue/ticket/{ticket_id}", response_model=EnrollmentTicketResponseSchema)
+async def get_enrollment_ticket(
+    ticket_id: str,
+    wait: int = Query(default=0, ge=0, description="Long-poll seconds to wait for the outcome"),
+    current_user: Student = Depends(get_current_user),
+    allowed_roles = Depends(role_required([
+        UserRole.REGISTRAR, UserRole.DEAN,
+        UserRole.PROGRAM_CHAIR, UserRole.STUDENT
+    ]))
+):
+    """
+        Read the status of a queued enrollment.
+            Only the user who submitted the ticket can read it.
+    """
+    ticket = enrollment_admission_queue.get_ticket(ticket_id)
+    if ticket.requested_by_id != current_user.id:
+        raise ForbiddenAccessException("You can only read your own enrollment tickets.")
+
+    ticket = await enrollment_admission_queue.wait_ticket(
+        ticket_id=ticket_id,
+        timeout=min(wait, settings.ENROLLMENT_QUEUE_MAX_WAIT_SECONDS)
+    )
+    return enrollment_admission_queue.format_ticket_response(
+        ticket, requested_by=current_user.first_name + " " + current_user.last_name
+    )
+
+
 @enrollment_grading_router.get("/get-enrollments", response_model=List[EnrollmentResponseSchema])
 async def get_all_enrollments(
+    envelope: bool = Query(default=False, description="One request log per response: {request_log, items}"),
     db: AsyncSession = Depends(get_async_db),
     allowed_roles = Depends(role_required([UserRole.REGISTRAR, UserRole.DEAN, UserRole.PROGRAM_CHAIR]))
 ):
@@ -85,7 +195,7 @@ async def get_all_enrollments(
         Read all student enrollment (Registrar role only)
     """
     service = EnrollmentGradingService(db)
-    return await service.get_all_enrollments()
+    return ModelListResponse(await service.get_all_enrollments(), EnrollmentResponseSchema, envelope=envelope)
 
 
 @enrollment_grading_router.get("/get-term/{term_id}/program/{program_id}", response_model=SemesterTermResponseSchema)
@@ -116,6 +226,7 @@ async def get_filter_enrollments(
     program_id: str = None,
     class_section_id: str = None,
     term_id: str = None,
+    envelope: bool = Query(default=False, description="One request log per response: {request_log, items}"),
     db: AsyncSession = Depends(get_async_db),
     allowed_roles = Depends(role_required([UserRole.REGISTRAR]))
 ):
@@ -123,12 +234,13 @@ async def get_filter_enrollments(
         Read all student enrollment (Registrar role only)
     """
     service = EnrollmentGradingService(db)
-    return await service.get_filtered_enrollments(
+    enrollments = await service.get_filtered_enrollments(
         department_id=department_id,
         program_id=program_id,
         class_section_id=class_section_id,
         term_id=term_id
     )
+    return ModelListResponse(enrollments, EnrollmentResponseSchema, envelope=envelope)
 
 
 @enrollment_grading_router.patch("/update/status", response_model=List[EnrollmentResponseSchema])
@@ -0,0 +1,31 @@
+"""
+    Date Written: 10/20/2026 at 2:20 AM
+"""
+
+import asyncio
+import hmac
+from typing import Optional
+
+from fastapi import APIRouter, Header, Response
+
+from app.configs.settings import settings
+from app.exceptions.customed_exception import UnauthorizedAccessException
+from app.utils.metrics import CONTENT_TYPE_LATEST, metrics_payload
+
+metrics_router = APIRouter(
+  tags=["Monitoring"]
+)
+
+
+# public for FilterJWT (the scraper has no user), guarded by METRICS_SCRAPE_TOKEN when set
+@metrics_router.get("/metrics", include_in_schema=False)
+async def metrics(authorization: Optional[str] = Header(default=None)):
+    scrape_token = settings.METRICS_SCRAPE_TOKEN
+    if scrape_token is not None and not hmac.compare_digest(
+        (authorization or "").encode(), f"Bearer {scrape_token.get_secret_value()}".encode()
+    ):
+        raise UnauthorizedAccessException("Invalid metrics scrape token.")
+
+    # multiprocess mode reads the files of every worker
+    payload = await asyncio.to_thread(metrics_payload)
+    return Response(content=payload, media_type=CONTENT_TYPE_LATEST)
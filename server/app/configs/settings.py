@@ -1,4 +1,4 @@
-from typing import Literal
+from typing import Literal, Optional
 from pydantic import PostgresDsn, SecretStr
 from pydantic_settings import BaseSettings
 
@@ -23,6 +23,66 @@ class Settings(BaseSettings):
     JWT_ALGORITHM: str
     ACCESS_TOKEN_EXPIRE_MINUTES: int
     
+    # enrollment admission queue (peak registration windows)
+    ENROLLMENT_QUEUE_ENABLED: bool = False
+    ENROLLMENT_QUEUE_WORKERS: int = 8
+    ENROLLMENT_QUEUE_SECTION_CONCURRENCY: int = 1
+    ENROLLMENT_QUEUE_MAX_SIZE: int = 5000
+    ENROLLMENT_QUEUE_TICKET_TTL_SECONDS: int = 900
+    ENROLLMENT_QUEUE_MAX_WAIT_SECONDS: int = 30
+    
+    # reference data cache (buildings, rooms, departments, programs, curricula, courses, terms)
+    REFERENCE_CACHE_ENABLED: bool = True
+    REFERENCE_CACHE_TTL_SECONDS: int = 300
+    
+    # timetable solver background jobs
+    TIMETABLE_SOLVER_MAX_RUNNING_JOBS: int = 2
+    TIMETABLE_SOLVER_MAX_BUDGET_SECONDS: int = 120
+    TIMETABLE_SOLVER_JOB_TTL_SECONDS: int = 3600
+    # progress saved to the job row, 5 missed heartbeats free the term
+    TIMETABLE_SOLVER_HEARTBEAT_SECONDS: float = 2.0
+    
+    # cross-worker cache invalidation (Postgres LISTEN/NOTIFY)
+    INVALIDATION_BUS_ENABLED: bool = True
+    INVALIDATION_BUS_CHANNEL: str = "cache_invalidation"
+    
+    # ETag / 304 on catalog GET routes (table_version triggers, migration 0003)
+    CONDITIONAL_GET_ENABLED: bool = True
+    
+    # schema at startup: check the alembic revision (migrations run before the deploy),
+    # create_all for a throwaway local database, skip for neither
+    SCHEMA_STARTUP_MODE: Literal["check", "create_all", "skip"] = "check"
+    
+    # face stack (dlib, cv2, numpy) loaded at startup instead of on the first face request
+    FACE_RECOGNITION_PRELOAD: bool = False
+    
+    # face inference worker (Unix socket), None for in-process face recognition
+    FACE_INFERENCE_SOCKET: Optional[str] = None
+    FACE_INFERENCE_TIMEOUT_SECONDS: float = 10
+    
+    # micro-batching of concurrent face encodings (in-process path), 1 for no batching
+    FACE_BATCH_MAX_SIZE: int = 8
+    FACE_BATCH_MAX_WAIT_MS: float = 5
+    FACE_BATCH_MAX_CONCURRENCY: int = 1
+    FACE_DETECTION_MODEL: Literal["hog", "cnn"] = "hog"
+    
+    # per-request instrumentation: Server-Timing header and a log line per request,
+    # a warning above this many queries in one request (N+1 patterns)
+    REQUEST_TIMING_ENABLED: bool = True
+    REQUEST_QUERY_WARNING_THRESHOLD: int = 25
+    
+    # Prometheus GET /metrics (outside of the JWT auth), opt-in. With a scrape token
+    # the scraper sends "Authorization: Bearer <token>", without one keep the route
+    # off the public ingress. PROMETHEUS_MULTIPROC_DIR in the environment for several workers
+    METRICS_ENABLED: bool = False
+    METRICS_SCRAPE_TOKEN: Optional[SecretStr] = None
+    
+    # slow query log (GET /api/diagnostics/slow-queries), a sample of the slow SELECTs explained
+    SLOW_QUERY_LOG_ENABLED: bool = True
+    SLOW_QUERY_THRESHOLD_MS: float = 200
+    SLOW_QUERY_LOG_SIZE: int = 200
+    SLOW_QUERY_EXPLAIN_SAMPLE_RATE: float = 0.1
+    
     class Config:
         env_file = ".env"
         extra = "ignore"
@@ -1,8 +1,35 @@
+import time
 from typing import AsyncGenerator
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from app.configs.settings import settings
+from app.db.query_stats import install_query_hooks, on_query
+from app.db.slow_query_log import slow_query_log
+from app.utils.metrics import db_pool_checked_out, db_pool_checkout_wait, db_pool_timeouts, observe_query
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Default async pool timing how long every checkout waits for a connection."""
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            db_pool_timeouts.inc()
+            raise
+        finally:
+            db_pool_checkout_wait.observe(time.perf_counter() - started)
+
   
-engine = create_async_engine(settings.DATABASE_URL, echo=settings.DEBUG) # for async app
+engine = create_async_engine(settings.DATABASE_URL, echo=settings.DEBUG, poolclass=InstrumentedQueuePool) # for async app
+install_query_hooks(engine)
+on_query(observe_query)
+if settings.SLOW_QUERY_LOG_ENABLED:
+    slow_query_log.install(engine)
+event.listen(engine.sync_engine, "checkout", lambda *args: db_pool_checked_out.inc())
+event.listen(engine.sync_engine, "checkin", lambda *args: db_pool_checked_out.dec())
 
 async_session = async_sessionmaker(engine, expire_on_commit=False)
 
@@ -0,0 +1,152 @@
+"""
+    Date Written: 10/19/2026 at 2:10 PM
+
+    Request-scoped batching loader (DataLoader style) in front of
+    BaseRepository.get_by_id.
+        - one EntityLoader per model, stored in the session info so it lives
+          exactly as long as the request session (get_async_db)
+        - lookups issued together (asyncio.gather) are coalesced into one
+          SELECT ... WHERE id IN (...)
+        - found rows are memoized for the rest of the request, the same
+          instances the session identity map holds
+        - evicted on repository update/delete, ORM DELETE statements,
+          session.delete() and rollback
+"""
+
+import asyncio
+from typing import Any, Dict, List, Optional, Type
+
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.utils.chunking import chunked
+
+_LOADERS_KEY = "entity_loaders"
+
+# ids per IN (...) list of one batch query
+LOADER_CHUNK_SIZE = 5000
+
+
+class EntityLoader:
+    def __init__(self, db: AsyncSession, model: Type[Any]):
+        self.db = db
+        self.model = model
+
+        self._cache: Dict[str, Any] = {}
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._batch_open = False
+        self._batch_task: Optional[asyncio.Task] = None
+        # one batch query at a time, the session cannot run statements concurrently
+        self._dispatch_lock = asyncio.Lock()
+
+
+    async def load(self, id: str) -> Optional[Any]:
+        """Load one row by id (None if not found, misses are not memoized)."""
+        if id is None:
+            return None
+
+        if id in self._cache:
+            return self._cache[id]
+
+        future = self._pending.get(id)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._pending[id] = future
+
+            # the batch runs in its own task, after the other lookups issued in
+            # the same loop iteration joined: a cancelled caller neither stops
+            # it nor cancels the future the other callers of the id share
+            if not self._batch_open:
+                self._batch_open = True
+                self._batch_task = asyncio.create_task(self._dispatch())
+
+        return await asyncio.shield(future)
+
+
+    async def load_many(self, ids: List[str]) -> List[Optional[Any]]:
+        """Load many rows by id in one query, in the order of ids."""
+        return list(await asyncio.gather(*(self.load(id) for id in ids)))
+
+
+    def evict(self, id: Optional[str] = None) -> None:
+        """Forget one memoized row, or all of them when id is None."""
+        if id is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(id, None)
+
+
+    async def _dispatch(self) -> None:
+        pending: Optional[Dict[str, asyncio.Future]] = None
+        try:
+            await asyncio.sleep(0)
+            async with self._dispatch_lock:
+                pending, self._pending = self._pending, {}
+                self._batch_open = False
+
+                rows: Dict[str, Any] = {}
+                for chunk in chunked(list(pending), LOADER_CHUNK_SIZE):
+                    result = await self.db.execute(
+                        select(self.model).where(self.model.id.in_(chunk))
+                    )
+                    for instance in result.scalars().all():
+                        rows[instance.id] = instance
+        except BaseException as e:
+            # failed or cancelled (before the swap too): no caller may be left waiting
+            if pending is None:
+                pending, self._pending = self._pending, {}
+                self._batch_open = False
+            for future in pending.values():
+                if future.done():
+                    continue
+                if isinstance(e, Exception):
+                    future.set_exception(e)
+                else:
+                    future.cancel()
+            if not isinstance(e, Exception):
+                raise
+            return
+
+        for id, future in pending.items():
+            instance = rows.get(id)
+            if instance is not None:
+                self._cache[id] = instance
+            if not future.done():
+                future.set_result(instance)
+
+
+def get_entity_loader(db: AsyncSession, model: Type[Any]) -> EntityLoader:
+    """Loader of the model for the request session (created on first use)."""
+    loaders: Dict[Type[Any], EntityLoader] = db.info.setdefault(_LOADERS_KEY, {})
+
+    loader = loaders.get(model)
+    if loader is None:
+        loader = loaders[model] = EntityLoader(db, model)
+    return loader
+
+
+def _evict_all(session: Session, id: Optional[str] = None) -> None:
+    for loader in session.info.get(_LOADERS_KEY, {}).values():
+        loader.evict(id)
+
+
+# ============================================
+# INVALIDATION (sync Session events, fired for AsyncSession too)
+# ============================================
+@event.listens_for(Session, "after_soft_rollback")
+def _evict_on_rollback(session: Session, previous_transaction) -> None:
+    # rollback expires the memoized instances, loading them again is required
+    _evict_all(session)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _evict_on_delete_statement(orm_execute_state) -> None:
+    # delete(Model).where(...) executed through the session
+    if orm_execute_state.is_delete:
+        _evict_all(orm_execute_state.session)
+
+
+@event.listens_for(Session, "persistent_to_deleted")
+def _evict_on_session_delete(session: Session, instance: Any) -> None:
+    _evict_all(session, getattr(instance, "id", None))
@@ -0,0 +1,220 @@
+"""
+    Date Written: 10/19/2026 at 7:45 PM
+
+    Cross-process cache invalidation over Postgres LISTEN/NOTIFY.
+        - publish: every flush (and ORM bulk UPDATE/DELETE) touching a
+          subscribed table sends pg_notify(entity, id) inside the same
+          transaction, so it is delivered on commit and dropped on rollback
+        - listen: one dedicated asyncpg connection per process (started in
+          main.life_span) dispatches the messages to the subscribers, which
+          evict their cache entries
+        - reconnects with backoff, every subscriber is told to drop
+          everything (id None) on every connect, the first one too: messages
+          sent before LISTEN (or while disconnected) were missed
+    Payload: {"o": origin process, "e": [[entity, id or null], ...]}
+"""
+
+import asyncio
+import json
+import logging
+import os
+import uuid
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+import asyncpg
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+
+from app.configs.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# entries per NOTIFY, keeps the payload far below the 8000 bytes limit
+NOTIFY_BATCH_SIZE = 100
+
+_PENDING_KEY = "pending_invalidations"
+
+# (entity, id) where id None means every row of the entity
+Invalidation = Tuple[str, Optional[str]]
+
+
+class InvalidationBus:
+    def __init__(self, dsn: str, channel: str, reconnect_delay_max: float = 30):
+        self.dsn = dsn
+        self.channel = channel
+        self.reconnect_delay_max = reconnect_delay_max
+        self.origin = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+
+        self._subscribers: Dict[str, List[Callable[[Optional[str]], None]]] = {}
+        self._connection: Optional[asyncpg.Connection] = None
+        self._task: Optional[asyncio.Task] = None
+        self._connected = asyncio.Event()
+        self._lost: Optional[asyncio.Event] = None
+
+        self.received = 0
+        self.published = 0
+
+
+    @property
+    def entities(self) -> Set[str]:
+        return set(self._subscribers)
+
+
+    def subscribe(self, entity: str, handler: Callable[[Optional[str]], None]) -> None:
+        """handler(id) is called for every invalidation of the entity (table name)."""
+        self._subscribers.setdefault(entity, []).append(handler)
+
+
+    # ============================================
+    # PUBLISH
+    # ============================================
+    def payloads(self, invalidations: List[Invalidation]) -> List[str]:
+        entries = list(dict.fromkeys(invalidations))
+        return [
+            json.dumps({"o": self.origin, "e": [list(entry) for entry in entries[i:i + NOTIFY_BATCH_SIZE]]})
+            for i in range(0, len(entries), NOTIFY_BATCH_SIZE)
+        ]
+
+
+    def publish_in_transaction(self, connection, invalidations: List[Invalidation]) -> None:
+        """NOTIFY through the connection of the current transaction (sync Connection)."""
+        for payload in self.payloads(invalidations):
+            connection.execute(
+                text("SELECT pg_notify(:channel, :payload)"),
+                {"channel": self.channel, "payload": payload}
+            )
+            self.published += 1
+
+
+    # ============================================
+    # LISTEN
+    # ============================================
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+        self._task = asyncio.create_task(self._listen_forever(), name="invalidation-bus")
+
+
+    async def wait_connected(self, timeout: float = 5) -> bool:
+        try:
+            await asyncio.wait_for(self._connected.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await self._close()
+
+
+    async def _close(self) -> None:
+        self._connected.clear()
+        if self._connection is not None and not self._connection.is_closed():
+            try:
+                await self._connection.close(timeout=5)
+            except Exception:
+                self._connection.terminate()
+        self._connection = None
+
+
+    async def _listen_forever(self) -> None:
+        delay = 1.0
+        while True:
+            try:
+                self._lost = asyncio.Event()
+                self._connection = await asyncpg.connect(self.dsn)
+                self._connection.add_termination_listener(lambda _: self._lost.set())
+                await self._connection.add_listener(self.channel, self._on_notification)
+                # messages sent before LISTEN are lost, start over clean
+                for entity in self.entities:
+                    self._dispatch(entity, None)
+                self._connected.set()
+                logger.info("Invalidation bus listening on %s.", self.channel)
+                delay = 1.0
+
+                await self._lost.wait()
+                logger.warning("Invalidation bus connection lost, reconnecting.")
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("Invalidation bus connection failed: %s", str(e))
+
+            await self._close()
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.reconnect_delay_max)
+
+
+    def _on_notification(self, connection, pid, channel, payload: str) -> None:
+        try:
+            message = json.loads(payload)
+        except ValueError:
+            logger.error("Invalidation bus ignored a malformed payload.")
+            return
+
+        self.received += 1
+        for entity, id in message.get("e", []):
+            self._dispatch(entity, id)
+
+
+    def _dispatch(self, entity: str, id: Optional[str]) -> None:
+        for handler in self._subscribers.get(entity, []):
+            try:
+                handler(id)
+            except Exception as e:
+                logger.error("Invalidation bus subscriber of %s failed: %s", entity, str(e))
+
+
+def asyncpg_dsn(database_url: str) -> str:
+    """SQLAlchemy URL (postgresql+asyncpg://...) to a plain asyncpg DSN."""
+    return database_url.replace("postgresql+asyncpg://", "postgresql://", 1)
+
+
+invalidation_bus = InvalidationBus(
+    dsn=asyncpg_dsn(settings.DATABASE_URL), channel=settings.INVALIDATION_BUS_CHANNEL
+)
+
+
+# ============================================
+# PUBLISHING HOOKS (sync Session events, fired for AsyncSession too)
+# ============================================
+def _row_invalidations(session: Session) -> List[Invalidation]:
+    entities = invalidation_bus.entities
+    found: List[Invalidation] = []
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        entity = getattr(instance, "__tablename__", None)
+        if entity in entities:
+            found.append((entity, getattr(instance, "id", None)))
+    return found
+
+
+@event.listens_for(Session, "before_flush")
+def _collect_flushed_rows(session: Session, flush_context, instances) -> None:
+    if not settings.INVALIDATION_BUS_ENABLED:
+        return
+    # new/dirty/deleted are gone by after_flush, remember them now
+    session.info[_PENDING_KEY] = _row_invalidations(session)
+
+
+@event.listens_for(Session, "after_flush")
+def _publish_flushed_rows(session: Session, flush_context) -> None:
+    invalidations = session.info.pop(_PENDING_KEY, None)
+    if invalidations:
+        invalidation_bus.publish_in_transaction(session.connection(), invalidations)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _publish_bulk_statement(orm_execute_state) -> None:
+    # update(Model)... / delete(Model)... executed through the session
+    if not settings.INVALIDATION_BUS_ENABLED:
+        return
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+
+    entity = orm_execute_state.statement.table.name
+    if entity in invalidation_bus.entities:
+        invalidation_bus.publish_in_transaction(orm_execute_state.session.connection(), [(entity, None)])
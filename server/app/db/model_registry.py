@@ -0,0 +1,24 @@
+"""
+    Date Written: 10/19/2026 at 9:40 AM
+"""
+
+import importlib
+from pathlib import Path
+
+MODELS_DIR = Path(__file__).resolve().parent.parent / "models"
+
+
+def import_all_models() -> None:
+    """
+        Import every model module under app/models so Base.metadata and the
+        relationship registry are complete outside of app.main
+        (scripts, migrations, benchmarks).
+    """
+    app_root = MODELS_DIR.parent.parent
+    
+    for path in sorted(MODELS_DIR.rglob("*.py")):
+        if path.stem.startswith("_"):
+            continue
+        
+        module = ".".join(path.relative_to(app_root).with_suffix("").parts)
+        importlib.import_module(module)
@@ -0,0 +1,85 @@
+"""
+    Date Written: 10/20/2026 at 1:40 AM
+
+    Per-request SQL statistics: query count, total DB time and slowest
+    statement of the current request, collected by cursor event hooks on
+    the engine into a context variable set by the RequestTiming middleware.
+    Statements run outside of a request (startup, background jobs) are not
+    counted. The context is copied into every task and greenlet spawned by
+    the request, the stats object is shared, so they all add to it.
+    on_query() listeners see every statement, in a request or not.
+"""
+
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+QUERY_STARTED = "query_started"
+
+QueryListener = Callable[[str, Any, float], None]
+
+
+@dataclass
+class RequestStats:
+    query_cnt: int = 0
+    db_time: float = 0.0
+    slowest_time: float = 0.0
+    slowest_statement: Optional[str] = None
+    # ASGI scope of the request (method, path, matched route)
+    scope: Optional[dict] = field(default=None, repr=False)
+
+    def record(self, statement: str, elapsed: float) -> None:
+        self.query_cnt += 1
+        self.db_time += elapsed
+        if elapsed > self.slowest_time:
+            self.slowest_time = elapsed
+            self.slowest_statement = statement
+
+
+current_request_stats: ContextVar[Optional[RequestStats]] = ContextVar("current_request_stats", default=None)
+
+
+_query_listeners: List[QueryListener] = []
+
+
+def on_query(listener: QueryListener) -> None:
+    """listener(statement, parameters, elapsed seconds) after every statement, keep it cheap."""
+    _query_listeners.append(listener)
+
+
+def start_request_stats(scope: Optional[dict] = None) -> RequestStats:
+    """New stats for the current request (context), returned for reading at the end."""
+    stats = RequestStats(scope=scope)
+    current_request_stats.set(stats)
+    return stats
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    conn.info.setdefault(QUERY_STARTED, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    elapsed = time.perf_counter() - conn.info[QUERY_STARTED].pop()
+    stats = current_request_stats.get()
+    if stats is not None:
+        stats.record(statement, elapsed)
+    for listener in _query_listeners:
+        listener(statement, parameters, elapsed)
+
+
+def _handle_error(exception_context) -> None:
+    # failed statements never reach after_cursor_execute
+    started = exception_context.connection.info.get(QUERY_STARTED) if exception_context.connection else None
+    if started:
+        started.pop()
+
+
+def install_query_hooks(engine: AsyncEngine) -> None:
+    sync_engine = engine.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(sync_engine, "handle_error", _handle_error)
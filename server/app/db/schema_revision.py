@@ -0,0 +1,58 @@
+"""
+    Date Written: 10/19/2026 at 11:10 PM
+
+    Startup check of the database schema against the migrations.
+    The migrations run once per deploy (alembic upgrade head), every worker
+    only reads alembic_version in one query and refuses to start when the
+    database is not at the head revision of the migration scripts shipped
+    with the code (no DDL, no table reflection at boot).
+"""
+
+from functools import lru_cache
+from pathlib import Path
+from typing import List
+
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+from sqlalchemy import text
+from sqlalchemy.exc import ProgrammingError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.exceptions.customed_exception import SchemaRevisionMismatchException
+
+ALEMBIC_INI = Path(__file__).resolve().parents[2] / "alembic.ini"
+
+
+@lru_cache(maxsize=None)
+def head_revisions() -> List[str]:
+    """Head revision(s) of the migration scripts, read from the files (env.py is not run)."""
+    script = ScriptDirectory.from_config(Config(str(ALEMBIC_INI)))
+    return sorted(script.get_heads())
+
+
+async def current_revisions(engine: AsyncEngine) -> List[str]:
+    """Revision(s) stamped in the database, empty when it was never migrated."""
+    async with engine.connect() as conn:
+        try:
+            result = await conn.execute(text("SELECT version_num FROM alembic_version"))
+        except ProgrammingError:
+            # no alembic_version table
+            return []
+        return sorted(result.scalars().all())
+
+
+async def check_schema_revision(engine: AsyncEngine) -> List[str]:
+    expected = head_revisions()
+    current = await current_revisions(engine)
+
+    if current != expected:
+        raise SchemaRevisionMismatchException(
+            current=current,
+            expected=expected,
+            detail=(
+                f"Database schema is at {current or 'no revision'}, the code expects {expected}. "
+                "Run 'alembic upgrade head' (or 'alembic stamp 0001_baseline' first for a database "
+                "created by create_all) before starting the application."
+            )
+        )
+    return current
@@ -0,0 +1,191 @@
+"""
+    Date Written: 10/20/2026 at 2:40 AM
+
+    Slow query log: every statement slower than SLOW_QUERY_THRESHOLD_MS is
+    kept in a ring buffer (last SLOW_QUERY_LOG_SIZE, per worker) with its
+    parameters (strings and bytes redacted), the repository method that ran
+    it and the route of the request, and logged as a warning.
+    A sample of the slow SELECTs (SLOW_QUERY_EXPLAIN_SAMPLE_RATE) is
+    explained in the background, one EXPLAIN at a time on a pooled
+    connection, with the real parameters (never stored), and the plan is
+    attached to the entry.
+"""
+
+import asyncio
+import contextvars
+import itertools
+import logging
+import random
+import re
+import sys
+import uuid
+from collections import deque
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Deque, Iterator, List, Optional
+
+import greenlet
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.configs.settings import settings
+from app.db.query_stats import current_request_stats, on_query
+
+logger = logging.getLogger(__name__)
+
+SAFE_PARAMETER_TYPES = (bool, int, float, Decimal, date, time, datetime, timedelta, uuid.UUID, Enum)
+UUID_PATTERN = re.compile(r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$")
+EXPLAINABLE = ("SELECT", "WITH")
+REPOSITORY_PACKAGE = "app.repository"
+
+# set in the EXPLAIN task, its own statement must not be logged again
+_explaining: contextvars.ContextVar[bool] = contextvars.ContextVar("slow_query_explaining", default=False)
+
+
+@dataclass
+class SlowQuery:
+    id: int
+    captured_at: datetime
+    duration_ms: float
+    statement: str
+    parameters: Any
+    repository_method: Optional[str] = None
+    route: Optional[str] = None
+    plan: Optional[Any] = None
+    explain_error: Optional[str] = None
+
+
+def redact(value: Any) -> Any:
+    """Parameters with the strings and bytes replaced by their length (ids kept)."""
+    if value is None or isinstance(value, SAFE_PARAMETER_TYPES):
+        return value
+    if isinstance(value, str):
+        return value if UUID_PATTERN.match(value) else f"<str {len(value)}>"
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return f"<bytes {len(value)}>"
+    if isinstance(value, (list, tuple)):
+        return [redact(item) for item in value]
+    if isinstance(value, dict):
+        return {key: redact(item) for key, item in value.items()}
+    return f"<{type(value).__name__}>"
+
+
+def _frames() -> Iterator:
+    """
+        Frames of the caller, then of the coroutines that awaited the statement:
+        the async engine runs it in a greenlet whose parent holds the awaiting stack.
+    """
+    frame = sys._getframe(2)
+    current = greenlet.getcurrent()
+    while True:
+        while frame is not None:
+            yield frame
+            frame = frame.f_back
+        current = current.parent
+        if current is None:
+            return
+        frame = current.gr_frame
+
+
+def repository_caller() -> Optional[str]:
+    """Class.method of the innermost repository method on the stack."""
+    for frame in _frames():
+        if "self" not in frame.f_code.co_varnames:
+            continue
+        owner = type(frame.f_locals.get("self"))
+        if owner.__module__.startswith(REPOSITORY_PACKAGE):
+            return f"{owner.__name__}.{frame.f_code.co_name}"
+    return None
+
+
+def request_route() -> Optional[str]:
+    stats = current_request_stats.get()
+    if stats is None or stats.scope is None:
+        return None
+    route = stats.scope.get("route")
+    return f"{stats.scope.get('method')} {getattr(route, 'path', None) or stats.scope.get('path')}"
+
+
+class SlowQueryLog:
+    def __init__(self, threshold_ms: float, size: int, explain_sample_rate: float):
+        self.threshold_ms = threshold_ms
+        self.explain_sample_rate = explain_sample_rate
+        self._entries: Deque[SlowQuery] = deque(maxlen=size)
+        self._ids = itertools.count(1)
+        self._engine: Optional[AsyncEngine] = None
+        self._explain_task: Optional[asyncio.Task] = None
+
+
+    def install(self, engine: AsyncEngine) -> None:
+        self._engine = engine
+        on_query(self.record)
+
+
+    def entries(self, limit: Optional[int] = None) -> List[SlowQuery]:
+        """Newest first."""
+        entries = list(reversed(self._entries))
+        return entries[:limit] if limit else entries
+
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+    def record(self, statement: str, parameters: Any, elapsed: float) -> None:
+        duration_ms = elapsed * 1000
+        if duration_ms < self.threshold_ms or _explaining.get():
+            return
+
+        entry = SlowQuery(
+            id=next(self._ids),
+            captured_at=datetime.now(timezone.utc),
+            duration_ms=round(duration_ms, 2),
+            statement=statement,
+            parameters=redact(parameters),
+            repository_method=repository_caller(),
+            route=request_route(),
+        )
+        self._entries.append(entry)
+        logger.warning(
+            "Slow query %.1f ms in %s (%s): %s",
+            duration_ms, entry.repository_method or "-", entry.route or "no request", statement[:300]
+        )
+
+        if self._should_explain(statement):
+            # empty context: the EXPLAIN is not a statement of the request
+            self._explain_task = asyncio.get_running_loop().create_task(
+                self._explain(entry, statement, parameters), context=contextvars.Context()
+            )
+
+
+    def _should_explain(self, statement: str) -> bool:
+        if self._engine is None or random.random() >= self.explain_sample_rate:
+            return False
+        if self._explain_task is not None and not self._explain_task.done():
+            return False
+        if not statement.lstrip().upper().startswith(EXPLAINABLE):
+            return False
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # sync use of the engine, no loop to run the EXPLAIN on
+            return False
+        return True
+
+
+    async def _explain(self, entry: SlowQuery, statement: str, parameters: Any) -> None:
+        _explaining.set(True)
+        try:
+            async with self._engine.connect() as conn:
+                result = await conn.exec_driver_sql("EXPLAIN (FORMAT JSON) " + statement, parameters)
+                entry.plan = result.scalar()
+        except Exception as e:
+            entry.explain_error = f"{type(e).__name__}: {e}"
+
+
+slow_query_log = SlowQueryLog(
+    threshold_ms=settings.SLOW_QUERY_THRESHOLD_MS,
+    size=settings.SLOW_QUERY_LOG_SIZE,
+    explain_sample_rate=settings.SLOW_QUERY_EXPLAIN_SAMPLE_RATE
+)
@@ -0,0 +1,58 @@
+"""
+    Date Written: 10/19/2026 at 8:40 PM
+
+    Version of a set of tables, for conditional GET (ETag) responses, read in
+    one query from state every worker and pod sees the same way:
+        - change counter: table_version row of the table, bumped by a
+          statement trigger on every write (row updates included)
+        - fingerprint: row count and max(created_at), still catches inserts
+          and deletes on a database missing the triggers
+    No per-process state: any worker answers 304 to an ETag issued by
+    another one, and a restart keeps the ETags valid.
+"""
+
+import hashlib
+from typing import Iterable, List, Optional, Tuple
+
+from sqlalchemy import func, literal, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.base import Base
+from app.models.caching.table_version import VERSIONED_TABLES, TableVersion
+
+
+class TableVersions:
+    def check(self, tables: Iterable[str]) -> None:
+        """Only the tables with a version trigger can back an ETag."""
+        unversioned = set(tables) - set(VERSIONED_TABLES)
+        if unversioned:
+            raise ValueError(f"Tables without a version trigger: {', '.join(sorted(unversioned))}.")
+
+
+    async def versions(self, db: AsyncSession, tables: Iterable[str]) -> List[Tuple]:
+        """(table, change counter or None, row count, max created_at or None) of every table, in one query."""
+        selects = []
+        for name in sorted(tables):
+            table = Base.metadata.tables[name]
+            created_at = table.c.get("created_at")
+            counter = select(TableVersion.version).where(TableVersion.table_name == name).scalar_subquery()
+            selects.append(
+                select(
+                    literal(name).label("table_name"),
+                    counter.label("version"),
+                    func.count().label("row_cnt"),
+                    (func.max(created_at) if created_at is not None else literal(None)).label("last_created_at")
+                ).select_from(table)
+            )
+
+        result = await db.execute(union_all(*selects))
+        return sorted(tuple(row) for row in result.all())
+
+
+    async def etag(self, db: AsyncSession, tables: Iterable[str], *scope: Optional[str]) -> str:
+        """Weak ETag of the tables, scope: path, query, user..."""
+        state = (scope, await self.versions(db, tables))
+        return f'W/"{hashlib.sha1(repr(state).encode()).hexdigest()}"'
+
+
+table_versions = TableVersions()
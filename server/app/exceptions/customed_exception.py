@@ -48,4 +48,25 @@ class InvalidTokenException(Exception):
   def __init__(self, detail="Invalid token", error_code="INVALID_TOKEN"):
     self.detail = detail
     self.error_code = error_code
-    
\ No newline at end of file
+
+
+class ServiceUnavailableException(Exception):
+  def __init__(self, detail="Service unavailable", error_code="SERVICE_UNAVAILABLE"):
+    self.detail = detail
+    self.error_code = error_code
+
+
+class NotModifiedException(Exception):
+  def __init__(self, etag: str, cache_control: str, detail="Not modified", error_code="NOT_MODIFIED"):
+    self.etag = etag
+    self.cache_control = cache_control
+    self.detail = detail
+    self.error_code = error_code
+
+
+class SchemaRevisionMismatchException(Exception):
+  def __init__(self, current: list, expected: list, detail="Database schema revision mismatch", error_code="SCHEMA_REVISION_MISMATCH"):
+    self.current = current
+    self.expected = expected
+    self.detail = detail
+    self.error_code = error_code
@@ -2,7 +2,7 @@
     Date Written: 12/14/2025 at 4:02 AM
 """
 
-from fastapi import Request
+from fastapi import Request, Response
 from app.exceptions.customed_exception import *
 from app.exceptions.error_response import error_response
 
@@ -37,3 +37,12 @@ async def unprocessible_content_handler(request: Request, exc: UnprocessibleCont
 
 async def invalid_request_handler(request: Request, exc: InvalidRequestException):
   return error_response(exc.detail, exc.error_code, 401)
+
+
+async def service_unavailable_handler(request: Request, exc: ServiceUnavailableException):
+  return error_response(exc.detail, exc.error_code, 503)
+
+
+async def not_modified_handler(request: Request, exc: NotModifiedException):
+  # conditional GET hit, no body (the client keeps its cached copy)
+  return Response(status_code=304, headers={"ETag": exc.etag, "Cache-Control": exc.cache_control})
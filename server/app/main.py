@@ -2,13 +2,17 @@
     Date written: 12/6/2025 at 2:23 PM
 """
 
+import asyncio
+
 from fastapi import FastAPI
 
 from contextlib import asynccontextmanager
 
 from sqlalchemy import text
 
-from app.db.db_session import engine
+from app.db.db_session import async_session, engine
+from app.db.invalidation_bus import invalidation_bus
+from app.db.schema_revision import check_schema_revision
 from app.db.base import Base
 from app.configs.settings import settings
 
@@ -70,6 +74,8 @@ from app.models.face_recognitions.face_encoding import FaceEncoding
 # routers
 from app.api.v1.routes.auth_router import auth_router
 from app.api.v1.routes.face_recognition_router import face_recognition_router
+from app.ai.face_recognition.face_recognition import load_face_stack
+from app.ai.face_recognition.face_inference_client import face_inference_client
 from app.api.v1.routes.base_user_router import base_user_router
 from app.api.v1.routes.academic_structure_router import academic_structure_router
 from app.api.v1.routes.professor_router import prof_router
@@ -78,10 +84,20 @@ from app.api.v1.routes.program_chair_router import program_chair_router
 from app.api.v1.routes.enrollement_and_grading_router import enrollment_grading_router
 from app.api.v1.routes.student_router import student_router
 from app.api.v1.routes.registrar_router import registrar_router
+from app.api.v1.routes.metrics_router import metrics_router
+from app.api.v1.routes.diagnostics_router import diagnostics_router
+
+
+# services
+from app.services.enrollment_admission_queue import enrollment_admission_queue
+from app.services.timetable_solver_service import timetable_solver_jobs
+from app.services.reference_data_cache import reference_data_cache
+from app.utils.metrics import mark_process_dead
 
 
 # middlewares
 from app.middleware.filter_jwt import FilterJWT
+from app.middleware.request_timing import RequestTiming
 
 
 from app.exceptions.customed_exception import *
@@ -91,16 +107,49 @@ from app.exceptions.error_handler import *
 @asynccontextmanager
 async def life_span(app: FastAPI):
     try:
-        async with engine.begin() as conn:
-            # await conn.run_sync(Base.metadata.drop_all)
-            await conn.run_sync(Base.metadata.create_all)
+        if settings.SCHEMA_STARTUP_MODE == "check":
+            revision = await check_schema_revision(engine)
+            print(f"\n\nRDBMS schema is at revision {', '.join(revision)}")
+            
+        elif settings.SCHEMA_STARTUP_MODE == "create_all":
+            async with engine.begin() as conn:
+                # await conn.run_sync(Base.metadata.drop_all)
+                await conn.run_sync(Base.metadata.create_all)
 
-            print("\n\nRDBMS table are created successfully!")
+                print("\n\nRDBMS table are created successfully!")
+
+        if settings.FACE_RECOGNITION_PRELOAD:
+            # pods serving face traffic, off the event loop
+            await asyncio.to_thread(load_face_stack)
+            
+        if settings.INVALIDATION_BUS_ENABLED:
+            # writes of any worker evict the cached rows of every worker
+            for entity in reference_data_cache.entities:
+                invalidation_bus.subscribe(
+                    entity,
+                    lambda id, entity=entity: reference_data_cache.invalidate(entity, id, notify=False)
+                )
+            await invalidation_bus.start()
+            # listening before the warm: no write between the two goes unnoticed
+            if not await invalidation_bus.wait_connected():
+                print("\n\nInvalidation bus not connected yet, the cache is dropped once it is.")
+            
+        if settings.REFERENCE_CACHE_ENABLED:
+            await reference_data_cache.warm(async_session)
+            
+        if settings.ENROLLMENT_QUEUE_ENABLED:
+            await enrollment_admission_queue.start()
             
         yield
         
     finally:
+        await enrollment_admission_queue.stop()
+        await timetable_solver_jobs.stop()
+        await invalidation_bus.stop()
+        if face_inference_client is not None:
+            await face_inference_client.close()
         await engine.dispose()
+        mark_process_dead()
         print("\n\nRDBMS engine disposed...")
         print("Application shutdown...")
         
@@ -112,6 +161,9 @@ app = FastAPI(
 
 #middleware
 app.add_middleware(FilterJWT)
+if settings.REQUEST_TIMING_ENABLED or settings.METRICS_ENABLED:
+    # outermost, the JWT filter user lookup counts too
+    app.add_middleware(RequestTiming)
 
 
 # router registration
@@ -125,6 +177,9 @@ app.include_router(program_chair_router)
 app.include_router(enrollment_grading_router)
 app.include_router(student_router)
 app.include_router(registrar_router)
+app.include_router(diagnostics_router)
+if settings.METRICS_ENABLED:
+    app.include_router(metrics_router)
 
 
 # regiustering global exeception handler
@@ -136,3 +191,5 @@ app.add_exception_handler(UnauthorizedAccessException, unauthorized_access_handl
 app.add_exception_handler(ForbiddenAccessException, forbidden_access_handler)
 app.add_exception_handler(InvalidTokenException, invalid_token_handler)
 app.add_exception_handler(InvalidRequestException, invalid_request_handler)
+app.add_exception_handler(ServiceUnavailableException, service_unavailable_handler)
+app.add_exception_handler(NotModifiedException, not_modified_handler)
@@ -0,0 +1,55 @@
+"""
+    Date Written: 10/19/2026 at 8:55 PM
+"""
+
+from typing import List, Optional
+
+from fastapi import Depends, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.configs.settings import settings
+from app.db.db_session import get_async_db
+from app.db.table_versions import table_versions
+from app.exceptions.customed_exception import NotModifiedException
+from app.middleware.current_user import get_current_user
+from app.models.users.base_user import BaseUser
+
+
+def conditional_get(tables: List[str], max_age: int = 0, per_user: bool = False):
+    """
+        ETag / If-None-Match for a GET route whose payload only depends on
+        the given tables (and on the current user when per_user).
+        Declare it after the role check so unauthorized requests never get a 304.
+        A matching If-None-Match raises NotModifiedException (304, no body)
+        before the route builds its response. Returns the ETag/Cache-Control
+        headers, for routes returning a Response of their own.
+
+        param: tables: every table read by the route (with a version trigger,
+               see app.models.caching.table_version)
+        param: max_age: seconds the client may reuse its copy without asking,
+               0 for revalidating on every use
+    """
+    table_versions.check(tables)
+    cache_control = f"private, max-age={max_age}" if max_age > 0 else "private, no-cache"
+
+    async def wrapper(
+        request: Request,
+        response: Response,
+        db: AsyncSession = Depends(get_async_db),
+        user: Optional[BaseUser] = Depends(get_current_user)
+    ):
+        if not settings.CONDITIONAL_GET_ENABLED:
+            return {}
+
+        etag = await table_versions.etag(
+            db, tables,
+            request.url.path, str(request.query_params), user.id if per_user else None
+        )
+        if_none_match = request.headers.get("if-none-match", "")
+        if etag in [tag.strip() for tag in if_none_match.split(",")] or if_none_match.strip() == "*":
+            raise NotModifiedException(etag=etag, cache_control=cache_control)
+
+        headers = {"ETag": etag, "Cache-Control": cache_control}
+        response.headers.update(headers)
+        return headers
+    return wrapper
@@ -106,6 +106,9 @@ def match_uri(request_route: str) -> bool:
         # authentication
         r"/api/user/registration",
         r"/api/user/authenticate/token",
-        r"/api/user/authenticate/refresh-token"
+        r"/api/user/authenticate/refresh-token",
+        
+        # prometheus scraper, checks METRICS_SCRAPE_TOKEN itself
+        r"/metrics"
     }
     return True if any(re.match(route, request_route) for route in public_routes) else False
\ No newline at end of file
@@ -0,0 +1,87 @@
+"""
+    Date Written: 10/20/2026 at 1:50 AM
+"""
+
+import json
+import logging
+import time
+
+from fastapi import Request
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.configs.settings import settings
+from app.db.query_stats import RequestStats, start_request_stats
+from app.utils.metrics import http_request_duration, http_requests_in_progress
+
+logger = logging.getLogger(__name__)
+
+SLOWEST_STATEMENT_LOG_LENGTH = 300
+
+
+class RequestTiming(BaseHTTPMiddleware):
+    """
+        Query count, DB time, slowest statement and total time of every
+        request (JWT filter included, response body streaming excluded):
+            - Server-Timing header: total, db (with the query count), app
+              (total minus db), shown by the browser devtools
+            - one JSON log line per request
+            - a warning when a request runs more than
+              REQUEST_QUERY_WARNING_THRESHOLD queries (N+1 patterns)
+        (REQUEST_TIMING_ENABLED), and the in-progress gauge and latency
+        histogram by route template of /metrics (METRICS_ENABLED).
+    """
+    async def dispatch(self, request: Request, call_next):
+        stats = start_request_stats(request.scope)
+        started = time.perf_counter()
+        status_code = 500
+        if settings.METRICS_ENABLED:
+            http_requests_in_progress.inc()
+        try:
+            response = await call_next(request)
+            status_code = response.status_code
+        finally:
+            total = time.perf_counter() - started
+            if settings.METRICS_ENABLED:
+                http_requests_in_progress.dec()
+                http_request_duration.labels(request.method, route_template(request), str(status_code)).observe(total)
+            if settings.REQUEST_TIMING_ENABLED:
+                log_request(request, status_code, total, stats)
+
+        if settings.REQUEST_TIMING_ENABLED:
+            response.headers["Server-Timing"] = server_timing(total, stats)
+        return response
+
+
+def route_template(request: Request) -> str:
+    """Path template of the matched route (/api/.../{id}), low cardinality for logs and metrics."""
+    route = request.scope.get("route")
+    return getattr(route, "path", None) or "<unmatched>"
+
+
+def server_timing(total: float, stats: RequestStats) -> str:
+    return (
+        f"total;dur={total * 1000:.1f}, "
+        f"db;dur={stats.db_time * 1000:.1f};desc=\"{stats.query_cnt} queries\", "
+        f"app;dur={max(0.0, total - stats.db_time) * 1000:.1f}"
+    )
+
+
+def log_request(request: Request, status_code: int, total: float, stats: RequestStats) -> None:
+    route = route_template(request)
+    logger.info(json.dumps({
+        "method": request.method,
+        "route": route,
+        "status": status_code,
+        "total_ms": round(total * 1000, 1),
+        "db_ms": round(stats.db_time * 1000, 1),
+        "queries": stats.query_cnt,
+        "slowest_ms": round(stats.slowest_time * 1000, 1),
+        "slowest_statement": (stats.slowest_statement or "")[:SLOWEST_STATEMENT_LOG_LENGTH] or None,
+    }))
+
+    if stats.query_cnt > settings.REQUEST_QUERY_WARNING_THRESHOLD:
+        logger.warning(
+            "%s %s ran %s queries (threshold %s), %.1f ms in the database.",
+            request.method, route, stats.query_cnt, settings.REQUEST_QUERY_WARNING_THRESHOLD,
+            stats.db_time * 1000
+        )
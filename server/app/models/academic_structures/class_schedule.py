@@ -4,7 +4,7 @@
 
 from datetime import datetime, timezone
 import uuid
-from sqlalchemy import Column, DateTime, ForeignKey, SmallInteger, String, Time
+from sqlalchemy import Column, DateTime, ForeignKey, Index, SmallInteger, String, Time
 from sqlalchemy.orm import relationship, validates
 
 from app.db.base import Base
@@ -45,4 +45,10 @@ class ClassSchedule(Base):
         back_populates="class_schedules",
         uselist=False
     )
-        
\ No newline at end of file
+        
+    
+    # conflict lookups: room/day overlap and schedules of a section
+    __table_args__ = (
+        Index("ix_class_schedule_room_day_start", "room_id", "day_of_week", "start_time"),
+        Index("ix_class_schedule_class_section_id", "class_section_id"),
+    )
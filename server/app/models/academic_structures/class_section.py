@@ -4,7 +4,7 @@
 
 from datetime import datetime, timezone
 import uuid
-from sqlalchemy import Column, DateTime, Enum, ForeignKey, SmallInteger, String, UniqueConstraint
+from sqlalchemy import Column, DateTime, Enum, ForeignKey, Index, SmallInteger, String, UniqueConstraint
 from app.db.base import Base
 from sqlalchemy.orm import relationship
 
@@ -91,5 +91,6 @@ class ClassSection(Base):
             "course_offering_id",
             name="uq_class_section_section_code_course_offering",
         ),
+        Index("ix_class_section_course_offering_status", "course_offering_id", "status"),
     )
     
\ No newline at end of file
@@ -5,7 +5,7 @@
 from datetime import datetime, timezone
 import uuid
 
-from sqlalchemy import Column, DateTime, ForeignKey, String, Enum, UniqueConstraint
+from sqlalchemy import Column, DateTime, Enum, ForeignKey, Index, String, UniqueConstraint
 from sqlalchemy.orm import relationship
 
 from app.db.base import Base
@@ -55,6 +55,7 @@ class CourseOffering(Base):
             "term_id",
             name="uq_course_offering_curriculum_course_term"
         ),
+        Index("ix_course_offering_term_status", "term_id", "status"),
     )
 
     
\ No newline at end of file
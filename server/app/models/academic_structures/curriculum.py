@@ -24,7 +24,7 @@ class Curriculum(Base):
     status = Column(Enum(CurriculumStatus), nullable=False) # DRAFT | ACTIVE | RETIRED
     
     # foreign keys
-    program_id = Column(String(36), ForeignKey("program.id"), nullable=True)
+    program_id = Column(String(36), ForeignKey("program.id"), nullable=True, index=True)
     
     
     # many-to-one relationship with Program
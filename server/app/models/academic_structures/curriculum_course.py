@@ -5,7 +5,7 @@
 from datetime import datetime, timezone
 import uuid
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, SmallInteger, String, UniqueConstraint
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, SmallInteger, String, UniqueConstraint
 from sqlalchemy.orm import relationship
 
 from app.db.base import Base
@@ -57,5 +57,6 @@ class CurriculumCourse(Base):
             "curriculum_id", "course_id",
             name="uq_curriculum_course"
         ),
+        Index("ix_curriculum_course_course_id", "course_id"),
     ) 
     
\ No newline at end of file
@@ -4,7 +4,7 @@
 
 from datetime import datetime, timezone
 import uuid
-from sqlalchemy import Column, DateTime, ForeignKey, String, UniqueConstraint
+from sqlalchemy import Column, DateTime, ForeignKey, Index, String, UniqueConstraint
 from sqlalchemy.orm import relationship
 from app.db.base import Base
 
@@ -41,4 +41,5 @@ class ProfessorClassSection(Base):
             "class_section_id",
             name="uq_professor_class_section_professor_section"
         ),
+        Index("ix_professor_class_section_class_section_id", "class_section_id"),
     )
@@ -21,7 +21,7 @@ class Program(Base):
     
   
     # foreign keys
-    department_id = Column(String(36), ForeignKey("department.id"), nullable=True)
+    department_id = Column(String(36), ForeignKey("department.id"), nullable=True, index=True)
     
     # many-to-one relationship with Department
     department = relationship(
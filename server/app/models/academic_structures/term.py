@@ -5,7 +5,7 @@
 from datetime import datetime, timezone
 import uuid
 
-from sqlalchemy import Column, DateTime, Enum, ForeignKey, SmallInteger, String, UniqueConstraint
+from sqlalchemy import Column, DateTime, Enum, ForeignKey, Index, SmallInteger, String, UniqueConstraint
 from sqlalchemy.orm import relationship
 
 from app.db.base import Base
@@ -53,5 +53,6 @@ class Term(Base):
             "semester_period",
             name="unique_term_per_year_semester"
         ),
+        Index("ix_term_status", "status"),
     )
     
\ No newline at end of file
@@ -0,0 +1,58 @@
+"""
+    Date Written: 10/20/2026 at 4:50 AM
+
+    Timetable solver job, shared by every worker: any worker reads, cancels
+    or commits a job, whichever worker runs it. At most one QUEUED or
+    RUNNING job per term (partial unique index). The running worker updates
+    heartbeat_at, a job whose heartbeat stopped (worker gone) is failed by
+    the next submit of its term.
+"""
+
+from datetime import datetime, timezone
+
+from sqlalchemy import JSON, Column, DateTime, Enum, Float, ForeignKey, Index, Integer, String, text
+
+from app.db.base import Base
+from app.models.enums.academic_structure_state import TimetableJobStatus
+
+
+class TimetableSolverJob(Base):
+    __tablename__ = "timetable_solver_job"
+
+    id = Column(String(36), primary_key=True)
+    submitted_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False)
+
+    # QUEUED | RUNNING | DONE | FAILED | COMMITTED | CANCELLED
+    status = Column(Enum(TimetableJobStatus), default=TimetableJobStatus.QUEUED, nullable=False)
+    request = Column(JSON, nullable=False) # TimetableSolverRequestSchema
+    requested_by = Column(String(255), nullable=True)
+    requested_by_id = Column(String(36), nullable=True)
+
+    progress = Column(Float, default=0.0, nullable=False)
+    attempts = Column(Integer, default=0, nullable=False)
+    sections_total = Column(Integer, default=0, nullable=False)
+    meetings_total = Column(Integer, default=0, nullable=False)
+    meetings_assigned = Column(Integer, default=0, nullable=False)
+    elapsed_seconds = Column(Float, default=0.0, nullable=False)
+
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    heartbeat_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False)
+    completed_at = Column(DateTime(timezone=True), nullable=True)
+
+    proposal = Column(JSON, nullable=True) # TimetableProposalRowSchema rows, once DONE
+    unassigned = Column(JSON, nullable=True) # TimetableUnassignedSectionSchema rows
+    error = Column(String(255), nullable=True)
+
+    # foreign keys
+    term_id = Column(ForeignKey("term.id", ondelete="CASCADE"), nullable=False)
+
+
+    __table_args__ = (
+        # one running job per term across workers, the insert of a second one fails
+        Index(
+            "uq_timetable_solver_job_active_term", "term_id",
+            unique=True,
+            postgresql_where=text("status IN ('QUEUED', 'RUNNING')")
+        ),
+        Index("ix_timetable_solver_job_completed_at", "completed_at"),
+    )
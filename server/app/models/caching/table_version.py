@@ -0,0 +1,47 @@
+"""
+    Date Written: 10/20/2026 at 4:30 AM
+
+    Change counter of the tables served with conditional GET (ETag), one row
+    per table, bumped by a statement trigger on every INSERT, UPDATE, DELETE
+    and TRUNCATE in the writing transaction. Every worker and pod reads the
+    same value, a restart keeps it. The triggers come with migration
+    0003_table_versions, or with create_all (below).
+"""
+
+from sqlalchemy import BigInteger, Column, DDL, String, event
+
+from app.db.base import Base
+
+# tables with a version trigger, the conditional_get routes may only read these
+VERSIONED_TABLES = ("building", "course", "curriculum", "department", "program", "room")
+
+BUMP_FUNCTION = """
+CREATE OR REPLACE FUNCTION bump_table_version() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO table_version (table_name, version) VALUES (TG_TABLE_NAME, 1)
+    ON CONFLICT (table_name) DO UPDATE SET version = table_version.version + 1;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql
+"""
+
+BUMP_TRIGGER = """
+CREATE TRIGGER {table}_version
+AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table}
+FOR EACH STATEMENT EXECUTE FUNCTION bump_table_version()
+"""
+
+
+class TableVersion(Base):
+    __tablename__ = "table_version"
+
+    table_name = Column(String(63), primary_key=True)
+    version = Column(BigInteger, nullable=False, default=0)
+
+
+# create_all: after every table exists
+event.listen(Base.metadata, "after_create", DDL(BUMP_FUNCTION).execute_if(dialect="postgresql"))
+for _table in VERSIONED_TABLES:
+    event.listen(
+        Base.metadata, "after_create", DDL(BUMP_TRIGGER.format(table=_table)).execute_if(dialect="postgresql")
+    )
@@ -4,7 +4,7 @@
 
 from datetime import datetime, timezone
 import uuid
-from sqlalchemy import Column, DateTime, Enum, ForeignKey, String, UniqueConstraint
+from sqlalchemy import Column, DateTime, Enum, ForeignKey, Index, String, UniqueConstraint
 from sqlalchemy.orm import relationship
 from app.db.base import Base
 from app.models.enums.enrollment_and_grading_state import EnrollmentStatus
@@ -61,5 +61,8 @@ class Enrollment(Base):
     
     __table_args__ = (
         UniqueConstraint('student_id', 'class_section_id', 'term_id', name='uq_student_section'),
+        Index("ix_enrollment_class_section_id", "class_section_id"),
+        Index("ix_enrollment_student_term", "student_id", "term_id"),
+        Index("ix_enrollment_term_status", "term_id", "status"),
     )
     
\ No newline at end of file
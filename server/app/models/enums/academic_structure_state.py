@@ -39,4 +39,19 @@ class ClassSectionStatus(str, Enum):
     OPEN = "OPEN"
     CLOSE = "CLOSE"
     CANCELLED = "CANCELLED"
-    
\ No newline at end of file
+    
+
+
+class ScheduleConflictType(str, Enum):
+    ROOM = "ROOM"
+    PROFESSOR = "PROFESSOR"
+    SECTION = "SECTION"
+
+
+class TimetableJobStatus(str, Enum):
+    QUEUED = "QUEUED"
+    RUNNING = "RUNNING"
+    DONE = "DONE"           # proposal ready for review
+    FAILED = "FAILED"
+    COMMITTED = "COMMITTED" # proposal imported to the term
+    CANCELLED = "CANCELLED"
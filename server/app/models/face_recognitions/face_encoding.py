@@ -5,7 +5,7 @@
 from datetime import datetime, timezone
 import uuid
 from sqlalchemy.orm import relationship
-from sqlalchemy import Boolean, Column, DateTime, Float, ForeignKey, LargeBinary, String
+from sqlalchemy import Boolean, Column, DateTime, Float, ForeignKey, Index, LargeBinary, String
 from app.db.base import Base
 
 class FaceEncoding(Base):
@@ -41,6 +41,11 @@ class FaceEncoding(Base):
         uselist=False
     )
     
+    # active encodings of a user (face login and enrollment checks)
+    __table_args__ = (
+        Index("ix_face_encoding_user_active", "user_id", "is_active"),
+    )
+    
     def get_encoding_array(self):
         """Convert binary back to numpy array."""
         import numpy as np
@@ -48,7 +53,6 @@ class FaceEncoding(Base):
     
     @staticmethod
     def encode_array(encoding_array):
-        """Convert numpy array to binary for storage."""
-        import numpy as np
+        """Convert numpy array (or array.array) to binary for storage."""
         return encoding_array.tobytes()
     
\ No newline at end of file
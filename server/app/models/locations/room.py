@@ -4,7 +4,7 @@
 
 from datetime import datetime, timezone
 import uuid
-from sqlalchemy import Column, DateTime, ForeignKey, SmallInteger, String, UniqueConstraint
+from sqlalchemy import Column, DateTime, ForeignKey, Index, SmallInteger, String, UniqueConstraint
 from sqlalchemy.orm import relationship
 
 from app.db.base import Base
@@ -43,5 +43,6 @@ class Room(Base):
             "building_id",
             name="uq_rooM-room_code_building_id"
         ),
+        Index("ix_room_building_id", "building_id"),
     )
             
\ No newline at end of file
@@ -13,7 +13,7 @@ class Student(BaseUser):
     
     id = Column(String(36), ForeignKey("base_user.id"), primary_key=True)
     # foreign keys
-    program_id = Column(String(36), ForeignKey("program.id"), nullable=True)
+    program_id = Column(String(36), ForeignKey("program.id"), nullable=True, index=True)
 
     last_school_attended = Column(String(255), nullable=True)
     program_enrolled_date = Column(Date, nullable=True)
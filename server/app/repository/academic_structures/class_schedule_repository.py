@@ -2,56 +2,179 @@
     Date Written: 12/27/2025 at 2:37 PM
 """
 
-from typing import List
-from sqlalchemy import select
+import uuid
+from datetime import datetime, time, timezone
+from typing import Any, Dict, List, Optional
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.repository.base_repository import BaseRepository
 from app.models.academic_structures.class_schedule import ClassSchedule
 from app.models.academic_structures.class_section import ClassSection
+from app.models.academic_structures.course_offering import CourseOffering
 from app.models.academic_structures.professor_class_section import ProfessorClassSection
 from app.models.locations.room import Room
+from app.utils.chunking import chunked
+
+# rows per INSERT statement of a bulk schedule import
+SCHEDULE_INSERT_CHUNK_SIZE = 1000
 
 
 class ClassScheduleRepository(BaseRepository[ClassSchedule]):
     def __init__(self, db: AsyncSession) -> None:
         super().__init__(ClassSchedule, db)
-        
-        
-    async def get_schedules_by_room(self, room_id: str, day_of_week: int) -> List[ClassSchedule]:
+
+
+    def _term_schedules_stmt(self, term_id: Optional[str]):
+        """ClassSchedule rows, scoped to the term of their course offering when given."""
+        stmt = select(ClassSchedule)
+
+        if term_id is not None:
+            stmt = (
+                stmt.join(ClassSection, ClassSection.id == ClassSchedule.class_section_id)
+                    .join(CourseOffering, CourseOffering.id == ClassSection.course_offering_id)
+                    .where(CourseOffering.term_id == term_id)
+            )
+
+        return stmt
+
+
+    async def get_schedules_by_room(
+        self, room_id: str, day_of_week: int, term_id: Optional[str] = None
+    ) -> List[ClassSchedule]:
         stmt = (
-            select(ClassSchedule)
+            self._term_schedules_stmt(term_id)
                 .where(
-                    Room.id == room_id,
+                    ClassSchedule.room_id == room_id,
                     ClassSchedule.day_of_week == day_of_week
                 )
         )
-        
+
         result = await self.db.execute(stmt)
         schedules = result.scalars().all()
         return schedules
-            
-        
-    async def get_schedules_by_professor(self, professor_id, day_of_week) -> List[ClassSchedule]:
+
+
+    async def get_schedules_by_professor(
+        self, professor_id, day_of_week, term_id: Optional[str] = None
+    ) -> List[ClassSchedule]:
         stmt = (
-            select(ClassSchedule)
+            self._term_schedules_stmt(term_id)
                 .join(ProfessorClassSection, ProfessorClassSection.class_section_id == ClassSchedule.class_section_id)
                     .where(
                         ProfessorClassSection.professor_id == professor_id,
                         ClassSchedule.day_of_week == day_of_week
                     )
         )
-        
+
         result = await self.db.execute(stmt)
         schedules = result.scalars().all()
         return schedules
+
+
+    async def find_room_conflict(
+        self, room_id: str, term_id: str, day_of_week: int, start_time: time, end_time: time
+    ) -> Optional[ClassSchedule]:
+        """
+            First schedule of the room in the term overlapping the slot
+            (start < other_end AND end > other_start), answered by the database
+            through the (room_id, day_of_week, start_time) index.
+        """
+        stmt = (
+            self._term_schedules_stmt(term_id)
+                .where(
+                    ClassSchedule.room_id == room_id,
+                    ClassSchedule.day_of_week == day_of_week,
+                    ClassSchedule.start_time < end_time,
+                    ClassSchedule.end_time > start_time
+                )
+                .order_by(ClassSchedule.start_time)
+                .limit(1)
+        )
+
+        result = await self.db.execute(stmt)
+        return result.scalars().first()
+
+
+    async def find_professor_conflict(
+        self, professor_id: str, term_id: str, day_of_week: int, start_time: time, end_time: time
+    ) -> Optional[ClassSchedule]:
+        """First schedule of the professor in the term overlapping the slot."""
+        stmt = (
+            self._term_schedules_stmt(term_id)
+                .join(ProfessorClassSection, ProfessorClassSection.class_section_id == ClassSchedule.class_section_id)
+                .where(
+                    ProfessorClassSection.professor_id == professor_id,
+                    ClassSchedule.day_of_week == day_of_week,
+                    ClassSchedule.start_time < end_time,
+                    ClassSchedule.end_time > start_time
+                )
+                .order_by(ClassSchedule.start_time)
+                .limit(1)
+        )
+
+        result = await self.db.execute(stmt)
+        return result.scalars().first()
+
+
+    async def get_term_schedule_slots(self, term_id: str) -> List[Any]:
+        """
+            Every schedule of the term in one query, one row per assigned professor:
+            - schedule_id
+            - class_section_id
+            - section_code
+            - room_id
+            - professor_id (None when no professor is assigned)
+            - day_of_week
+            - start_time
+            - end_time
+        """
+        stmt = (
+            select(
+                ClassSchedule.id.label("schedule_id"),
+                ClassSchedule.class_section_id,
+                ClassSection.section_code,
+                ClassSchedule.room_id,
+                ProfessorClassSection.professor_id,
+                ClassSchedule.day_of_week,
+                ClassSchedule.start_time,
+                ClassSchedule.end_time
+            )
+            .join(ClassSection, ClassSection.id == ClassSchedule.class_section_id)
+            .join(CourseOffering, CourseOffering.id == ClassSection.course_offering_id)
+            .outerjoin(ProfessorClassSection, ProfessorClassSection.class_section_id == ClassSection.id)
+            .where(CourseOffering.term_id == term_id)
+            .order_by(ClassSchedule.day_of_week, ClassSchedule.start_time)
+        )
+
+        result = await self.db.execute(stmt)
+        return result.all()
+
+
+    async def insert_schedules(self, schedules: List[Dict[str, Any]]) -> List[str]:
+        """
+            Insert many schedules (class_section_id, room_id, day_of_week,
+            start_time, end_time) with one statement per chunk.
+            Does not commit. Returns the new ids in the order of schedules.
+        """
+        ids: List[str] = []
         
+        for chunk in chunked(schedules, SCHEDULE_INSERT_CHUNK_SIZE):
+            rows = [
+                {"id": str(uuid.uuid4()), "created_at": datetime.now(timezone.utc), **schedule}
+                for schedule in chunk
+            ]
+            await self.db.execute(insert(ClassSchedule), rows)
+            ids.extend(row["id"] for row in rows)
         
+        return ids
+
+
     async def list_class_schedule_by_section(self, class_section_id: str) -> List[ClassSchedule]:
         stmt = select(ClassSchedule).where(
             ClassSchedule.class_section_id == class_section_id
         )
-        
+
         result = await self.db.execute(stmt)
         return result.scalars().all()
-        
\ No newline at end of file
+
@@ -2,13 +2,20 @@
     Date Written: 12/24/2025 at 4:21 PM
 """
 
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import func, select
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import joinedload
 
+from app.models.academic_structures.class_schedule import ClassSchedule
 from app.models.academic_structures.class_section import ClassSection
+from app.models.academic_structures.course import Course
+from app.models.academic_structures.course_offering import CourseOffering
+from app.models.academic_structures.curriculum import Curriculum
+from app.models.academic_structures.curriculum_course import CurriculumCourse
+from app.models.academic_structures.program import Program
 from app.schemas.academic_structure_schema import ClassSectionRequestSchema
-from app.models.enums.academic_structure_state import CourseOfferingStatus, TermStatus
+from app.models.enums.academic_structure_state import ClassSectionStatus, CourseOfferingStatus, TermStatus
 from app.exceptions.customed_exception import *
 
 from app.repository.base_repository import BaseRepository
@@ -90,6 +97,104 @@ class ClassSectionRepository(BaseRepository[ClassSection]):
         return instances
 
 
+    async def reserve_seat(self, class_section_id: str) -> Optional[int]:
+        """
+            Atomically reserve one seat of the class section.
+            The capacity guard is part of the UPDATE itself so concurrent
+            enrollments cannot overbook the section.
+            
+            Does not commit. The caller commits the reservation together
+            with the enrollment insert so a failed insert releases the seat.
+            
+            Returns the new current_student_cnt or None if the section is full.
+        """
+        stmt = (
+            update(ClassSection)
+            .where(
+                ClassSection.id == class_section_id,
+                ClassSection.current_student_cnt < ClassSection.student_capacity
+            )
+            .values(current_student_cnt=ClassSection.current_student_cnt + 1)
+            .returning(ClassSection.current_student_cnt)
+            .execution_options(synchronize_session="fetch")
+        )
+        
+        result = await self.db.execute(stmt)
+        return result.scalar_one_or_none()
+    
+    
+    async def release_seats(self, class_section_id: str, count: int = 1) -> None:
+        """
+            Give back reserved seats of the class section (never below 0).
+            Does not commit, same as reserve_seat.
+        """
+        stmt = (
+            update(ClassSection)
+            .where(ClassSection.id == class_section_id)
+            .values(
+                current_student_cnt=func.greatest(ClassSection.current_student_cnt - count, 0)
+            )
+            .execution_options(synchronize_session="fetch")
+        )
+        
+        await self.db.execute(stmt)
+
+
+    async def reserve_seat_batch(self, class_section_ids: List[str]) -> List[str]:
+        """
+            Atomically reserve one seat of each class section (batch enrollment).
+            The rows are locked in id order first so concurrent batches over
+            overlapping sections cannot deadlock each other.
+
+            Does not commit, same as reserve_seat.
+
+            Returns the ids of the sections that got a seat (the rest are full).
+        """
+        if not class_section_ids:
+            return []
+
+        await self.db.execute(
+            select(ClassSection.id)
+            .where(ClassSection.id.in_(class_section_ids))
+            .order_by(ClassSection.id)
+            .with_for_update()
+        )
+
+        stmt = (
+            update(ClassSection)
+            .where(
+                ClassSection.id.in_(class_section_ids),
+                ClassSection.current_student_cnt < ClassSection.student_capacity
+            )
+            .values(current_student_cnt=ClassSection.current_student_cnt + 1)
+            .returning(ClassSection.id)
+            .execution_options(synchronize_session="fetch")
+        )
+
+        result = await self.db.execute(stmt)
+        return list(result.scalars().all())
+
+
+    async def release_seat_batch(self, class_section_ids: List[str]) -> None:
+        """
+            Give back one reserved seat of each class section (never below 0).
+            Does not commit, same as reserve_seat.
+        """
+        if not class_section_ids:
+            return
+
+        stmt = (
+            update(ClassSection)
+            .where(ClassSection.id.in_(class_section_ids))
+            .values(
+                current_student_cnt=func.greatest(ClassSection.current_student_cnt - 1, 0)
+            )
+            .execution_options(synchronize_session="fetch")
+        )
+
+        await self.db.execute(stmt)
+
+
     async def current_student_count(self, class_section_id: str) -> int:
         stmt = (
             select(func.count(Enrollment.id))
@@ -100,10 +205,125 @@ class ClassSectionRepository(BaseRepository[ClassSection]):
         return result.scalar_one()
 
 
+    @staticmethod
+    def class_section_details_options() -> tuple:
+        """
+            Eager loading of the class section detail tree in the same query:
+            section -> offering -> term / curriculum course -> course / curriculum
+            -> program -> department (LEFT OUTER JOINs, missing links stay None).
+        """
+        course_offering = joinedload(ClassSection.course_offering)
+        curriculum_course = course_offering.joinedload(CourseOffering.curriculum_course)
+        
+        return (
+            course_offering.joinedload(CourseOffering.term),
+            curriculum_course.joinedload(CurriculumCourse.course),
+            curriculum_course
+                .joinedload(CurriculumCourse.curriculum)
+                .joinedload(Curriculum.program)
+                .joinedload(Program.department),
+        )
+    
+    
+    async def get_class_section_details(self, class_section_ids: List[str]) -> List[ClassSection]:
+        """
+            Read model of many class sections at once with their full detail
+            tree loaded (see class_section_details_options), one query.
+        """
+        if not class_section_ids:
+            return []
+        
+        stmt = (
+            select(ClassSection)
+            .options(*self.class_section_details_options())
+            .where(ClassSection.id.in_(class_section_ids))
+            .order_by(ClassSection.section_code)
+            .execution_options(populate_existing=True)
+        )
+        
+        result = await self.db.execute(stmt)
+        return result.scalars().unique().all()
+    
+    
+    async def get_class_section_detail(self, class_section_id: str) -> Optional[ClassSection]:
+        class_sections = await self.get_class_section_details([class_section_id])
+        return class_sections[0] if class_sections else None
+    
+    
+    async def get_scheduling_facts(self, class_section_ids: List[str]) -> List[Any]:
+        """
+            What scheduling needs to know of many class sections, one query:
+            - class_section_id
+            - section_code
+            - section_status
+            - course_offering_status
+            - term_id
+        """
+        if not class_section_ids:
+            return []
+        
+        stmt = (
+            select(
+                ClassSection.id.label("class_section_id"),
+                ClassSection.section_code,
+                ClassSection.status.label("section_status"),
+                CourseOffering.status.label("course_offering_status"),
+                CourseOffering.term_id
+            )
+            .join(CourseOffering, CourseOffering.id == ClassSection.course_offering_id)
+            .where(ClassSection.id.in_(class_section_ids))
+        )
+        
+        result = await self.db.execute(stmt)
+        return result.all()
+    
+    
+    async def get_unscheduled_sections(self, term_id: str) -> List[Any]:
+        """
+            Open class sections of approved course offerings of the term
+            without any schedule yet, one query:
+            - class_section_id
+            - section_code
+            - student_capacity
+            - units (of the course)
+        """
+        has_schedule = (
+            select(ClassSchedule.id)
+            .where(ClassSchedule.class_section_id == ClassSection.id)
+            .exists()
+        )
+        
+        stmt = (
+            select(
+                ClassSection.id.label("class_section_id"),
+                ClassSection.section_code,
+                ClassSection.student_capacity,
+                Course.units
+            )
+            .join(CourseOffering, CourseOffering.id == ClassSection.course_offering_id)
+            .join(CurriculumCourse, CurriculumCourse.id == CourseOffering.curriculum_course_id)
+            .join(Course, Course.id == CurriculumCourse.course_id)
+            .where(
+                CourseOffering.term_id == term_id,
+                CourseOffering.status == CourseOfferingStatus.APPROVED,
+                ClassSection.status == ClassSectionStatus.OPEN,
+                ~has_schedule
+            )
+            .order_by(ClassSection.section_code)
+        )
+        
+        result = await self.db.execute(stmt)
+        return result.all()
+    
+    
     async def list_class_sections_by_course_offering(self, course_offering_id: str) -> List[ClassSection]:
-        stmt = select(ClassSection).where(
-            ClassSection.course_offering_id == course_offering_id
+        """Class sections of the course offering with their detail tree loaded."""
+        stmt = (
+            select(ClassSection)
+            .options(*self.class_section_details_options())
+            .where(ClassSection.course_offering_id == course_offering_id)
+            .execution_options(populate_existing=True)
         )
         
         result = await self.db.execute(stmt)
-        return result.scalars().all()
+        return result.scalars().unique().all()
@@ -2,7 +2,7 @@
     Date Written: 12/24/2025 at 6:48 PM
 """
 
-from typing import List
+from typing import Dict, List
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -161,5 +161,22 @@ class ProfessorClassSectionRepository(BaseRepository[ProfessorClassSection]):
         )
         
         link = result.scalars().first()
-        return link.professor_id
+        return link.professor_id if link else None
+    
+    
+    async def get_professor_ids_by_sections(self, class_section_ids: List[str]) -> Dict[str, List[str]]:
+        """Professor ids assigned to each of the class sections, one query."""
+        if not class_section_ids:
+            return {}
+        
+        result = await self.db.execute(
+            select(ProfessorClassSection.class_section_id, ProfessorClassSection.professor_id).where(
+                ProfessorClassSection.class_section_id.in_(class_section_ids)
+            )
+        )
+        
+        professor_ids: Dict[str, List[str]] = {}
+        for class_section_id, professor_id in result.all():
+            professor_ids.setdefault(class_section_id, []).append(professor_id)
+        return professor_ids
         
\ No newline at end of file
@@ -0,0 +1,72 @@
+"""
+    Date Written: 10/20/2026 at 5:00 AM
+"""
+
+from datetime import datetime
+from typing import Iterable, Optional
+
+from sqlalchemy import delete, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.repository.base_repository import BaseRepository
+from app.models.academic_structures.timetable_solver_job import TimetableSolverJob
+from app.models.enums.academic_structure_state import TimetableJobStatus
+
+ACTIVE_STATUSES = (TimetableJobStatus.QUEUED, TimetableJobStatus.RUNNING)
+
+
+class TimetableSolverJobRepository(BaseRepository[TimetableSolverJob]):
+    def __init__(self, db: AsyncSession) -> None:
+        super().__init__(TimetableSolverJob, db)
+
+
+    async def transition(
+        self, job_id: str, from_statuses: Iterable[TimetableJobStatus], **values
+    ) -> Optional[TimetableSolverJob]:
+        """
+            Update the job only while its status is one of from_statuses
+            (UPDATE ... WHERE status IN ... RETURNING), None when another
+            request or worker moved it first. Committed at once.
+        """
+        stmt = (
+            update(TimetableSolverJob)
+            .where(
+                TimetableSolverJob.id == job_id,
+                TimetableSolverJob.status.in_(list(from_statuses))
+            )
+            .values(**values)
+            .returning(TimetableSolverJob)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.db.execute(stmt)
+        job = result.scalars().first()
+        await self.db.commit()
+        return job
+
+
+    async def fail_stale_jobs(self, term_id: str, heartbeat_before: datetime, completed_at: datetime) -> int:
+        """Fail the running jobs of the term whose worker stopped sending heartbeats."""
+        stmt = (
+            update(TimetableSolverJob)
+            .where(
+                TimetableSolverJob.term_id == term_id,
+                TimetableSolverJob.status.in_(ACTIVE_STATUSES),
+                TimetableSolverJob.heartbeat_at < heartbeat_before
+            )
+            .values(
+                status=TimetableJobStatus.FAILED,
+                error="The worker running the timetable solver job stopped.",
+                completed_at=completed_at
+            )
+        )
+        result = await self.db.execute(stmt)
+        await self.db.commit()
+        return result.rowcount
+
+
+    async def delete_expired_jobs(self, completed_before: datetime) -> int:
+        """Delete the finished jobs (and their proposals) past their time to live."""
+        stmt = delete(TimetableSolverJob).where(TimetableSolverJob.completed_at < completed_before)
+        result = await self.db.execute(stmt)
+        await self.db.commit()
+        return result.rowcount
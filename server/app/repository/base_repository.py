@@ -7,6 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update, delete, func
 
 from app.db.base import Base
+from app.db.entity_loader import get_entity_loader
 
 ModelType = TypeVar("ModelType", bound=Base)
 
@@ -48,11 +49,17 @@ class BaseRepository(Generic[ModelType]):
     # READ
     # ============================================
     async def get_by_id(self, id: str) -> Optional[ModelType]:
-        """Get single record by ID."""
-        result = await self.db.execute(
-            select(self.model).where(self.model.id == id)
-        )
-        return result.scalars().first()
+        """
+            Get single record by ID.
+            Goes through the request-scoped loader: repeated lookups of the
+            same id are memoized and concurrent lookups share one IN query.
+        """
+        return await get_entity_loader(self.db, self.model).load(id)
+    
+    
+    async def get_many_by_id(self, ids: List[str]) -> List[Optional[ModelType]]:
+        """Get records by IDs in one query (None for the missing ones), in the order of ids."""
+        return await get_entity_loader(self.db, self.model).load_many(ids)
     
     
     async def get_by_field(self, field: str, value: Any) -> Optional[ModelType]:
@@ -123,6 +130,7 @@ class BaseRepository(Generic[ModelType]):
         
         await self.db.commit()
         await self.db.refresh(instance)
+        get_entity_loader(self.db, self.model).evict(id)
         return instance
     
     
@@ -147,6 +155,7 @@ class BaseRepository(Generic[ModelType]):
         
         await self.db.delete(instance)
         await self.db.commit()
+        get_entity_loader(self.db, self.model).evict(id)
         return True
     
     
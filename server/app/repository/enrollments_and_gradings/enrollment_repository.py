@@ -2,7 +2,10 @@
     Date Written: 12/26/2025 at 4:22 PM
 """
 
+import uuid
+from datetime import datetime, timezone
 from sqlalchemy import case, func, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import aliased
 from typing import Any, List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -25,6 +28,10 @@ from app.models.academic_structures.course import Course
 from app.models.academic_structures.professor_class_section import ProfessorClassSection
 from app.models.academic_structures.term import Term
 from app.models.locations.room import Room
+from app.utils.chunking import chunked
+
+# ids per IN (...) list, keeps large bulk operations under the bind parameter limit
+ID_CHUNK_SIZE = 5000
 
 
 class EnrollmentRepository(BaseRepository[Enrollment]):
@@ -32,9 +39,9 @@ class EnrollmentRepository(BaseRepository[Enrollment]):
         super().__init__(Enrollment, db)
         
         
-    async def get_all_enrollments(self) -> List[Any]:
+    def _enrollment_details_stmt(self):
         """
-            Return all the enrollments with the rows needed:
+            Base statement of the flattened enrollment view with the rows needed:
             - enrollment_id
             - student_id
             - student_first_name
@@ -126,17 +133,225 @@ class EnrollmentRepository(BaseRepository[Enrollment]):
             )
             .outerjoin(ProfessorTbl, ProfessorTbl.id == ProfessorClassSection.professor_id)
             .outerjoin(ProfessorUser, ProfessorUser.id == ProfessorTbl.id)
-            .order_by(
-                Enrollment.created_at.desc(),
-                Course.course_code,
-                ClassSection.section_code
-            )
+        )
+        
+        return stmt
+        
+        
+    async def get_all_enrollments(self) -> List[Any]:
+        """
+            Return all the enrollments (see _enrollment_details_stmt for the rows).
+        """
+        stmt = self._enrollment_details_stmt().order_by(
+            Enrollment.created_at.desc(),
+            Course.course_code,
+            ClassSection.section_code
         )
     
         result = await self.db.execute(stmt)
         return result.all()
         
         
+    async def get_enrollment_details(self, enrollment_ids: List[str]) -> List[Any]:
+        """
+            Return the flattened enrollment rows of the given enrollment ids only
+            (queried in chunks of ID_CHUNK_SIZE ids).
+        """
+        rows: List[Any] = []
+        
+        for chunk in chunked(enrollment_ids, ID_CHUNK_SIZE):
+            stmt = (
+                self._enrollment_details_stmt()
+                .where(Enrollment.id.in_(chunk))
+                .order_by(
+                    Course.course_code,
+                    ClassSection.section_code
+                )
+            )
+            
+            result = await self.db.execute(stmt)
+            rows.extend(result.all())
+        
+        return rows
+
+
+    def _enrollment_eligibility_stmt(self, student_id: str):
+        """
+            Every eligibility fact of a student enrollment per class section:
+            - class_section_id
+            - section_code
+            - section_status
+            - student_capacity
+            - current_student_cnt
+            - course_offering_status
+            - term_id
+            - term_status
+            - student_exists
+            - already_enrolled
+            - curriculum_compatible
+        """
+        already_enrolled = (
+            select(Enrollment.id)
+            .where(
+                Enrollment.student_id == student_id,
+                Enrollment.class_section_id == ClassSection.id
+            )
+            .exists()
+        )
+        curriculum_compatible = (
+            select(Curriculum.id)
+            .join(CurriculumCourse, CurriculumCourse.curriculum_id == Curriculum.id)
+            .where(
+                CurriculumCourse.id == CourseOffering.curriculum_course_id,
+                Curriculum.program_id == Student.program_id
+            )
+            .exists()
+        )
+
+        stmt = (
+            select(
+                ClassSection.id.label("class_section_id"),
+                ClassSection.section_code,
+                ClassSection.status.label("section_status"),
+                ClassSection.student_capacity,
+                ClassSection.current_student_cnt,
+                CourseOffering.status.label("course_offering_status"),
+                Term.id.label("term_id"),
+                Term.status.label("term_status"),
+                Student.id.isnot(None).label("student_exists"),
+                already_enrolled.label("already_enrolled"),
+                curriculum_compatible.label("curriculum_compatible")
+            )
+            .select_from(ClassSection)
+            .join(CourseOffering, CourseOffering.id == ClassSection.course_offering_id)
+            .join(Term, Term.id == CourseOffering.term_id)
+            .outerjoin(Student, Student.id == student_id)
+        )
+
+        return stmt
+
+
+    async def get_enrollment_eligibility(self, student_id: str, class_section_id: str) -> Optional[Any]:
+        """
+            Eligibility facts of one enrollment in a single query
+            (see _enrollment_eligibility_stmt for the rows).
+            Returns None when the class section does not exist.
+        """
+        stmt = self._enrollment_eligibility_stmt(student_id).where(ClassSection.id == class_section_id)
+
+        result = await self.db.execute(stmt)
+        return result.first()
+
+
+    async def get_enrollment_eligibility_batch(
+        self, student_id: str, class_section_ids: List[str]
+    ) -> List[Any]:
+        """
+            Eligibility facts of many class sections in a single query.
+            Missing class sections have no row.
+        """
+        if not class_section_ids:
+            return []
+
+        stmt = self._enrollment_eligibility_stmt(student_id).where(ClassSection.id.in_(class_section_ids))
+
+        result = await self.db.execute(stmt)
+        return result.all()
+
+
+    async def get_section_schedules(self, class_section_ids: List[str]) -> List[Any]:
+        """
+            Weekly schedules of the given class sections:
+            - class_section_id
+            - section_code
+            - day_of_week
+            - start_time
+            - end_time
+        """
+        if not class_section_ids:
+            return []
+
+        stmt = (
+            select(
+                ClassSchedule.class_section_id,
+                ClassSection.section_code,
+                ClassSchedule.day_of_week,
+                ClassSchedule.start_time,
+                ClassSchedule.end_time
+            )
+            .join(ClassSection, ClassSection.id == ClassSchedule.class_section_id)
+            .where(ClassSchedule.class_section_id.in_(class_section_ids))
+        )
+
+        result = await self.db.execute(stmt)
+        return result.all()
+
+
+    async def get_student_term_schedules(self, student_id: str, term_ids: List[str]) -> List[Any]:
+        """
+            Weekly schedules of the sections the student is enrolled to
+            (not rejected) within the given terms, same rows as
+            get_section_schedules plus the term_id.
+        """
+        if not term_ids:
+            return []
+
+        stmt = (
+            select(
+                Enrollment.term_id,
+                ClassSchedule.class_section_id,
+                ClassSection.section_code,
+                ClassSchedule.day_of_week,
+                ClassSchedule.start_time,
+                ClassSchedule.end_time
+            )
+            .select_from(Enrollment)
+            .join(ClassSection, ClassSection.id == Enrollment.class_section_id)
+            .join(ClassSchedule, ClassSchedule.class_section_id == ClassSection.id)
+            .where(
+                Enrollment.student_id == student_id,
+                Enrollment.term_id.in_(term_ids),
+                Enrollment.status != EnrollmentStatus.REJECTED
+            )
+        )
+
+        result = await self.db.execute(stmt)
+        return result.all()
+
+
+    async def insert_enrollments(self, student_id: str, sections: List[Any]) -> List[Any]:
+        """
+            Insert PENDING enrollments of the student to the given sections
+            (rows with class_section_id and term_id) in one statement.
+            Sections the student got enrolled to concurrently are skipped
+            by the uq_student_section constraint.
+
+            Does not commit. Returns the (id, class_section_id) of the inserted rows.
+        """
+        if not sections:
+            return []
+
+        stmt = (
+            pg_insert(Enrollment)
+            .values([
+                {
+                    "id": str(uuid.uuid4()),
+                    "created_at": datetime.now(timezone.utc),
+                    "status": EnrollmentStatus.PENDING,
+                    "student_id": student_id,
+                    "class_section_id": section.class_section_id,
+                    "term_id": section.term_id
+                }
+                for section in sections
+            ])
+            .on_conflict_do_nothing(constraint="uq_student_section")
+            .returning(Enrollment.id, Enrollment.class_section_id)
+        )
+
+        result = await self.db.execute(stmt)
+        return result.all()
+
+
     async def get_filtered_enrollments(
         self,
         department_id: Optional[str] = None,
@@ -280,37 +495,34 @@ class EnrollmentRepository(BaseRepository[Enrollment]):
         self,
         enrollment_ids: List[str],
         status: EnrollmentStatus
-    ) -> List[Any]:
+    ) -> List[str]:
         """
             Bulk update enrollment status.
             - Skips records that already have the target status
-            - Returns only updated Enrollment rows
+            - Large id lists are updated in chunks of ID_CHUNK_SIZE,
+              all in one transaction (single commit)
+            - Returns only the ids of the updated enrollments
         """
-        # Update only rows that actually need updating
-        stmt = (
-            update(Enrollment)
-            .where(
-                Enrollment.id.in_(enrollment_ids),
-                Enrollment.status != status  # skip if enrollment record status == param status 
+        updated_ids: List[str] = []
+        
+        for chunk in chunked(list(dict.fromkeys(enrollment_ids)), ID_CHUNK_SIZE):
+            # Update only rows that actually need updating
+            stmt = (
+                update(Enrollment)
+                .where(
+                    Enrollment.id.in_(chunk),
+                    Enrollment.status != status  # skip if enrollment record status == param status 
+                )
+                .values(status=status)
+                .returning(Enrollment.id)
+                .execution_options(synchronize_session=False)
             )
-            .values(status=status)
-            .returning(Enrollment)
-        )
-
-        result = await self.db.execute(stmt)
-        # commit the update
-        await self.db.commit()
+            
+            result = await self.db.execute(stmt)
+            updated_ids.extend(result.scalars().all())
         
-        updated_ids = [row[0] for row in result.all()]
-    
-        # Commit the update
         await self.db.commit()
-        
-        # If no rows were updated, return empty list
-        if not updated_ids:
-            return []
-        
-        return await self.get_all_enrollments()
+        return updated_ids
         
     
     async def list_enrollment_by_status(self, enrollment_status: EnrollmentStatus) -> List[Enrollment]:
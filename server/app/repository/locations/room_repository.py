@@ -22,6 +22,16 @@ class RoomRepository(BaseRepository[Room]):
         return result.scalars().all()
 
     
+    async def list_rooms(self, room_ids: List[str] = None) -> List[Room]:
+        """Every room (or the given rooms) ordered by building and room code."""
+        stmt = select(Room).order_by(Room.building_id, Room.room_code)
+        if room_ids is not None:
+            stmt = stmt.where(Room.id.in_(room_ids))
+        
+        result = await self.db.execute(stmt)
+        return result.scalars().all()
+    
+    
     async def list_rooms_by_building(self, building_id: str) -> List[Room]:
         stmt = select(Room).where(
             Room.building_id == building_id
@@ -26,11 +26,13 @@ from app.models.users.professor import Professor
 from app.models.users.base_user import BaseUser
 from app.schemas.enrollments_and_gradings_schema import AllowedEnrollSectionResponseSchema
 from app.models.enums.enrollment_and_grading_state import EnrollmentStatus
+from app.repository.academic_structures.class_section_repository import ClassSectionRepository
 
 
 class StudentRepository(BaseRepository[Student]):
     def __init__(self, db: AsyncSession) -> None:
         super().__init__(Student, db)
+        self.class_section_repo = ClassSectionRepository(db)
         
         
     async def get_student_by_id(self, student_id: str) -> Optional[Student]:
@@ -88,6 +90,7 @@ class StudentRepository(BaseRepository[Student]):
                 Course.units,
                 ClassSection.id.label("class_section_id"),
                 ClassSection.section_code,
+                CourseOffering.term_id,
                 ClassSchedule.day_of_week,
                 ClassSchedule.start_time,
                 ClassSchedule.end_time,
@@ -139,6 +142,7 @@ class StudentRepository(BaseRepository[Student]):
             .order_by(
                 Course.course_code,
                 ClassSection.section_code,
+                CourseOffering.term_id,
                 ClassSchedule.day_of_week,
                 ClassSchedule.start_time
             )
@@ -157,7 +161,8 @@ class StudentRepository(BaseRepository[Student]):
                 start_time=r.start_time,
                 end_time=r.end_time,
                 room_code=r.room_code,
-                assigned_professor=r.assigned_professor
+                assigned_professor=r.assigned_professor,
+                term_id=r.term_id
             )
             for r in result.all()
         ]
@@ -183,6 +188,7 @@ class StudentRepository(BaseRepository[Student]):
                 Course.units,
                 ClassSection.id.label("class_section_id"),
                 ClassSection.section_code,
+                CourseOffering.term_id,
                 ClassSchedule.day_of_week,
                 ClassSchedule.start_time,
                 ClassSchedule.end_time,
@@ -237,6 +243,7 @@ class StudentRepository(BaseRepository[Student]):
             .order_by(
                 Course.course_code,
                 ClassSection.section_code,
+                CourseOffering.term_id,
                 ClassSchedule.day_of_week,
                 ClassSchedule.start_time
             )
@@ -255,7 +262,8 @@ class StudentRepository(BaseRepository[Student]):
                 start_time=r.start_time,
                 end_time=r.end_time,
                 room_code=r.room_code,
-                assigned_professor=r.assigned_professor
+                assigned_professor=r.assigned_professor,
+                term_id=r.term_id
             )
             for r in result.all()
         ]
@@ -285,22 +293,33 @@ class StudentRepository(BaseRepository[Student]):
     
     async def remove_enrollment(self, student_id: str, class_section_id: str) -> bool:
         """
-            Remove enrollment with all conditions in a single query
+            Remove enrollment with all conditions in a single query.
+            The seat reserved on enrollment is given back to the class section
+            in the same transaction.
         """
         try:
-            delete_stmt = delete(Enrollment).where(
-                and_(
-                    Enrollment.class_section_id == class_section_id,
-                    Enrollment.student_id == student_id,
-                    Enrollment.status != EnrollmentStatus.APPROVED,
+            delete_stmt = (
+                delete(Enrollment)
+                .where(
+                    and_(
+                        Enrollment.class_section_id == class_section_id,
+                        Enrollment.student_id == student_id,
+                        Enrollment.status != EnrollmentStatus.APPROVED,
+                    )
                 )
+                .returning(Enrollment.id)
             )
             
             result = await self.db.execute(delete_stmt)
+            deleted_cnt = len(result.all())
+            
+            if deleted_cnt > 0:
+                await self.class_section_repo.release_seats(class_section_id, deleted_cnt)
+                
             await self.db.commit()
             
-            print(f"Deleted {result.rowcount} rows")
-            return result.rowcount > 0
+            print(f"Deleted {deleted_cnt} rows")
+            return deleted_cnt > 0
         except Exception as e:
             print(f"Error during deletion: {e}")
             await self.db.rollback()
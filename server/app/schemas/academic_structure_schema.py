@@ -284,6 +284,106 @@ class ClassScheduleRequestSchema(BaseModel):
     start_time: time
     end_time: time
 
+class ScheduleConflictResponseSchema(BaseModel):
+    """Two overlapping schedules of the same room or professor"""
+    conflict_type: ScheduleConflictType # ROOM | PROFESSOR | SECTION
+    resource_id: str # room id, professor id or class section id
+    day_of_week: int
+    schedule_id: str | None = None
+    class_section_id: str
+    section_code: str
+    start_time: time
+    end_time: time
+    other_schedule_id: str | None = None
+    other_class_section_id: str
+    other_section_code: str
+    other_start_time: time
+    other_end_time: time
+
+
+class ScheduleImportRequestSchema(BaseModel):
+    schedules: List[ClassScheduleRequestSchema] = Field(..., min_length=1, max_length=20000)
+
+
+class ScheduleImportRowResultSchema(BaseModel):
+    """Outcome of one row of a timetable import"""
+    row_number: int
+    class_section_id: str | None = None
+    room_id: str | None = None
+    day_of_week: int | None = None
+    start_time: time | None = None
+    end_time: time | None = None
+    success: bool
+    schedule_id: str | None = None
+    error_code: str | None = None
+    detail: str | None = None
+    conflicts: List[ScheduleConflictResponseSchema] = []
+
+
+class ScheduleImportResponseSchema(BaseModel):
+    term_id: str
+    total_rows: int
+    imported_cnt: int
+    rejected_cnt: int
+    results: List[ScheduleImportRowResultSchema]
+    request_log: GenericResponse | None = None
+
+
+class TimetableSolverRequestSchema(BaseModel):
+    """Search space and time budget of the timetable solver"""
+    days: List[int] = Field(default=[1, 2, 3, 4, 5], min_length=1, max_length=7) # 1=Mon, 7=Sun
+    @field_validator("days")
+    @classmethod
+    def validate_days(key, value):
+        for day in value:
+            if day > 7 or day < 1:
+                raise ValueError(f"Invalid day schedule: {day}")
+        return sorted(set(value))
+    
+    day_start: time = time(7, 0)
+    day_end: time = time(19, 0)
+    meeting_minutes: int = Field(default=90, ge=30, le=300) # length of one weekly meeting
+    slot_step_minutes: int = Field(default=30, ge=5, le=120) # granularity of start times
+    room_ids: List[str] | None = None # every room when not given
+    time_budget_seconds: float = Field(default=10, gt=0)
+    
+    
+class TimetableProposalRowSchema(BaseModel):
+    class_section_id: str
+    section_code: str
+    room_id: str
+    day_of_week: int
+    start_time: time
+    end_time: time
+    
+    
+class TimetableUnassignedSectionSchema(BaseModel):
+    class_section_id: str
+    section_code: str
+    meetings_required: int
+    meetings_assigned: int
+    detail: str
+    
+    
+class TimetableSolverJobResponseSchema(BaseModel):
+    """Background timetable solver job and its proposed schedule"""
+    job_id: str
+    term_id: str
+    status: TimetableJobStatus # QUEUED | RUNNING | DONE | FAILED | COMMITTED | CANCELLED
+    progress: float # 0..1 of the time budget
+    attempts: int
+    sections_total: int
+    meetings_total: int
+    meetings_assigned: int
+    elapsed_seconds: float
+    submitted_at: datetime
+    completed_at: datetime | None = None
+    proposal: List[TimetableProposalRowSchema] = []
+    unassigned: List[TimetableUnassignedSectionSchema] = []
+    error: str | None = None
+    request_log: GenericResponse | None = None
+
+
 class ClassScheduleResponseSchema(BaseModel):
     id: str
     created_at: datetime
@@ -295,4 +395,17 @@ class ClassScheduleResponseSchema(BaseModel):
     room_details: RoomResponseSchema
     
     request_log: GenericResponse | None = None
-    
\ No newline at end of file
+    
+
+
+# ==============================================
+# REFERENCE DATA CACHE SCHEMAS
+# ==============================================
+class ReferenceCacheTableMetricsSchema(BaseModel):
+    size: int
+    hits: int
+    misses: int
+    hit_rate: float | None = None
+    loads: int
+    age_seconds: float | None = None # since the last full load
+    ttl_seconds: float
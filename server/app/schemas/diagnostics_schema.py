@@ -0,0 +1,25 @@
+"""
+    Date Written: 10/20/2026 at 2:55 AM
+"""
+
+from datetime import datetime
+from typing import Any
+from pydantic import BaseModel
+
+
+# ==============================================
+# SLOW QUERY LOG SCHEMAS
+# ==============================================
+class SlowQueryResponseSchema(BaseModel):
+    id: int
+    captured_at: datetime
+    duration_ms: float
+    statement: str
+    parameters: Any # strings and bytes redacted
+    repository_method: str | None = None # Class.method of the repository that ran it
+    route: str | None = None # METHOD /route/{template} of the request
+    plan: Any | None = None # EXPLAIN (FORMAT JSON), sampled, filled in the background
+    explain_error: str | None = None
+
+    class Config:
+        from_attributes = True
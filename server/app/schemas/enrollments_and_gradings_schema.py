@@ -8,7 +8,7 @@ from pydantic import BaseModel, Field, field_validator
 
 from app.schemas.generic_schema import GenericResponse
 from app.models.enums.academic_structure_state import *
-from app.models.enums.enrollment_and_grading_state import EnrollmentStatus
+from app.models.enums.enrollment_and_grading_state import EnrollmentStatus, EnrollmentTicketStatus
 
 class UpdateEnrollmentStatusSchema(BaseModel):
     status: EnrollmentStatus
@@ -42,6 +42,28 @@ class EnrollmentResponseSchema(BaseModel):
         from_attributes = True
         
         
+class BatchEnrollmentRequestSchema(BaseModel):
+    class_section_ids: List[str] = Field(min_length=1, max_length=20)
+
+
+class BatchEnrollmentResultSchema(BaseModel):
+    """Outcome of one class section of a batch enrollment"""
+    class_section_id: str
+    section_code: Optional[str] = None
+    success: bool
+    error_code: Optional[str] = None
+    detail: Optional[str] = None
+    enrollment: Optional[EnrollmentResponseSchema] = None
+
+
+class BatchEnrollmentResponseSchema(BaseModel):
+    student_id: str
+    enrolled_cnt: int
+    failed_cnt: int
+    results: List[BatchEnrollmentResultSchema]
+    request_log: Optional[GenericResponse] = None
+
+
 class SemesterTermResponseSchema(BaseModel):
     """For term based on semester period"""
     id: str
@@ -69,7 +91,26 @@ class AllowedEnrollSectionResponseSchema(BaseModel):
     end_time: Optional[time] = None
     room_code: Optional[str] = None
     assigned_professor: Optional[str] = None
+    term_id: Optional[str] = None
     
     class Config:
         from_attributes = True
-    
\ No newline at end of file
+        
+
+class EnrollmentTicketErrorSchema(BaseModel):
+    error_code: str
+    detail: str
+    
+    
+class EnrollmentTicketResponseSchema(BaseModel):
+    """Admission queue ticket of an enrollment request"""
+    ticket_id: str
+    status: EnrollmentTicketStatus # QUEUED | RUNNING | DONE | FAILED
+    student_id: str
+    class_section_id: str
+    queue_position: Optional[int] = None # tickets ahead, only while QUEUED
+    submitted_at: datetime
+    completed_at: Optional[datetime] = None
+    enrollment: Optional[EnrollmentResponseSchema] = None
+    error: Optional[EnrollmentTicketErrorSchema] = None
+    request_log: Optional[GenericResponse] = None
@@ -2,7 +2,7 @@
     Date Written: 12/22/2025 at 8:31 PM
 """
 
-from typing import List
+from typing import Dict, List
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from datetime import date, datetime, timezone
@@ -24,6 +24,10 @@ from app.repository.academic_structures.class_section_repository import ClassSec
 from app.repository.academic_structures.professor_class_section_repository import ProfessorClassSectionRepository
 from app.repository.academic_structures.class_schedule_repository import ClassScheduleRepository
 from app.repository.users.professor_repository import ProfessorRepository
+from app.services.schedule_conflict_service import ScheduleConflictService
+from app.services.schedule_import_service import ScheduleImportService
+from app.services.reference_data_cache import TermRef, reference_data_cache
+from app.utils.json_response import models_from_rows
 
 from app.models.academic_structures.term import Term
 from app.models.academic_structures.course_offering import CourseOffering
@@ -68,6 +72,7 @@ class AcademicStructureService:
             - Assign class section professor
             - Assign a schedule to class section
             - List class schedule by section
+            - List schedule conflicts of a term
     """
     def __init__(self, db: AsyncSession):
         self.db = db
@@ -85,6 +90,7 @@ class AcademicStructureService:
         self.prof_class_section_repo = ProfessorClassSectionRepository(db)
         self.class_schedule_repo = ClassScheduleRepository(db)
         self.professor_repo = ProfessorRepository(db)
+        self.schedule_conflict_service = ScheduleConflictService(db)
     
     # ==============================================
     # BUILDING SERVICE METHODS
@@ -107,6 +113,7 @@ class AcademicStructureService:
             name=building_dict["name"],
             room_capacity=building_dict["room_capacity"]
         )
+        reference_data_cache.invalidate("building", register_building.id)
         
         return BuildingResponseSchema(
             id=register_building.id,
@@ -126,21 +133,13 @@ class AcademicStructureService:
         """
             list of buildings (registrar role)
         """
-        payload: List[dict] = []
         buildings: List[Building] = await self.building_repo.get_all()
-        for building in buildings:
-            payload.append(
-                BuildingResponseSchema(
-                    id=building.id,
-                    created_at=building.created_at,
-                    name=building.name,
-                    room_capacity=building.room_capacity,
-                    request_log=GenericResponse(
-                        success=True,
-                        requested_at=datetime.now(timezone.utc),
-                    )
-                )
-            )
+        
+        # one validation pass over the rows, one request log for the whole list
+        payload: List[BuildingResponseSchema] = models_from_rows(
+            BuildingResponseSchema, buildings,
+            request_log=GenericResponse(success=True, requested_at=datetime.now(timezone.utc))
+        )
             
         return payload        
         
@@ -153,26 +152,34 @@ class AcademicStructureService:
     ) -> List[RoomResponseSchema]:
         response: List[RoomResponseSchema] = []
         
-        for room in rooms:
-            building: Building = await self.building_repo.get_by_id(room.building_id)
+        # buildings from the reference data cache, one query at most for the misses
+        buildings = await reference_data_cache.buildings.get_many(self.db, [room.building_id for room in rooms])
+        
+        # one request log for the whole list, one building details per building
+        request_log = GenericResponse(
+            success=True,
+            requested_at=datetime.now(timezone.utc),
+            requested_by=requested_by,
+            description="Register room"
+        )
+        building_details: Dict[str, BuildingResponseSchema] = {}
+        
+        for room, building in zip(rooms, buildings):
             if building:
+                if building.id not in building_details:
+                    building_details[building.id] = BuildingResponseSchema(
+                        id=building.id,
+                        created_at=building.created_at,
+                        name=building.name,
+                        room_capacity=building.room_capacity
+                    )
                 response.append(
                     RoomResponseSchema(
                         id=str(room.id),
                         created_at=room.created_at,
                         room_code=room.room_code,
-                        building_details=BuildingResponseSchema(
-                            id=building.id,
-                            created_at=building.created_at,
-                            name=building.name,
-                            room_capacity=building.room_capacity    
-                        ),
-                        request_log=GenericResponse(
-                            success=True,
-                            requested_at=datetime.now(timezone.utc),
-                            requested_by=requested_by,
-                            description=f"Register room {room.room_code}"
-                        )
+                        building_details=building_details[building.id],
+                        request_log=request_log
                     )
                 )
             
@@ -205,6 +212,8 @@ class AcademicStructureService:
             raise UnprocessibleContentException(
                 "Room registration failed. Try again."
             )
+        for room in registered_rooms:
+            reference_data_cache.invalidate("room", room.id)
         
         return await self.format_room_response(requested_by=requested_by, rooms=registered_rooms)
         
@@ -240,6 +249,7 @@ class AcademicStructureService:
             department_code=department_dict["department_code"].upper(),
             description=department_dict["description"]
         )
+        reference_data_cache.invalidate("department", register_department.id)
         
         return DepartmentResponseSchema(
             id=register_department.id,
@@ -296,7 +306,7 @@ class AcademicStructureService:
             raise InvalidRequestException(f"Assignation of department failed.")
         
         # find the building if exist
-        building = await self.building_repo.get_by_id(building_id)
+        building = await reference_data_cache.buildings.get(self.db, building_id)
         if not building:
             raise ResourceNotFoundException(f"Building not found using id: {building_id}.")
         
@@ -305,6 +315,7 @@ class AcademicStructureService:
             id=department_id,
             building_id=building_id
         )
+        reference_data_cache.invalidate("department", department_id)
         
         return GenericResponse(
                 success=True,
@@ -322,8 +333,11 @@ class AcademicStructureService:
     ) -> List[ProgramResponseSchema]:
         response: List[ProgramResponseSchema] = []
         
-        for program in programs:
-            department: Department = await self.department_repo.get_by_id(program.department_id)
+        departments = await reference_data_cache.departments.get_many(
+            self.db, [program.department_id for program in programs]
+        )
+        
+        for program, department in zip(programs, departments):
             if department:
                 response.append(
                     ProgramResponseSchema(
@@ -376,6 +390,8 @@ class AcademicStructureService:
             raise UnprocessibleContentException(
                 "Program registration failed. Try again."
             )
+        for program in registered_programs:
+            reference_data_cache.invalidate("program", program.id)
         
         return await self.format_program_response(programs=registered_programs, requested_by=requested_by)            
     
@@ -394,13 +410,13 @@ class AcademicStructureService:
     async def format_curriculum_response(
         self, program_id: str, curriculum: Curriculum, requested_by: str = None
     ) -> CurriculumResponseSchema:
-        program: Program = await self.program_repo.get_by_id(program_id)
+        program = await reference_data_cache.programs.get(self.db, program_id)
         if program is None:
             raise InvalidRequestException(
                 f"Curriculum registration failed. Program id {program_id} not found."
             )
             
-        department: Department = await self.department_repo.get_by_id(program.department_id)
+        department = await reference_data_cache.departments.get(self.db, program.department_id)
         if department is None:
             raise ResourceNotFoundException(f"Department from {program.title} not found.")
         
@@ -458,6 +474,7 @@ class AcademicStructureService:
         
         if curriculum is None:
             raise InvalidRequestException(f"Curriculum {curriculum_dict['curriculum_title']} registration failed.")
+        reference_data_cache.invalidate("curriculum", register_curriculum.id)
         
         return await self.format_curriculum_response(
             program_id=curriculum_dict["program_id"], curriculum=register_curriculum, requested_by=requested_by
@@ -497,6 +514,7 @@ class AcademicStructureService:
             id=id,
             status=status
         )
+        reference_data_cache.invalidate("curriculum", id)
         
         return GenericResponse(
                 success=True,
@@ -552,6 +570,8 @@ class AcademicStructureService:
             raise UnprocessibleContentException(
                 "Course registration failed. Try again."
             )
+        for course in registered_courses:
+            reference_data_cache.invalidate("course", course.id)
         
         response: List[CourseResponseSchema] = []
         
@@ -606,13 +626,13 @@ class AcademicStructureService:
         curriculum_course: CurriculumCourse, 
         requested_by: str = None
     ) -> CurriculumCourseResponseSchema:
-        curriculum: Curriculum = await self.curriculum_repo.get_by_id(curriculum_course.curriculum_id)
+        curriculum = await reference_data_cache.curricula.get(self.db, curriculum_course.curriculum_id)
         if curriculum is None:
             raise ResourceNotFoundException(
                 f"Curriculum course registration failed. Curriculum {curriculum_course.curriculum_id} not found."
             )
             
-        course: Course = await self.course_repo.get_by_id(curriculum_course.course_id)
+        course = await reference_data_cache.courses.get(self.db, curriculum_course.course_id)
         if course is None:
             raise ResourceNotFoundException(
                 f"Curriculum course registration failed. Course {curriculum_course.course_id} not found."
@@ -737,6 +757,8 @@ class AcademicStructureService:
             raise UnprocessibleContentException(
                 "Term registration failed. Try again."
             )
+        for term in registered_terms:
+            reference_data_cache.invalidate("term", term.id)
         
         response: List[TermResponseSchema] = []
         
@@ -796,6 +818,7 @@ class AcademicStructureService:
             id=id,
             status=status
         )
+        reference_data_cache.invalidate("term", id)
         
         return GenericResponse(
                 success=True,
@@ -885,7 +908,7 @@ class AcademicStructureService:
     async def format_course_offering_response(
         self, 
         course_offering: CourseOffering, 
-        term: Term,
+        term: TermRef,
         curriculum_course_response: CurriculumCourseResponseSchema,
         requested_by: str = None
     ) -> CourseOfferingResponseSchema:
@@ -940,7 +963,7 @@ class AcademicStructureService:
                 f"id {course_offering_dict['curriculum_course_id']}."
             )
             
-        term: Term = await self.term_repo.get_by_id(course_offering_dict['term_id'])
+        term = await reference_data_cache.terms.get(self.db, course_offering_dict['term_id'])
         if term is None:
             return InvalidRequestException(
                 f"Course offering registration failed due to invalid curriculum course "
@@ -973,7 +996,7 @@ class AcademicStructureService:
         payload: List[dict] = []
         course_offerings: List[CourseOffering] = await self.course_offering_repo.list_course_offering_by_term(term_id)
         for course_offering in course_offerings:
-            term: Term = await self.term_repo.get_by_id(course_offering.term_id)
+            term = await reference_data_cache.terms.get(self.db, course_offering.term_id)
             
             curriculum_course: CurriculumCourse = await self.curriculum_course_repo.get_by_id(
                 course_offering.curriculum_course_id
@@ -1045,34 +1068,40 @@ class AcademicStructureService:
     async def format_class_section_response(
         self, 
         class_section: ClassSection,
-        course_offering: CourseOffering,
         description: str = None,
         error_description: str = None,
         requested_by: str = None
     ) -> ClassSectionResponseSchema:
-        term: Term = await self.term_repo.get_by_id(course_offering.term_id)
+        """
+            Build the class section response from its loaded detail tree.
+            class_section must come from the class section read model
+            (ClassSectionRepository.get_class_section_details), no query is made here.
+        """
+        course_offering: CourseOffering = class_section.course_offering
+        if course_offering is None:
+            raise InvalidRequestException(f"Class section {error_description} failed due to course offering issue.")
+        
+        term: Term = course_offering.term
         if term is None:
             raise InvalidRequestException(f"Class section {error_description} failed due to term issue.")
         
-        curriculum_course: CurriculumCourse = await self.curriculum_course_repo.get_by_id(
-            course_offering.curriculum_course_id
-        )
+        curriculum_course: CurriculumCourse = course_offering.curriculum_course
         if curriculum_course is None:
             raise InvalidRequestException(f"Class section {error_description} failed due to curriculum course issue.")
         
-        course: Course = await self.course_repo.get_by_id(curriculum_course.course_id)
+        course: Course = curriculum_course.course
         if course is None:
             raise InvalidRequestException(f"Class section {error_description} failed due to course issue.")
         
-        curriculum: Curriculum = await self.curriculum_repo.get_by_id(curriculum_course.curriculum_id)
+        curriculum: Curriculum = curriculum_course.curriculum
         if curriculum is None:
             raise InvalidRequestException(f"Class section {error_description} failed due to curriculum issue.")
         
-        program: Program = await self.program_repo.get_by_id(curriculum.program_id)
+        program: Program = curriculum.program
         if program is None:
             raise InvalidRequestException(f"Class section {error_description} failed due to program issue.")
         
-        department: Department = await self.department_repo.get_by_id(program.department_id)
+        department: Department = program.department
         if department is None:
             raise InvalidRequestException(f"Class section {error_description} failed due to department issue.")
         
@@ -1179,13 +1208,16 @@ class AcademicStructureService:
                 "Class section registration failed. Try again."
             )
         
+        # read model of the registered sections (one query for the whole detail tree)
+        registered_class_sections = await self.class_section_repo.get_class_section_details(
+            [class_section.id for class_section in registered_class_sections]
+        )
         response: List[ClassSectionResponseSchema] = []
         
         for class_section in registered_class_sections:
             response.append(
                 await self.format_class_section_response(
                     class_section=class_section,
-                    course_offering=course_offering,
                     description=f"Register class section {class_section.section_code}",
                     error_description="registration",
                     requested_by=requested_by
@@ -1212,7 +1244,6 @@ class AcademicStructureService:
             response.append(
                 await self.format_class_section_response(
                     class_section=class_section,
-                    course_offering=course_offering,
                 )
             )
             
@@ -1234,9 +1265,9 @@ class AcademicStructureService:
             - Professor must be ACTIVE
             - No duplicate assignment (handled by UniqueConstraint)
         """
-        # Validate that all class sections exist
-        for class_section_id in class_section_ids:
-            class_section = await self.class_section_repo.get_by_id(class_section_id)
+        # Validate that all class sections exist (one query for all of them)
+        class_sections = await self.class_section_repo.get_many_by_id(class_section_ids)
+        for class_section_id, class_section in zip(class_section_ids, class_sections):
             if not class_section:
                 raise ResourceNotFoundException(
                     f"Class section with id: {class_section_id} not found"
@@ -1273,16 +1304,17 @@ class AcademicStructureService:
         # Build response
         response: List[ProfessorClassSectionResponseSchema] = []
         
+        # read model of the assigned class sections (one query for the whole detail tree)
+        class_sections: Dict[str, ClassSection] = {
+            class_section.id: class_section
+            for class_section in await self.class_section_repo.get_class_section_details(class_section_ids)
+        }
+        
         for assignment in detailed_assignments:
-            course_offering: CourseOffering = await self.course_offering_repo.get_by_id(
-                assignment.course_offering_id
-            )
-            
-            term: Term = await self.term_repo.get_by_id(course_offering.term_id)
-            
-            curriculum_course: CurriculumCourse = await self.curriculum_course_repo.get_by_id(
-                course_offering.curriculum_course_id
-            )
+            class_section: ClassSection = class_sections[assignment.class_section_id]
+            course_offering: CourseOffering = class_section.course_offering
+            term: Term = course_offering.term
+            curriculum_course: CurriculumCourse = course_offering.curriculum_course
             curriculum_course_response: CurriculumCourseResponseSchema = await self.format_curriculum_course_response(
                 curriculum_course=curriculum_course
             )
@@ -1293,13 +1325,8 @@ class AcademicStructureService:
                 curriculum_course_response=curriculum_course_response
             )
             
-            class_section = await self.class_section_repo.get_by_id(
-                assignment.class_section_id
-            )
-            
             class_section_response: ClassSectionResponseSchema = await self.format_class_section_response(
-                    class_section=class_section,
-                    course_offering=course_offering
+                    class_section=class_section
                 )
             
             response.append(
@@ -1345,27 +1372,35 @@ class AcademicStructureService:
         if start_time >= end_time:
             raise InvalidRequestException("Start time must be before end time")
     
-    async def validate_room_conflict(self, room_id: str, day_of_week: int, start_time: time, end_time: time):
-        # Check if any existing schedule in this room overlaps with requested time
-        existing_schedules: List[ClassSchedule] = await self.class_schedule_repo.get_schedules_by_room(room_id, day_of_week)
-        for sched in existing_schedules:
-            if (start_time < sched.end_time) and (end_time > sched.start_time):
-                raise InvalidRequestException(f"Room {room_id} is already booked from {sched.start_time} to {sched.end_time}")
+    async def validate_room_conflict(
+        self, room_id: str, term_id: str, day_of_week: int, start_time: time, end_time: time
+    ):
+        # Check if any existing schedule of the term in this room overlaps with requested time
+        # (start < other_end) AND (end > other_start), answered by the database
+        sched: ClassSchedule = await self.schedule_conflict_service.find_room_conflict(
+            room_id, term_id, day_of_week, start_time, end_time
+        )
+        if sched is not None:
+            raise InvalidRequestException(f"Room {room_id} is already booked from {sched.start_time} to {sched.end_time}")
     
-    async def validate_professor_conflict(self, class_section_id: str, day_of_week: int, start_time: time, end_time: time):
+    async def validate_professor_conflict(
+        self, class_section_id: str, term_id: str, day_of_week: int, start_time: time, end_time: time
+    ):
         # Get professor assigned to this class section
         professor_id = await self.prof_class_section_repo.get_professor_id(class_section_id)
         if not professor_id:
             raise ResourceNotFoundException("No professor assigned to class section")
         
-        existing_schedules: List[ClassSchedule] = await self.class_schedule_repo.get_schedules_by_professor(professor_id, day_of_week)
-        for sched in existing_schedules:
-            if (start_time < sched.end_time) and (end_time > sched.start_time):
-                raise InvalidRequestException(
-                    f"Professor {professor_id} has a schedule conflict from {sched.start_time} to {sched.end_time}"
-                )
+        sched: ClassSchedule = await self.schedule_conflict_service.find_professor_conflict(
+            professor_id, term_id, day_of_week, start_time, end_time
+        )
+        if sched is not None:
+            raise InvalidRequestException(
+                f"Professor {professor_id} has a schedule conflict from {sched.start_time} to {sched.end_time}"
+            )
             
     async def validate_term_status(self, term_id: str):
+        # gates schedule writes: read the committed status, not the cached one
         term = await self.term_repo.get_by_id(term_id)
         if term.status != TermStatus.OPEN:
             raise InvalidRequestException(
@@ -1377,11 +1412,11 @@ class AcademicStructureService:
         self, class_schedule: ClassSchedule, class_section_response: ClassSectionResponseSchema,
         requested_by: str = None, description: str = None
     ) -> ClassScheduleResponseSchema:
-        room: Room = await self.room_repo.get_by_id(class_schedule.room_id)
+        room = await reference_data_cache.rooms.get(self.db, class_schedule.room_id)
         if room is None:
             raise ResourceNotFoundException("Room not found.")
         
-        building: Building = await self.building_repo.get_by_id(room.building_id)
+        building = await reference_data_cache.buildings.get(self.db, room.building_id)
         if building is None:
             raise ResourceNotFoundException("Building not found.")
         
@@ -1432,9 +1467,18 @@ class AcademicStructureService:
         # Validate time logic
         await self.validate_time_logic(class_schedule.start_time, class_schedule.end_time)
         
+        # Validate class section (read model, its detail tree is reused for the response)
+        class_section = await self.class_section_repo.get_class_section_detail(class_schedule.class_section_id)
+        if class_section is None:
+            raise ResourceNotFoundException(f"Class section not found with id {class_schedule.class_section_id}.")
+        
+        # conflicts are scoped to the term of the class section
+        term_id = class_section.course_offering.term_id
+        
         # Validate room conflicts
         await self.validate_room_conflict(
             class_schedule.room_id,
+            term_id,
             class_schedule.day_of_week,
             class_schedule.start_time,
             class_schedule.end_time
@@ -1443,20 +1487,19 @@ class AcademicStructureService:
         # Validate professor conflicts
         await self.validate_professor_conflict(
             class_schedule.class_section_id,
+            term_id,
             class_schedule.day_of_week,
             class_schedule.start_time,
             class_schedule.end_time
         )
         
-        # Validate class section
-        class_section = await self.class_section_repo.get_by_id(class_schedule.class_section_id)
         if class_section.status != ClassSectionStatus.OPEN:
             raise InvalidRequestException(
                 f"Invalid request. Class section {class_section.status} currently not open."
             )
         
         # Validate course offering and term
-        course_offering = await self.course_offering_repo.get_course_offering(class_schedule.class_section_id)
+        course_offering = class_section.course_offering
         if course_offering.status != CourseOfferingStatus.APPROVED:
             raise InvalidRequestException(
                 f"Invalid request. Course offering {course_offering.status} currently not yet approved."
@@ -1476,7 +1519,7 @@ class AcademicStructureService:
         
         # format class section response
         class_section_response: ClassSectionResponseSchema = await self.format_class_section_response(
-            class_section=class_section, course_offering=course_offering
+            class_section=class_section
         )
         
         # Build response
@@ -1487,15 +1530,12 @@ class AcademicStructureService:
     
     
     async def list_class_schedule_by_section(self, class_section_id: str) -> List[ClassScheduleResponseSchema]:
-        class_section: ClassSection = await self.class_section_repo.get_by_id(class_section_id)
+        class_section: ClassSection = await self.class_section_repo.get_class_section_detail(class_section_id)
         if class_section is None:
             raise ResourceNotFoundException(f"Class section not found with id {class_section_id}.")
         
-        course_offering: CourseOffering = await self.course_offering_repo.get_by_id(
-            class_section.course_offering_id
-        )
         class_section_response: ClassSectionResponseSchema = await self.format_class_section_response(
-            class_section=class_section, course_offering=course_offering
+            class_section=class_section
         )
         
         class_schedules: List[ClassSchedule] = await self.class_schedule_repo.list_class_schedule_by_section(
@@ -1515,4 +1555,31 @@ class AcademicStructureService:
             )
             
         return payload
+    
+    
+    async def list_term_schedule_conflicts(self, term_id: str) -> List[ScheduleConflictResponseSchema]:
+        """
+            Every room, professor and class section schedule conflict of the term.
+        """
+        return await self.schedule_conflict_service.list_term_conflicts(term_id)
+    
+    
+    async def import_term_schedules(
+        self, term_id: str, schedules: List[ClassScheduleRequestSchema], requested_by: str = None
+    ) -> ScheduleImportResponseSchema:
+        """
+            Bulk import of the term timetable, valid rows are inserted
+            in one transaction and the rest reported with their conflicts.
+        """
+        return await ScheduleImportService(self.db).import_schedules(
+            term_id=term_id, schedules=schedules, requested_by=requested_by
+        )
+    
+    
+    async def import_term_schedule_csv(
+        self, term_id: str, content: bytes, requested_by: str = None
+    ) -> ScheduleImportResponseSchema:
+        return await ScheduleImportService(self.db).import_schedule_csv(
+            term_id=term_id, content=content, requested_by=requested_by
+        )
     
\ No newline at end of file
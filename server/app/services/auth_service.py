@@ -20,6 +20,7 @@ from app.models.users.base_user import BaseUser
 from app.repository.auth_repository import AuthRepository
 from app.models.enums.user_state import UserStatus
 from app.schemas.user_schema import BaseUserRequestSchema, BaseUserResponseSchema
+from app.utils.metrics import auth_bans, auth_failures
 
 logger = logging.getLogger(__name__)
 
@@ -103,22 +104,26 @@ class AuthService:
         try:
             user: Optional[BaseUser] = await self.auth_repo.get_user_by_email(email=email)
             if not user:
+                auth_failures.labels("unknown_email").inc()
                 raise ResourceNotFoundException(f"User with email: {email} not found.")
             
             now = datetime.now(timezone.utc)
             
             # check user status if approved as user
             if not self.validate_user_status(user.status):
+                auth_failures.labels("not_approved").inc()
                 raise UnauthorizedAccessException(f"Please wait for your registration to be approved.")
             
             # Check if user is banned
             if user.banned_until:
                 banned_until_aware = user.banned_until.replace(tzinfo=timezone.utc)
                 if banned_until_aware > now:
+                    auth_failures.labels("banned").inc()
                     raise UnauthorizedAccessException(f"User is banned until {user.banned_until}.")
                 
             # if failed attempts persists due to wrong password, increment failed_attempts attribute
             if not self.validate_password(password, user.password_hash):
+                auth_failures.labels("bad_password").inc()
                 user.failed_attempts += 1
 
                 # Ban user if max attempts reached
@@ -129,6 +134,7 @@ class AuthService:
                     ban_minutes = int(ban_duration.total_seconds() / 60)
                     user.failed_attempts = 0  # reset to avoid stacking bans
                     await self.db.commit()
+                    auth_bans.inc()
                     raise UnauthorizedAccessException(f"Banned for {ban_minutes} minutes")
 
                 await self.db.commit()
@@ -0,0 +1,316 @@
+"""
+    Date Written: 10/19/2026 at 10:30 AM
+"""
+
+import asyncio
+import logging
+import uuid
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from typing import Deque, Dict, List, Optional
+
+from app.configs.settings import settings
+from app.db.db_session import async_session
+from app.exceptions.customed_exception import *
+from app.models.enums.enrollment_and_grading_state import EnrollmentTicketStatus
+from app.schemas.enrollments_and_gradings_schema import *
+from app.schemas.generic_schema import GenericResponse
+from app.services.enrollment_grading_service import EnrollmentGradingService
+
+logger = logging.getLogger(__name__)
+
+
+class EnrollmentTicket:
+    """
+        One enrollment request waiting in (or processed by) the admission queue.
+    """
+    def __init__(
+        self,
+        seq: int,
+        student_id: str,
+        class_section_id: str,
+        requested_by: str,
+        requested_by_id: str
+    ):
+        self.ticket_id = str(uuid.uuid4())
+        self.seq = seq
+        self.student_id = student_id
+        self.class_section_id = class_section_id
+        self.requested_by = requested_by
+        self.requested_by_id = requested_by_id
+
+        self.status = EnrollmentTicketStatus.QUEUED
+        self.submitted_at = datetime.now(timezone.utc)
+        self.completed_at: Optional[datetime] = None
+        self.enrollment: Optional[EnrollmentResponseSchema] = None
+        self.error: Optional[EnrollmentTicketErrorSchema] = None
+
+        # set once the ticket is DONE or FAILED (long-poll waits on it)
+        self.finished = asyncio.Event()
+
+
+class EnrollmentAdmissionQueue:
+    """
+        In-process admission control for enrollment writes.
+            - FIFO queue (fair ordering) bounded by max_size
+            - fixed worker pool, bounds the concurrent enrollment
+              transactions (and DB pool usage) of this process
+            - at most section_concurrency enrollments of the same
+              class section run at the same time: a ticket of a busy
+              section waits in the queue of its section and the workers
+              only take runnable tickets, so a burst on one section
+              does not hold up the other sections
+            - clients poll or long-poll their ticket for the outcome
+    """
+    def __init__(
+        self,
+        workers: int,
+        section_concurrency: int,
+        max_size: int,
+        ticket_ttl_seconds: int,
+        session_factory=async_session
+    ):
+        self.workers = workers
+        self.section_concurrency = section_concurrency
+        self.max_size = max_size
+        self.ticket_ttl = timedelta(seconds=ticket_ttl_seconds)
+        self.session_factory = session_factory
+
+        # runnable tickets, their section has a free slot
+        self._ready: Optional[asyncio.Queue] = None
+        self._worker_tasks: List[asyncio.Task] = []
+        self._tickets: Dict[str, EnrollmentTicket] = {}
+        # QUEUED tickets in submit order (max_size, queue position)
+        self._queued: Dict[str, EnrollmentTicket] = {}
+        # per section: tickets ready or running, tickets waiting for a slot
+        self._section_admitted: Dict[str, int] = {}
+        self._section_waiting: Dict[str, Deque[EnrollmentTicket]] = {}
+        self._submitted_seq = 0
+
+
+    @property
+    def is_running(self) -> bool:
+        return len(self._worker_tasks) > 0
+
+
+    async def start(self) -> None:
+        if self.is_running:
+            return
+
+        self._ready = asyncio.Queue()
+        self._queued = {}
+        self._section_admitted = {}
+        self._section_waiting = {}
+        self._worker_tasks = [
+            asyncio.create_task(self._worker(), name=f"enrollment-queue-worker-{i}")
+            for i in range(self.workers)
+        ]
+        logger.info("Enrollment admission queue started with %s workers.", self.workers)
+
+
+    async def stop(self) -> None:
+        for task in self._worker_tasks:
+            task.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks = []
+
+        # fail the unfinished tickets so pending long-polls return
+        for ticket in self._tickets.values():
+            if not ticket.finished.is_set():
+                self._finish(
+                    ticket, error=ServiceUnavailableException("Enrollment queue stopped. Please try again.")
+                )
+
+
+    # ============================================
+    # CLIENT SIDE
+    # ============================================
+    def submit(
+        self,
+        student_id: str,
+        class_section_id: str,
+        requested_by: str,
+        requested_by_id: str
+    ) -> EnrollmentTicket:
+        """
+            Queue one enrollment request and return its ticket right away.
+        """
+        if not self.is_running:
+            raise ServiceUnavailableException("Enrollment queue is not enabled.")
+
+        self._prune_expired()
+
+        ticket = EnrollmentTicket(
+            seq=self._submitted_seq + 1,
+            student_id=student_id,
+            class_section_id=class_section_id,
+            requested_by=requested_by,
+            requested_by_id=requested_by_id
+        )
+
+        if len(self._queued) >= self.max_size:
+            raise ServiceUnavailableException("Enrollment queue is full. Please try again later.")
+
+        self._submitted_seq = ticket.seq
+        self._tickets[ticket.ticket_id] = ticket
+        self._queued[ticket.ticket_id] = ticket
+        self._admit(ticket)
+        return ticket
+
+
+    def get_ticket(self, ticket_id: str) -> EnrollmentTicket:
+        self._prune_expired()
+
+        ticket = self._tickets.get(ticket_id)
+        if ticket is None:
+            raise ResourceNotFoundException(f"Enrollment ticket not found by id: {ticket_id}.")
+
+        return ticket
+
+
+    async def wait_ticket(self, ticket_id: str, timeout: float = 0) -> EnrollmentTicket:
+        """
+            Long-poll: wait up to timeout seconds for the ticket to finish.
+        """
+        ticket = self.get_ticket(ticket_id)
+
+        if timeout > 0 and not ticket.finished.is_set():
+            try:
+                await asyncio.wait_for(ticket.finished.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+        return ticket
+
+
+    def queue_position(self, ticket: EnrollmentTicket) -> Optional[int]:
+        """Number of tickets submitted before a QUEUED ticket and still waiting."""
+        if ticket.status != EnrollmentTicketStatus.QUEUED:
+            return None
+
+        position = 0
+        for queued in self._queued.values():
+            if queued is ticket:
+                break
+            position += 1
+        return position
+
+
+    def format_ticket_response(
+        self, ticket: EnrollmentTicket, requested_by: str = None
+    ) -> EnrollmentTicketResponseSchema:
+        return EnrollmentTicketResponseSchema(
+            ticket_id=ticket.ticket_id,
+            status=ticket.status,
+            student_id=ticket.student_id,
+            class_section_id=ticket.class_section_id,
+            queue_position=self.queue_position(ticket),
+            submitted_at=ticket.submitted_at,
+            completed_at=ticket.completed_at,
+            enrollment=ticket.enrollment,
+            error=ticket.error,
+            request_log=GenericResponse(
+                success=ticket.status != EnrollmentTicketStatus.FAILED,
+                requested_at=datetime.now(timezone.utc),
+                requested_by=requested_by,
+                description=f"Enrollment ticket {ticket.status.lower()}."
+            )
+        )
+
+
+    # ============================================
+    # WORKER SIDE
+    # ============================================
+    async def _worker(self) -> None:
+        while True:
+            ticket: EnrollmentTicket = await self._ready.get()
+            del self._queued[ticket.ticket_id]
+
+            try:
+                ticket.status = EnrollmentTicketStatus.RUNNING
+                await self._run(ticket)
+            finally:
+                self._release(ticket.class_section_id)
+
+
+    def _admit(self, ticket: EnrollmentTicket) -> None:
+        """
+            Hand the ticket to the workers if its section has a free slot,
+            otherwise park it behind the other tickets of the section.
+        """
+        section_id = ticket.class_section_id
+        admitted = self._section_admitted.get(section_id, 0)
+        if admitted < self.section_concurrency:
+            self._section_admitted[section_id] = admitted + 1
+            self._ready.put_nowait(ticket)
+        else:
+            self._section_waiting.setdefault(section_id, deque()).append(ticket)
+
+
+    def _release(self, section_id: str) -> None:
+        """Give the freed slot to the next waiting ticket of the section."""
+        waiting = self._section_waiting.get(section_id)
+        if waiting:
+            self._ready.put_nowait(waiting.popleft())
+            if not waiting:
+                del self._section_waiting[section_id]
+            return
+
+        self._section_admitted[section_id] -= 1
+        if self._section_admitted[section_id] == 0:
+            del self._section_admitted[section_id]
+
+
+    async def _run(self, ticket: EnrollmentTicket) -> None:
+        try:
+            async with self.session_factory() as db:
+                service = EnrollmentGradingService(db)
+                enrollment = await service.enroll_student_class_section(
+                    student_id=ticket.student_id,
+                    class_section_id=ticket.class_section_id,
+                    requested_by=ticket.requested_by
+                )
+            self._finish(ticket, enrollment=enrollment)
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            if not hasattr(e, "error_code"):
+                logger.error("Queued enrollment %s failed: %s", ticket.ticket_id, str(e))
+                e = InternalServerError("An error occurred during enrollment.")
+            self._finish(ticket, error=e)
+
+
+    def _finish(
+        self,
+        ticket: EnrollmentTicket,
+        enrollment: Optional[EnrollmentResponseSchema] = None,
+        error: Optional[Exception] = None
+    ) -> None:
+        if error is not None:
+            ticket.status = EnrollmentTicketStatus.FAILED
+            ticket.error = EnrollmentTicketErrorSchema(error_code=error.error_code, detail=error.detail)
+        else:
+            ticket.status = EnrollmentTicketStatus.DONE
+            ticket.enrollment = enrollment
+
+        ticket.completed_at = datetime.now(timezone.utc)
+        ticket.finished.set()
+
+
+    def _prune_expired(self) -> None:
+        expired_before = datetime.now(timezone.utc) - self.ticket_ttl
+        expired_ids = [
+            ticket_id for ticket_id, ticket in self._tickets.items()
+            if ticket.completed_at is not None and ticket.completed_at < expired_before
+        ]
+        for ticket_id in expired_ids:
+            del self._tickets[ticket_id]
+
+
+enrollment_admission_queue = EnrollmentAdmissionQueue(
+    workers=settings.ENROLLMENT_QUEUE_WORKERS,
+    section_concurrency=settings.ENROLLMENT_QUEUE_SECTION_CONCURRENCY,
+    max_size=settings.ENROLLMENT_QUEUE_MAX_SIZE,
+    ticket_ttl_seconds=settings.ENROLLMENT_QUEUE_TICKET_TTL_SECONDS
+)
@@ -2,7 +2,10 @@
     Date Written: 12/28/2025 at 9:05 AM
 """
 
-from typing import Any, List
+import logging
+from collections import defaultdict
+from typing import Any, Dict, List
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from datetime import datetime, timezone
@@ -25,6 +28,10 @@ from app.models.academic_structures.class_section import ClassSection
 from app.models.users.student import Student
 from app.models.enrollment_and_gradings.enrollment import Enrollment
 from app.services.academic_structure_service import AcademicStructureService
+from app.utils.json_response import models_from_rows
+from app.utils.weekly_bitset import WeeklyTimetable, section_masks
+
+logger = logging.getLogger(__name__)
 
 
 class EnrollmentGradingService:
@@ -72,6 +79,39 @@ class EnrollmentGradingService:
             )
         
         return allowed_sections
+    
+    
+    async def get_student_fitting_sections(
+        self,
+        student_id: str,
+        requested_by: str
+    ) -> List[AllowedEnrollSectionResponseSchema]:
+        """
+        Read the allowed sections that fit the student's current timetable.
+        Every section is checked in memory against the weekly bitset of the
+        student's sections of its term (one AND per section).
+        """
+        allowed_sections: List[AllowedEnrollSectionResponseSchema] = (
+            await self.student_repo.get_student_allowed_sections(student_id)
+        )
+        
+        masks: Dict[str, int] = section_masks(allowed_sections)
+        timetables = await self._student_timetables(
+            student_id=student_id,
+            term_ids=list({section.term_id for section in allowed_sections})
+        )
+        
+        fitting_sections: List[AllowedEnrollSectionResponseSchema] = [
+            section for section in allowed_sections
+            if timetables[section.term_id].fits(masks[section.class_section_id])
+        ]
+        
+        if not fitting_sections:
+            raise InvalidRequestException(
+                f"No available class sections fitting the timetable found for student {student_id}"
+            )
+        
+        return fitting_sections
         
      
     async def format_enrollment_response(
@@ -79,6 +119,7 @@ class EnrollmentGradingService:
         enrollment: EnrollmentResponseSchema,
         requested_by: str = "",
         description: str = "",
+        request_log: GenericResponse = None
     ) -> EnrollmentResponseSchema:
         return EnrollmentResponseSchema(
             enrollment_id=enrollment.enrollment_id,
@@ -101,7 +142,7 @@ class EnrollmentGradingService:
             program_code=enrollment.program_code,
             student_name=enrollment.student_name,
             assigned_professor=enrollment.assigned_professor,
-            request_log=GenericResponse(
+            request_log=request_log or GenericResponse(
                 success=True,
                 requested_at=datetime.now(timezone.utc),
                 requested_by=requested_by,
@@ -110,124 +151,330 @@ class EnrollmentGradingService:
         )
         
 
-    async def enroll_student_class_section(
-        self,
-        student_id: str,
-        class_section_id: str,
-        requested_by: str
-    ) -> EnrollmentResponseSchema:
-        
+    def _validate_enrollment_eligibility(self, eligibility: Any) -> None:
         """
-            Student enrollment.
-            Validations:
-                Student not already enrolled
-                Section not full
-                ClassSection.status == OPEN
-                CourseOffering.status == APPROVED
-                Term.status == OPEN
-                Curriculum compatibility
-                Update current student count of class section
-
+            Raise the specific enrollment error of an eligibility row
+            (see EnrollmentRepository._enrollment_eligibility_stmt).
         """
+        section_code = eligibility.section_code
+
         # validation: Student not already/currently enrolled to the section
-        enrolled_sections: List[AllowedEnrollSectionResponseSchema] = await self.student_repo.get_student_current_enrolled_section(
-            student_id
-        )
-        
-        for section in enrolled_sections:
-            if section.class_section_id == class_section_id:
-                raise InvalidRequestException(
-                    f"Enrollment failed due to student already enrolled to {section.section_code}."
-                )
+        if eligibility.already_enrolled:
+            raise InvalidRequestException(
+                f"Enrollment failed due to student already enrolled to {section_code}."
+            )
                 
         # validation: section is not full if adding 1 student
-        class_section: ClassSection = await self.class_section_repo.get_by_id(class_section_id)
-        if class_section.current_student_cnt + 1 >= class_section.student_capacity:
+        # (early exit only, the seat reservation is the actual guard)
+        if eligibility.current_student_cnt >= eligibility.student_capacity:
             raise InvalidRequestException(
-                f"Enrollment failed due to class section {class_section.section_code} already full."
+                f"Enrollment failed due to class section {section_code} already full."
             )
         
         # validation: section status must be open
-        if class_section.status != ClassSectionStatus.OPEN:
+        if eligibility.section_status != ClassSectionStatus.OPEN:
             raise InvalidRequestException(
-                f"Enrollment failed due to {class_section.section_code} is currently "
-                f"{class_section.status.lower()}."
+                f"Enrollment failed due to {section_code} is currently "
+                f"{eligibility.section_status.lower()}."
             )
     
         # validation: course offerings must be approved
-        course_offering: CourseOffering = await self.course_offering_repo.get_by_id(
-            class_section.course_offering_id
-        )
-        if course_offering.status != CourseOfferingStatus.APPROVED:
+        if eligibility.course_offering_status != CourseOfferingStatus.APPROVED:
             raise InvalidRequestException(
-                f"Enrollment failed due to course offer status is currently {course_offering.status.lower()}."
+                f"Enrollment failed due to course offer status is currently "
+                f"{eligibility.course_offering_status.lower()}."
             )
         
         # validation: enrollment term must be open
-        term: Term = await self.term_repo.get_by_id(course_offering.term_id)
-        if term.status != TermStatus.OPEN:
+        if eligibility.term_status != TermStatus.OPEN:
             raise InvalidRequestException(
-                f"Enrollment failed due to term status is currently {term.status.lower()}."
+                f"Enrollment failed due to term status is currently {eligibility.term_status.lower()}."
             )
         
         # validation: class section curriculum course compatibility to the student's program
-        is_curriculum_compatible = await self.student_repo.validate_section_curriculum_compatibility(
-            student_id, class_section_id
-        )
-        if not is_curriculum_compatible:
+        if not eligibility.curriculum_compatible:
             raise InvalidRequestException(
                 f"Enrollment failed due to class section curriculum imcompatibility."
             )
+
+
+    async def _student_timetables(self, student_id: str, term_ids: List[str]) -> Dict[str, WeeklyTimetable]:
+        """Weekly bitset of the sections the student is enrolled to, per term."""
+        schedules: List[Any] = await self.enrollment_repo.get_student_term_schedules(
+            student_id=student_id,
+            term_ids=term_ids
+        )
+        masks: Dict[str, int] = section_masks(schedules)
+
+        timetables: Dict[str, WeeklyTimetable] = defaultdict(WeeklyTimetable)
+        for schedule in schedules:
+            timetables[schedule.term_id].add(
+                schedule.class_section_id, schedule.section_code, masks[schedule.class_section_id]
+            )
+        return timetables
+
+
+    async def _validate_schedule_fit(self, student_id: str, eligibility: Any) -> None:
+        """The class section must not clash with the student's timetable of its term."""
+        mask = section_masks(
+            await self.enrollment_repo.get_section_schedules([eligibility.class_section_id])
+        ).get(eligibility.class_section_id, 0)
+        if not mask:
+            return
+
+        timetables = await self._student_timetables(student_id=student_id, term_ids=[eligibility.term_id])
+        collision = timetables[eligibility.term_id].clash_with(mask)
+        if collision is not None:
+            raise InvalidRequestException(
+                f"Enrollment failed due to schedule conflict of {eligibility.section_code} "
+                f"with {collision}."
+            )
+
+
+    async def enroll_student_class_section(
+        self,
+        student_id: str,
+        class_section_id: str,
+        requested_by: str
+    ) -> EnrollmentResponseSchema:
         
-        student: Student = await self.student_repo.get_student_by_id(student_id)
-        if not student:
-            raise ResourceNotFoundException(f"Student not found by id: {student_id}.")
-        
-        enrollment: Enrollment = await self.enrollment_repo.create(
-            status=EnrollmentStatus.PENDING,
+        """
+            Student enrollment.
+            Validations:
+                Student not already enrolled
+                Section not full
+                ClassSection.status == OPEN
+                CourseOffering.status == APPROVED
+                Term.status == OPEN
+                Curriculum compatibility
+                No schedule clash with the student's sections of the same term
+                Reserve a seat of the class section atomically
+
+        """
+        # every eligibility fact is read in a single round trip
+        eligibility = await self.enrollment_repo.get_enrollment_eligibility(
             student_id=student_id,
-            class_section_id=class_section_id,
-            term_id=term.id
+            class_section_id=class_section_id
         )
+        if eligibility is None:
+            raise ResourceNotFoundException(f"Class section not found by id: {class_section_id}.")
         
-        # update class section count before return
-        class_section.current_student_cnt = await self.class_section_repo.current_student_count(
-                class_section.id
-            ) + 1 # add count every class section registration
+        self._validate_enrollment_eligibility(eligibility)
+        section_code = eligibility.section_code
         
-        await self.class_section_repo.update(
-            id=class_section.id,
-            current_student_cnt=class_section.current_student_cnt
-        )
+        if not eligibility.student_exists:
+            raise ResourceNotFoundException(f"Student not found by id: {student_id}.")
+        
+        # validation: no schedule clash with the student's timetable of the term
+        await self._validate_schedule_fit(student_id, eligibility)
+        
+        # reserve a seat atomically (UPDATE ... WHERE current_student_cnt < student_capacity)
+        # so concurrent enrollments to the same section cannot overbook it
+        reserved_cnt = await self.class_section_repo.reserve_seat(class_section_id)
+        if reserved_cnt is None:
+            await self.db.rollback()
+            raise InvalidRequestException(
+                f"Enrollment failed due to class section {section_code} already full."
+            )
+        
+        # the create commit persists the seat reservation and the enrollment together
+        try:
+            enrollment: Enrollment = await self.enrollment_repo.create(
+                status=EnrollmentStatus.PENDING,
+                student_id=student_id,
+                class_section_id=class_section_id,
+                term_id=eligibility.term_id
+            )
+        except IntegrityError:
+            await self.db.rollback()
+            raise InvalidRequestException(
+                f"Enrollment failed due to student already enrolled to {section_code}."
+            )
         
         # format and return the enrollment
+        enrollment_details: List[Any] = await self.enrollment_repo.get_enrollment_details([enrollment.id])
+        if not enrollment_details:
+            raise ResourceNotFoundException(f"Enrollment not found by id: {enrollment.id}.")
+        
         return await self.format_enrollment_response(
-            status=enrollment.status,
-            student=student,
-            class_section=class_section,
-            course_offering=course_offering,
-            term=term,
+            enrollment=enrollment_details[0],
             requested_by=requested_by,
             description="Student enrollment request."
         )
-        
-        
+
+
+    async def enroll_student_class_sections_batch(
+        self,
+        student_id: str,
+        class_section_ids: List[str],
+        requested_by: str
+    ) -> BatchEnrollmentResponseSchema:
+        """
+            Batch student enrollment (the whole term load in one request).
+            Validations:
+                Same validations as the single enrollment, read in one query
+                No schedule collision among the requested sections and the
+                student's current sections of the same term
+                Reserve the seats atomically
+            Every enrollment is inserted in one transaction. Sections failing a
+            validation are reported per section, the rest are enrolled.
+        """
+        requested_ids: List[str] = list(dict.fromkeys(class_section_ids))
+        errors: Dict[str, Exception] = {}
+
+        eligibilities: Dict[str, Any] = {
+            row.class_section_id: row
+            for row in await self.enrollment_repo.get_enrollment_eligibility_batch(
+                student_id=student_id,
+                class_section_ids=requested_ids
+            )
+        }
+        if eligibilities and not next(iter(eligibilities.values())).student_exists:
+            raise ResourceNotFoundException(f"Student not found by id: {student_id}.")
+
+        candidates: List[Any] = []
+        for class_section_id in requested_ids:
+            eligibility = eligibilities.get(class_section_id)
+            if eligibility is None:
+                errors[class_section_id] = ResourceNotFoundException(
+                    f"Class section not found by id: {class_section_id}."
+                )
+                continue
+
+            try:
+                self._validate_enrollment_eligibility(eligibility)
+                candidates.append(eligibility)
+            except InvalidRequestException as e:
+                errors[class_section_id] = e
+
+        # validation: schedule collision, in request order (the earlier section wins)
+        # against the student's timetable of the same term and the sections accepted so far
+        masks: Dict[str, int] = section_masks(await self.enrollment_repo.get_section_schedules(
+            [candidate.class_section_id for candidate in candidates]
+        ))
+        timetables = await self._student_timetables(
+            student_id=student_id,
+            term_ids=list({candidate.term_id for candidate in candidates})
+        )
+
+        accepted: List[Any] = []
+        for candidate in candidates:
+            mask = masks.get(candidate.class_section_id, 0)
+            collision = timetables[candidate.term_id].clash_with(mask)
+            if collision is not None:
+                errors[candidate.class_section_id] = InvalidRequestException(
+                    f"Enrollment failed due to schedule conflict of {candidate.section_code} "
+                    f"with {collision}."
+                )
+                continue
+
+            timetables[candidate.term_id].add(candidate.class_section_id, candidate.section_code, mask)
+            accepted.append(candidate)
+
+        # reserve the seats and insert the enrollments in one transaction
+        try:
+            reserved_ids = set(await self.class_section_repo.reserve_seat_batch(
+                [candidate.class_section_id for candidate in accepted]
+            ))
+
+            reserved: List[Any] = []
+            for candidate in accepted:
+                if candidate.class_section_id in reserved_ids:
+                    reserved.append(candidate)
+                else:
+                    errors[candidate.class_section_id] = InvalidRequestException(
+                        f"Enrollment failed due to class section {candidate.section_code} already full."
+                    )
+
+            inserted_ids: Dict[str, str] = {
+                row.class_section_id: row.id
+                for row in await self.enrollment_repo.insert_enrollments(
+                    student_id=student_id,
+                    sections=reserved
+                )
+            }
+
+            # enrolled concurrently by another request, give the seat back
+            already_enrolled: List[str] = []
+            for candidate in reserved:
+                if candidate.class_section_id not in inserted_ids:
+                    already_enrolled.append(candidate.class_section_id)
+                    errors[candidate.class_section_id] = InvalidRequestException(
+                        f"Enrollment failed due to student already enrolled to {candidate.section_code}."
+                    )
+            await self.class_section_repo.release_seat_batch(already_enrolled)
+
+            await self.db.commit()
+
+        except Exception as e:
+            await self.db.rollback()
+            logger.error("Batch enrollment failed: %s", str(e), exc_info=True)
+            raise InternalServerError("An error occurred during batch enrollment.")
+
+        # format and return the per section report
+        enrollment_details: Dict[str, Any] = {}
+        for enrollment in await self.enrollment_repo.get_enrollment_details(list(inserted_ids.values())):
+            enrollment_details.setdefault(enrollment.class_section_id, enrollment)
+
+        results: List[BatchEnrollmentResultSchema] = []
+        for class_section_id in requested_ids:
+            eligibility = eligibilities.get(class_section_id)
+            section_code = eligibility.section_code if eligibility is not None else None
+
+            if class_section_id in enrollment_details:
+                results.append(
+                    BatchEnrollmentResultSchema(
+                        class_section_id=class_section_id,
+                        section_code=section_code,
+                        success=True,
+                        enrollment=await self.format_enrollment_response(
+                            enrollment=enrollment_details[class_section_id],
+                            requested_by=requested_by,
+                            description="Student batch enrollment request."
+                        )
+                    )
+                )
+            else:
+                error = errors[class_section_id]
+                results.append(
+                    BatchEnrollmentResultSchema(
+                        class_section_id=class_section_id,
+                        section_code=section_code,
+                        success=False,
+                        error_code=error.error_code,
+                        detail=error.detail
+                    )
+                )
+
+        enrolled_cnt = len(enrollment_details)
+        return BatchEnrollmentResponseSchema(
+            student_id=student_id,
+            enrolled_cnt=enrolled_cnt,
+            failed_cnt=len(results) - enrolled_cnt,
+            results=results,
+            request_log=GenericResponse(
+                success=enrolled_cnt == len(results),
+                requested_at=datetime.now(timezone.utc),
+                requested_by=requested_by,
+                description=f"Student batch enrollment request, {enrolled_cnt} of {len(results)} enrolled."
+            )
+        )
+
+
     async def get_all_enrollments(self) -> List[EnrollmentResponseSchema]:
         """
             Read all student enrollment (Registrar role only)
         """
         enrollments: List[Any] = await self.enrollment_repo.get_all_enrollments()
-        response: List[EnrollmentResponseSchema] = []
-        
-        for enrollment in enrollments:
-            response.append(
-                await self.format_enrollment_response(
-                    enrollment=enrollment,
-                    description="Read all student enrollments."
-                )
+        # one validation pass over the rows, one request log for the whole list
+        return models_from_rows(
+            EnrollmentResponseSchema, enrollments,
+            request_log=GenericResponse(
+                success=True,
+                requested_at=datetime.now(timezone.utc),
+                description="Read all student enrollments."
             )
-        
-        return response
+        )
     
     
     async def get_term_based_program(
@@ -272,17 +519,15 @@ class EnrollmentGradingService:
         enrollments: List[Any] = await self.enrollment_repo.get_filtered_enrollments(
             department_id, program_id, class_section_id, term_id
         )
-        response: List[EnrollmentResponseSchema] = []
-        
-        for enrollment in enrollments:
-            response.append(
-                await self.format_enrollment_response(
-                    enrollment=enrollment,
-                    description="Filter enrollments."
-                )
+        # one validation pass over the rows, one request log for the whole list
+        return models_from_rows(
+            EnrollmentResponseSchema, enrollments,
+            request_log=GenericResponse(
+                success=True,
+                requested_at=datetime.now(timezone.utc),
+                description="Filter enrollments."
             )
-        
-        return response
+        )
         
     
     async def update_enrollment_status(
@@ -294,31 +539,23 @@ class EnrollmentGradingService:
             Update multiple enrollments (registrar role only)
                 All the enrollment (through id) will be updated using 1 status
         """
-        updated_enrollments_status: List[Enrollment] = await self.enrollment_repo.update_enrollments_status(
+        updated_ids: List[str] = await self.enrollment_repo.update_enrollments_status(
             enrollment_ids=enrollments.enrollment_ids,
             status=enrollments.status
         )
-        response: List[EnrollmentResponseSchema] = []
-        
-        for enrollment in updated_enrollments_status:
-            student: Student = await self.student_repo.get_student_by_id(enrollment.student_id)
-            class_section: ClassSection = await self.class_section_repo.get_by_id(enrollment.class_section_id)
-            course_offering: CourseOffering = await self.course_offering_repo.get_by_id(class_section.course_offering_id)
-            term: Term = await self.term_repo.get_by_id(enrollment.term_id)
         
-            response.append(
-                await self.format_enrollment_response(
-                    enrollment_id=enrollment.id,
-                    status=enrollment.status,
-                    student=student,
-                    class_section=class_section,
-                    course_offering=course_offering,
-                    term=term,
-                    description="Updated enrollment status."
-                )
+        # flattened rows of the updated enrollments only
+        updated_enrollments: List[Any] = await self.enrollment_repo.get_enrollment_details(updated_ids)
+        # one validation pass over the rows, one request log for the whole list
+        return models_from_rows(
+            EnrollmentResponseSchema, updated_enrollments,
+            request_log=GenericResponse(
+                success=True,
+                requested_at=datetime.now(timezone.utc),
+                requested_by=requested_by,
+                description="Updated enrollment status."
             )
-        
-        return response  
+        )
     
     
     async def list_enrollment_by_status(self, enrollment_status: EnrollmentStatus) -> List[EnrollmentResponseSchema]:
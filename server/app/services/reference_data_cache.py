@@ -0,0 +1,303 @@
+"""
+    Date Written: 10/19/2026 at 7:00 PM
+
+    In-process cache of the slowly changing academic structure
+    (buildings, rooms, departments, programs, curricula, courses and terms).
+        - immutable snapshots keyed by id, never ORM instances, so they are
+          safe to share between requests and sessions
+        - warmed at startup, every table reloaded once its TTL is over
+        - a miss reads the row from the database (misses are not memoized)
+        - invalidated by the AcademicStructureService writes, and in every
+          worker by the invalidation bus (app.db.invalidation_bus)
+        - a load or read racing an invalidation is not kept: every
+          invalidation bumps the generation of the table (or of the id)
+          and results read under an older generation are not stored
+"""
+
+import asyncio
+import logging
+import time as clock
+from dataclasses import dataclass, fields
+from datetime import datetime
+from typing import Any, Callable, Dict, Generic, List, Optional, Type, TypeVar
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.configs.settings import settings
+from app.models.academic_structures.course import Course
+from app.models.academic_structures.curriculum import Curriculum
+from app.models.academic_structures.department import Department
+from app.models.academic_structures.program import Program
+from app.models.academic_structures.term import Term
+from app.models.enums.academic_structure_state import CurriculumStatus, SemesterPeriod, TermStatus
+from app.models.locations.building import Building
+from app.models.locations.room import Room
+from app.utils.chunking import chunked
+
+logger = logging.getLogger(__name__)
+
+RefType = TypeVar("RefType")
+
+# ids per IN (...) list when loading many misses at once
+REFERENCE_CHUNK_SIZE = 5000
+
+
+# ============================================
+# SNAPSHOTS (same attribute names as the models)
+# ============================================
+@dataclass(frozen=True)
+class BuildingRef:
+    id: str
+    created_at: datetime
+    name: str
+    room_capacity: int
+
+
+@dataclass(frozen=True)
+class RoomRef:
+    id: str
+    created_at: datetime
+    room_code: Optional[str]
+    building_id: str
+
+
+@dataclass(frozen=True)
+class DepartmentRef:
+    id: str
+    created_at: datetime
+    title: str
+    department_code: Optional[str]
+    description: Optional[str]
+    building_id: Optional[str]
+
+
+@dataclass(frozen=True)
+class ProgramRef:
+    id: str
+    created_at: datetime
+    title: str
+    program_code: Optional[str]
+    description: Optional[str]
+    department_id: Optional[str]
+
+
+@dataclass(frozen=True)
+class CurriculumRef:
+    id: str
+    created_at: datetime
+    title: str
+    effective_from: int
+    effective_to: Optional[int]
+    status: CurriculumStatus
+    program_id: Optional[str]
+
+
+@dataclass(frozen=True)
+class CourseRef:
+    id: str
+    created_at: datetime
+    title: str
+    course_code: Optional[str]
+    units: int
+    description: Optional[str]
+
+
+@dataclass(frozen=True)
+class TermRef:
+    id: str
+    created_at: datetime
+    academic_year_start: int
+    academic_year_end: int
+    enrollment_start: datetime
+    enrollment_end: datetime
+    semester_period: SemesterPeriod
+    status: TermStatus
+
+
+# ============================================
+# CACHE
+# ============================================
+class ReferenceTable(Generic[RefType]):
+    """Snapshots of one table keyed by id, with hit/miss counters."""
+    def __init__(self, entity: str, model: Type[Any], ref_type: Type[RefType], ttl_seconds: float):
+        self.entity = entity
+        self.model = model
+        self.ref_type = ref_type
+        self.ttl_seconds = ttl_seconds
+
+        self._columns = [getattr(model, field.name) for field in fields(ref_type)]
+        self._entries: Dict[str, RefType] = {}
+        self._loaded_at: Optional[float] = None
+        # bumped by invalidate(): of the table, of one id
+        self._generation = 0
+        self._id_generations: Dict[str, int] = {}
+        self._warm_lock = asyncio.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.loads = 0
+
+
+    def _expired(self) -> bool:
+        return self._loaded_at is None or clock.monotonic() - self._loaded_at > self.ttl_seconds
+
+
+    def _snapshot(self, row: Any) -> RefType:
+        return self.ref_type(**row._mapping)
+
+
+    async def warm(self, db: AsyncSession) -> int:
+        """Load the whole table (a few hundred rows at most)."""
+        async with self._warm_lock:
+            return await self._load(db)
+
+
+    async def _load(self, db: AsyncSession) -> int:
+        generation, id_generations = self._generation, dict(self._id_generations)
+        result = await db.execute(select(*self._columns))
+        rows = result.all()
+        self.loads += 1
+
+        if self._generation != generation:
+            # the table was invalidated during the read: reloaded on next use
+            return len(rows)
+        self._entries = {
+            row.id: self._snapshot(row) for row in rows
+            if self._id_generations.get(row.id) == id_generations.get(row.id)
+        }
+        self._loaded_at = clock.monotonic()
+        return len(self._entries)
+
+
+    async def get(self, db: AsyncSession, id: Optional[str]) -> Optional[RefType]:
+        if id is None:
+            return None
+        return (await self.get_many(db, [id]))[0]
+
+
+    async def get_many(self, db: AsyncSession, ids: List[Optional[str]]) -> List[Optional[RefType]]:
+        """Snapshots in the order of ids, None for ids not found."""
+        if not settings.REFERENCE_CACHE_ENABLED:
+            return await self._read(db, ids)
+
+        if self._expired():
+            async with self._warm_lock:
+                # concurrent lookups wait for the first reload instead of repeating it
+                if self._expired():
+                    await self._load(db)
+
+        missing = [id for id in set(ids) if id is not None and id not in self._entries]
+        self.hits += len(ids) - len(missing)
+        self.misses += len(missing)
+
+        found = {id: self._entries.get(id) for id in ids if id is not None}
+        if missing:
+            generation = self._generation
+            id_generations = {id: self._id_generations.get(id) for id in missing}
+            for id, ref in zip(missing, await self._read(db, missing)):
+                found[id] = ref
+                # not kept when invalidated during the read, it may predate the write
+                if (
+                    ref is not None and self._generation == generation
+                    and self._id_generations.get(id) == id_generations[id]
+                ):
+                    self._entries[id] = ref
+
+        return [found[id] if id is not None else None for id in ids]
+
+
+    async def _read(self, db: AsyncSession, ids: List[Optional[str]]) -> List[Optional[RefType]]:
+        found: Dict[str, RefType] = {}
+        for chunk in chunked([id for id in set(ids) if id is not None], REFERENCE_CHUNK_SIZE):
+            result = await db.execute(select(*self._columns).where(self.model.id.in_(chunk)))
+            for row in result.all():
+                found[row.id] = self._snapshot(row)
+        return [found.get(id) for id in ids]
+
+
+    def invalidate(self, id: Optional[str] = None) -> None:
+        """Forget one snapshot, or the whole table when id is None (reloaded on next use)."""
+        if id is None:
+            self._generation += 1
+            self._id_generations = {}
+            self._entries = {}
+            self._loaded_at = None
+        else:
+            self._id_generations[id] = self._id_generations.get(id, 0) + 1
+            self._entries.pop(id, None)
+
+
+    def metrics(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+            "loads": self.loads,
+            "age_seconds": round(clock.monotonic() - self._loaded_at, 1) if self._loaded_at is not None else None,
+            "ttl_seconds": self.ttl_seconds,
+        }
+
+
+class ReferenceDataCache:
+    """The reference tables of the academic structure, one per entity."""
+    def __init__(self, ttl_seconds: float):
+        self.buildings: ReferenceTable[BuildingRef] = ReferenceTable("building", Building, BuildingRef, ttl_seconds)
+        self.rooms: ReferenceTable[RoomRef] = ReferenceTable("room", Room, RoomRef, ttl_seconds)
+        self.departments: ReferenceTable[DepartmentRef] = ReferenceTable("department", Department, DepartmentRef, ttl_seconds)
+        self.programs: ReferenceTable[ProgramRef] = ReferenceTable("program", Program, ProgramRef, ttl_seconds)
+        self.curricula: ReferenceTable[CurriculumRef] = ReferenceTable("curriculum", Curriculum, CurriculumRef, ttl_seconds)
+        self.courses: ReferenceTable[CourseRef] = ReferenceTable("course", Course, CourseRef, ttl_seconds)
+        self.terms: ReferenceTable[TermRef] = ReferenceTable("term", Term, TermRef, ttl_seconds)
+
+        self._tables: Dict[str, ReferenceTable] = {
+            table.entity: table for table in (
+                self.buildings, self.rooms, self.departments, self.programs,
+                self.curricula, self.courses, self.terms
+            )
+        }
+        # called with (entity, id) after every local invalidation
+        self._listeners: List[Callable[[str, Optional[str]], None]] = []
+
+
+    @property
+    def entities(self) -> List[str]:
+        return list(self._tables)
+
+
+    async def warm(self, session_factory) -> None:
+        async with session_factory() as db:
+            for table in self._tables.values():
+                size = await table.warm(db)
+                logger.info("Reference data cache warmed %s: %s rows.", table.entity, size)
+
+
+    def add_invalidation_listener(self, listener: Callable[[str, Optional[str]], None]) -> None:
+        self._listeners.append(listener)
+
+
+    def invalidate(self, entity: str, id: Optional[str] = None, notify: bool = True) -> None:
+        """
+            Forget a changed row (or a whole table when id is None).
+            notify=False when applying an invalidation that came from another process.
+        """
+        table = self._tables.get(entity)
+        if table is None:
+            return
+
+        table.invalidate(id)
+        if notify:
+            for listener in self._listeners:
+                try:
+                    listener(entity, id)
+                except Exception as e:
+                    logger.error("Reference data cache listener failed: %s", str(e))
+
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        return {entity: table.metrics() for entity, table in self._tables.items()}
+
+
+reference_data_cache = ReferenceDataCache(ttl_seconds=settings.REFERENCE_CACHE_TTL_SECONDS)
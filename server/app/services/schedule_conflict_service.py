@@ -0,0 +1,232 @@
+"""
+    Date Written: 10/19/2026 at 3:30 PM
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import time
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.exceptions.customed_exception import *
+from app.models.academic_structures.class_schedule import ClassSchedule
+from app.models.academic_structures.term import Term
+from app.models.enums.academic_structure_state import ScheduleConflictType
+from app.repository.academic_structures.class_schedule_repository import ClassScheduleRepository
+from app.repository.academic_structures.term_repository import TermRepository
+from app.schemas.academic_structure_schema import ScheduleConflictResponseSchema
+from app.utils.interval_tree import IntervalHandle, IntervalTree
+
+
+def to_minutes(value: time) -> int:
+    """Minutes since midnight, the interval unit of the conflict index."""
+    return value.hour * 60 + value.minute
+
+
+@dataclass
+class ScheduleSlot:
+    """One weekly meeting of a class section, stored (schedule_id) or planned."""
+    class_section_id: str
+    section_code: str
+    day_of_week: int
+    start_time: time
+    end_time: time
+    room_id: Optional[str] = None
+    professor_ids: Tuple[str, ...] = ()
+    schedule_id: Optional[str] = None
+
+
+# (conflict type, room / professor / class section id, day of week)
+ResourceKey = Tuple[ScheduleConflictType, str, int]
+
+
+def slot_resource_keys(slot: ScheduleSlot) -> List[ResourceKey]:
+    """Resources a slot occupies: its room, its professors and its class section."""
+    keys: List[ResourceKey] = []
+    if slot.room_id:
+        keys.append((ScheduleConflictType.ROOM, slot.room_id, slot.day_of_week))
+    for professor_id in slot.professor_ids:
+        keys.append((ScheduleConflictType.PROFESSOR, professor_id, slot.day_of_week))
+    keys.append((ScheduleConflictType.SECTION, slot.class_section_id, slot.day_of_week))
+    return keys
+
+
+def sweep_conflicts(
+    slots: List[ScheduleSlot]
+) -> List[Tuple[ScheduleConflictType, str, ScheduleSlot, ScheduleSlot]]:
+    """
+        Every overlapping pair of slots sharing a resource, by sort-and-sweep:
+        slots are grouped per resource and day, sorted by start, and each slot
+        is compared only with the slots still running when it starts.
+        Returns (conflict type, resource id, earlier slot, later slot).
+    """
+    groups: Dict[ResourceKey, List[ScheduleSlot]] = defaultdict(list)
+    for slot in slots:
+        for key in slot_resource_keys(slot):
+            groups[key].append(slot)
+
+    pairs: List[Tuple[ScheduleConflictType, str, ScheduleSlot, ScheduleSlot]] = []
+    for (conflict_type, resource_id, _), members in groups.items():
+        if len(members) < 2:
+            continue
+
+        members.sort(key=lambda member: (member.start_time, member.end_time))
+        running: List[ScheduleSlot] = []
+        for slot in members:
+            running = [other for other in running if other.end_time > slot.start_time]
+            for other in running:
+                pairs.append((conflict_type, resource_id, other, slot))
+            running.append(slot)
+
+    return pairs
+
+
+class ScheduleConflictIndex:
+    """
+        In-memory conflict index for batch planning (imports, solver, term reports).
+        One interval tree per (room, day), (professor, day) and (class section, day).
+    """
+    def __init__(self):
+        self._trees: Dict[ResourceKey, IntervalTree] = defaultdict(IntervalTree)
+        self._handles: Dict[int, List[Tuple[ResourceKey, IntervalHandle]]] = {}
+
+
+    def conflicts(self, slot: ScheduleSlot) -> List[Tuple[ScheduleConflictType, str, ScheduleSlot]]:
+        """Every indexed slot sharing a resource with the slot at an overlapping time."""
+        start, end = to_minutes(slot.start_time), to_minutes(slot.end_time)
+        found: List[Tuple[ScheduleConflictType, str, ScheduleSlot]] = []
+
+        for key in slot_resource_keys(slot):
+            tree = self._trees.get(key)
+            if tree is None:
+                continue
+            for _, _, other in tree.overlaps(start, end):
+                if other is not slot:
+                    found.append((key[0], key[1], other))
+
+        return found
+
+
+    def is_busy(
+        self, conflict_type: ScheduleConflictType, resource_id: str, day_of_week: int, start_time: time, end_time: time
+    ) -> bool:
+        """Whether one resource has an indexed slot overlapping the time on the day."""
+        tree = self._trees.get((conflict_type, resource_id, day_of_week))
+        if tree is None or len(tree) == 0:
+            return False
+        return len(tree.overlaps(to_minutes(start_time), to_minutes(end_time))) > 0
+
+
+    def add(self, slot: ScheduleSlot) -> None:
+        start, end = to_minutes(slot.start_time), to_minutes(slot.end_time)
+        self._handles[id(slot)] = [
+            (key, self._trees[key].add(start, end, slot)) for key in slot_resource_keys(slot)
+        ]
+
+
+    def remove(self, slot: ScheduleSlot) -> None:
+        for key, handle in self._handles.pop(id(slot), []):
+            self._trees[key].remove(handle)
+
+
+def format_schedule_conflict(
+    conflict_type: ScheduleConflictType, resource_id: str, slot: ScheduleSlot, other: ScheduleSlot
+) -> ScheduleConflictResponseSchema:
+    return ScheduleConflictResponseSchema(
+        conflict_type=conflict_type,
+        resource_id=resource_id,
+        day_of_week=slot.day_of_week,
+        schedule_id=slot.schedule_id,
+        class_section_id=slot.class_section_id,
+        section_code=slot.section_code,
+        start_time=slot.start_time,
+        end_time=slot.end_time,
+        other_schedule_id=other.schedule_id,
+        other_class_section_id=other.class_section_id,
+        other_section_code=other.section_code,
+        other_start_time=other.start_time,
+        other_end_time=other.end_time
+    )
+
+
+class ScheduleConflictService:
+    """
+        Class schedule conflict detection.
+            - Does this slot conflict? (room / professor, answered by the database)
+            - Load every slot of a term (one query)
+            - List every conflict of a term (interval trees)
+    """
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+        self.class_schedule_repo = ClassScheduleRepository(db)
+        self.term_repo = TermRepository(db)
+
+
+    async def find_room_conflict(
+        self, room_id: str, term_id: str, day_of_week: int, start_time: time, end_time: time
+    ) -> Optional[ClassSchedule]:
+        return await self.class_schedule_repo.find_room_conflict(
+            room_id=room_id, term_id=term_id, day_of_week=day_of_week,
+            start_time=start_time, end_time=end_time
+        )
+
+
+    async def find_professor_conflict(
+        self, professor_id: str, term_id: str, day_of_week: int, start_time: time, end_time: time
+    ) -> Optional[ClassSchedule]:
+        return await self.class_schedule_repo.find_professor_conflict(
+            professor_id=professor_id, term_id=term_id, day_of_week=day_of_week,
+            start_time=start_time, end_time=end_time
+        )
+
+
+    async def load_term_slots(self, term_id: str) -> List[ScheduleSlot]:
+        """Every stored schedule of the term with its room and professors."""
+        slots: Dict[str, ScheduleSlot] = {}
+
+        for row in await self.class_schedule_repo.get_term_schedule_slots(term_id):
+            slot = slots.get(row.schedule_id)
+            if slot is None:
+                slot = slots[row.schedule_id] = ScheduleSlot(
+                    class_section_id=row.class_section_id,
+                    section_code=row.section_code,
+                    day_of_week=row.day_of_week,
+                    start_time=row.start_time,
+                    end_time=row.end_time,
+                    room_id=row.room_id,
+                    schedule_id=row.schedule_id
+                )
+            if row.professor_id is not None:
+                slot.professor_ids += (row.professor_id,)
+
+        return list(slots.values())
+
+
+    async def build_term_index(self, term_id: str) -> ScheduleConflictIndex:
+        """Conflict index holding every stored schedule of the term."""
+        index = ScheduleConflictIndex()
+        for slot in await self.load_term_slots(term_id):
+            index.add(slot)
+        return index
+
+
+    async def list_term_conflicts(self, term_id: str) -> List[ScheduleConflictResponseSchema]:
+        """
+            Every room, professor and class section conflict of the term.
+            Slots are added in (day, start) order, each conflicting pair is
+            reported once, when its later slot is added.
+        """
+        term: Term = await self.term_repo.get_by_id(term_id)
+        if term is None:
+            raise ResourceNotFoundException(f"Term not found by id: {term_id}.")
+
+        index = ScheduleConflictIndex()
+        response: List[ScheduleConflictResponseSchema] = []
+
+        for slot in await self.load_term_slots(term_id):
+            for conflict_type, resource_id, other in index.conflicts(slot):
+                response.append(format_schedule_conflict(conflict_type, resource_id, slot, other))
+            index.add(slot)
+
+        return response
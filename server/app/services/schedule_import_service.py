@@ -0,0 +1,307 @@
+"""
+    Date Written: 10/19/2026 at 4:40 PM
+"""
+
+import csv
+import io
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.exceptions.customed_exception import *
+from app.models.academic_structures.term import Term
+from app.models.enums.academic_structure_state import (
+    ClassSectionStatus, CourseOfferingStatus, ScheduleConflictType, TermStatus
+)
+from app.repository.academic_structures.class_schedule_repository import ClassScheduleRepository
+from app.repository.academic_structures.class_section_repository import ClassSectionRepository
+from app.repository.academic_structures.professor_class_section_repository import ProfessorClassSectionRepository
+from app.repository.academic_structures.term_repository import TermRepository
+from app.repository.locations.room_repository import RoomRepository
+from app.schemas.academic_structure_schema import (
+    ClassScheduleRequestSchema,
+    ScheduleConflictResponseSchema,
+    ScheduleImportResponseSchema,
+    ScheduleImportRowResultSchema,
+)
+from app.schemas.generic_schema import GenericResponse
+from app.services.schedule_conflict_service import (
+    ScheduleConflictService, ScheduleSlot, format_schedule_conflict, sweep_conflicts
+)
+
+logger = logging.getLogger(__name__)
+
+# columns of a timetable CSV, one schedule per line
+SCHEDULE_CSV_COLUMNS = ("class_section_id", "room_id", "day_of_week", "start_time", "end_time")
+
+# (row number, parsed schedule or None, parse error or None)
+ImportRow = Tuple[int, Optional[ClassScheduleRequestSchema], Optional[Exception]]
+
+
+def parse_schedule_csv(content: bytes) -> List[ImportRow]:
+    """
+        Parse a timetable CSV (header line with SCHEDULE_CSV_COLUMNS).
+        A line that does not validate is kept as a failed row, the rest
+        of the file is still imported.
+    """
+    try:
+        text = content.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        raise UnprocessibleContentException("Schedule import file must be UTF-8 encoded CSV.")
+
+    reader = csv.DictReader(io.StringIO(text))
+    missing = [column for column in SCHEDULE_CSV_COLUMNS if column not in (reader.fieldnames or [])]
+    if missing:
+        raise UnprocessibleContentException(
+            f"Schedule import file is missing columns: {', '.join(missing)}."
+        )
+
+    rows: List[ImportRow] = []
+    for row_number, line in enumerate(reader, start=1):
+        try:
+            schedule = ClassScheduleRequestSchema(
+                **{column: (line.get(column) or "").strip() for column in SCHEDULE_CSV_COLUMNS}
+            )
+            rows.append((row_number, schedule, None))
+        except ValidationError as e:
+            error = e.errors()[0]
+            field = ".".join(str(part) for part in error["loc"])
+            rows.append((
+                row_number, None,
+                UnprocessibleContentException(f"Invalid value of {field}: {error['msg']}.")
+            ))
+
+    if not rows:
+        raise InvalidRequestException("Schedule import file has no rows.")
+    return rows
+
+
+def _conflict_error(conflict_type: ScheduleConflictType, resource_id: str, other: ScheduleSlot) -> Exception:
+    # same messages as the single schedule assignment
+    if conflict_type == ScheduleConflictType.ROOM:
+        return InvalidRequestException(
+            f"Room {resource_id} is already booked from {other.start_time} to {other.end_time}"
+        )
+    if conflict_type == ScheduleConflictType.PROFESSOR:
+        return InvalidRequestException(
+            f"Professor {resource_id} has a schedule conflict from {other.start_time} to {other.end_time}"
+        )
+    return InvalidRequestException(
+        f"Class section {other.section_code} already meets from {other.start_time} to {other.end_time}"
+    )
+
+
+class ScheduleImportService:
+    """
+        Bulk timetable import of one term.
+            - every row is validated like assign_schedule_class_section, with
+              one query per kind of fact instead of one per row
+            - room, professor and class section conflicts among the rows and
+              against the stored schedules of the term in one sort-and-sweep
+            - rows are accepted in file order, a row is rejected when it
+              overlaps a stored schedule or an earlier accepted row
+            - accepted rows are inserted in one transaction
+    """
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+        self.term_repo = TermRepository(db)
+        self.room_repo = RoomRepository(db)
+        self.class_section_repo = ClassSectionRepository(db)
+        self.prof_class_section_repo = ProfessorClassSectionRepository(db)
+        self.class_schedule_repo = ClassScheduleRepository(db)
+        self.schedule_conflict_service = ScheduleConflictService(db)
+
+
+    async def import_schedules(
+        self, term_id: str, schedules: List[ClassScheduleRequestSchema], requested_by: str = None
+    ) -> ScheduleImportResponseSchema:
+        return await self.import_rows(
+            term_id=term_id,
+            rows=[(row_number, schedule, None) for row_number, schedule in enumerate(schedules, start=1)],
+            requested_by=requested_by
+        )
+
+
+    async def import_schedule_csv(
+        self, term_id: str, content: bytes, requested_by: str = None
+    ) -> ScheduleImportResponseSchema:
+        return await self.import_rows(
+            term_id=term_id,
+            rows=parse_schedule_csv(content),
+            requested_by=requested_by
+        )
+
+
+    async def _validate_rows(
+        self, term_id: str, rows: List[ImportRow], errors: Dict[int, Exception]
+    ) -> List[Tuple[int, ScheduleSlot]]:
+        """Row level validation, returns the (row number, slot) candidates left."""
+        schedules = [schedule for _, schedule, _ in rows if schedule is not None]
+        section_ids = list({schedule.class_section_id for schedule in schedules})
+
+        sections: Dict[str, Any] = {
+            section.class_section_id: section
+            for section in await self.class_section_repo.get_scheduling_facts(section_ids)
+        }
+        existing_room_ids = set(await self.room_repo.get_existing_ids(
+            {schedule.room_id for schedule in schedules}
+        ))
+        professor_ids: Dict[str, List[str]] = await self.prof_class_section_repo.get_professor_ids_by_sections(
+            section_ids
+        )
+
+        candidates: List[Tuple[int, ScheduleSlot]] = []
+        for row_number, schedule, error in rows:
+            if error is not None:
+                errors[row_number] = error
+                continue
+
+            section = sections.get(schedule.class_section_id)
+            if schedule.start_time >= schedule.end_time:
+                errors[row_number] = InvalidRequestException("Start time must be before end time")
+            elif section is None:
+                errors[row_number] = ResourceNotFoundException(
+                    f"Class section not found with id {schedule.class_section_id}."
+                )
+            elif section.term_id != term_id:
+                errors[row_number] = InvalidRequestException(
+                    f"Invalid request. Class section {section.section_code} does not belong to term {term_id}."
+                )
+            elif section.section_status != ClassSectionStatus.OPEN:
+                errors[row_number] = InvalidRequestException(
+                    f"Invalid request. Class section {section.section_status} currently not open."
+                )
+            elif section.course_offering_status != CourseOfferingStatus.APPROVED:
+                errors[row_number] = InvalidRequestException(
+                    f"Invalid request. Course offering {section.course_offering_status} currently not yet approved."
+                )
+            elif schedule.room_id not in existing_room_ids:
+                errors[row_number] = ResourceNotFoundException("Room not found.")
+            elif not professor_ids.get(schedule.class_section_id):
+                errors[row_number] = ResourceNotFoundException("No professor assigned to class section")
+            else:
+                candidates.append((
+                    row_number,
+                    ScheduleSlot(
+                        class_section_id=schedule.class_section_id,
+                        section_code=section.section_code,
+                        day_of_week=schedule.day_of_week,
+                        start_time=schedule.start_time,
+                        end_time=schedule.end_time,
+                        room_id=schedule.room_id,
+                        professor_ids=tuple(professor_ids[schedule.class_section_id])
+                    )
+                ))
+
+        return candidates
+
+
+    async def import_rows(
+        self, term_id: str, rows: List[ImportRow], requested_by: str = None
+    ) -> ScheduleImportResponseSchema:
+        term: Term = await self.term_repo.get_by_id(term_id)
+        if term is None:
+            raise ResourceNotFoundException(f"Term not found by id: {term_id}.")
+
+        if term.status != TermStatus.OPEN:
+            raise InvalidRequestException(
+                f"Invalid request. Term {term.status} currently not open."
+            )
+
+        errors: Dict[int, Exception] = {}
+        conflicts: Dict[int, List[ScheduleConflictResponseSchema]] = {}
+        candidates = await self._validate_rows(term_id, rows, errors)
+
+        # every overlapping pair among the stored schedules and the candidates
+        row_numbers: Dict[int, int] = {id(slot): row_number for row_number, slot in candidates}
+        existing_slots = await self.schedule_conflict_service.load_term_slots(term_id)
+        overlaps: Dict[int, List[Tuple[ScheduleConflictType, str, ScheduleSlot]]] = {}
+
+        for conflict_type, resource_id, earlier, later in sweep_conflicts(
+            existing_slots + [slot for _, slot in candidates]
+        ):
+            if id(earlier) in row_numbers:
+                overlaps.setdefault(id(earlier), []).append((conflict_type, resource_id, later))
+            if id(later) in row_numbers:
+                overlaps.setdefault(id(later), []).append((conflict_type, resource_id, earlier))
+
+        # accept in row order, only stored schedules and accepted rows block a row
+        accepted: List[Tuple[int, ScheduleSlot]] = []
+        accepted_slots = set()
+        for row_number, slot in sorted(candidates, key=lambda candidate: candidate[0]):
+            blocking = [
+                (conflict_type, resource_id, other)
+                for conflict_type, resource_id, other in overlaps.get(id(slot), [])
+                if other.schedule_id is not None or id(other) in accepted_slots
+            ]
+            if blocking:
+                errors[row_number] = _conflict_error(*blocking[0])
+                conflicts[row_number] = [
+                    format_schedule_conflict(conflict_type, resource_id, slot, other)
+                    for conflict_type, resource_id, other in blocking
+                ]
+                continue
+
+            accepted.append((row_number, slot))
+            accepted_slots.add(id(slot))
+
+        # insert every accepted row in one transaction
+        schedule_ids: Dict[int, str] = {}
+        if accepted:
+            try:
+                inserted_ids = await self.class_schedule_repo.insert_schedules([
+                    {
+                        "class_section_id": slot.class_section_id,
+                        "room_id": slot.room_id,
+                        "day_of_week": slot.day_of_week,
+                        "start_time": slot.start_time,
+                        "end_time": slot.end_time,
+                    }
+                    for _, slot in accepted
+                ])
+                await self.db.commit()
+            except Exception as e:
+                await self.db.rollback()
+                logger.error("Schedule import failed: %s", str(e), exc_info=True)
+                raise InternalServerError("An error occurred during schedule import.")
+
+            schedule_ids = {
+                row_number: schedule_id for (row_number, _), schedule_id in zip(accepted, inserted_ids)
+            }
+
+        # format the per row report
+        results: List[ScheduleImportRowResultSchema] = []
+        for row_number, schedule, _ in rows:
+            result = ScheduleImportRowResultSchema(
+                row_number=row_number,
+                class_section_id=schedule.class_section_id if schedule else None,
+                room_id=schedule.room_id if schedule else None,
+                day_of_week=schedule.day_of_week if schedule else None,
+                start_time=schedule.start_time if schedule else None,
+                end_time=schedule.end_time if schedule else None,
+                success=row_number in schedule_ids,
+                schedule_id=schedule_ids.get(row_number)
+            )
+            if row_number in errors:
+                result.error_code = errors[row_number].error_code
+                result.detail = errors[row_number].detail
+                result.conflicts = conflicts.get(row_number, [])
+            results.append(result)
+
+        imported_cnt = len(schedule_ids)
+        return ScheduleImportResponseSchema(
+            term_id=term_id,
+            total_rows=len(results),
+            imported_cnt=imported_cnt,
+            rejected_cnt=len(results) - imported_cnt,
+            results=results,
+            request_log=GenericResponse(
+                success=imported_cnt == len(results),
+                requested_at=datetime.now(timezone.utc),
+                requested_by=requested_by,
+                description=f"Term schedule import, {imported_cnt} of {len(results)} imported."
+            )
+        )
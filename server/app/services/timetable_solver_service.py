@@ -0,0 +1,669 @@
+"""
+    Date Written: 10/19/2026 at 5:30 PM
+"""
+
+import asyncio
+import logging
+import math
+import random
+import threading
+import time as clock
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, time, timedelta, timezone
+from typing import Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.configs.settings import settings
+from app.db.db_session import async_session
+from app.exceptions.customed_exception import *
+from app.models.academic_structures.term import Term
+from app.models.academic_structures.timetable_solver_job import TimetableSolverJob
+from app.models.enums.academic_structure_state import ScheduleConflictType, TermStatus, TimetableJobStatus
+from app.repository.academic_structures.class_section_repository import ClassSectionRepository
+from app.repository.academic_structures.professor_class_section_repository import ProfessorClassSectionRepository
+from app.repository.academic_structures.term_repository import TermRepository
+from app.repository.academic_structures.timetable_solver_job_repository import (
+    ACTIVE_STATUSES, TimetableSolverJobRepository
+)
+from app.repository.locations.room_repository import RoomRepository
+from app.schemas.academic_structure_schema import (
+    ClassScheduleRequestSchema,
+    ScheduleImportResponseSchema,
+    TimetableProposalRowSchema,
+    TimetableSolverJobResponseSchema,
+    TimetableSolverRequestSchema,
+    TimetableUnassignedSectionSchema,
+)
+from app.schemas.generic_schema import GenericResponse
+from app.services.schedule_conflict_service import (
+    ScheduleConflictIndex, ScheduleConflictService, ScheduleSlot, to_minutes
+)
+from app.services.schedule_import_service import ScheduleImportService
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================
+# SOLVER
+# ============================================
+@dataclass
+class SolverSection:
+    """One unscheduled class section and the weekly meetings it needs."""
+    class_section_id: str
+    section_code: str
+    meetings: int
+    professor_ids: Tuple[str, ...]
+
+
+@dataclass
+class SolverResult:
+    slots: List[ScheduleSlot] = field(default_factory=list)
+    placed_sections: int = 0
+    attempts: int = 0
+
+
+def meetings_per_week(units: int, meeting_minutes: int) -> int:
+    """One contact hour per unit per week, split into meetings of meeting_minutes."""
+    return max(1, math.ceil(max(units or 0, 0) * 60 / meeting_minutes))
+
+
+def start_times(day_start: time, day_end: time, meeting_minutes: int, step_minutes: int) -> List[Tuple[time, time]]:
+    """Every (start, end) of one meeting fitting in the day, step_minutes apart."""
+    slots: List[Tuple[time, time]] = []
+    start, last_start = to_minutes(day_start), to_minutes(day_end) - meeting_minutes
+
+    while start <= last_start:
+        end = start + meeting_minutes
+        slots.append((time(start // 60, start % 60), time(end // 60, end % 60)))
+        start += step_minutes
+    return slots
+
+
+class TimetableSolver:
+    """
+        Greedy timetable construction with squeaky-wheel restarts.
+            - sections are placed most constrained first (busiest professors,
+              most meetings), each meeting of a section on a different day
+            - a meeting takes the earliest (start, room) free for its room and
+              professors on the least loaded day the section does not meet yet,
+              checked against the conflict index (stored schedules + placed meetings)
+            - a section is placed whole or not at all
+            - while time budget is left, the sections that failed move to the
+              front of the order and the construction starts over with
+              shuffled tie breaks, the best attempt is kept
+    """
+    def __init__(
+        self,
+        sections: List[SolverSection],
+        room_ids: List[str],
+        days: List[int],
+        times: List[Tuple[time, time]],
+        existing_slots: List[ScheduleSlot],
+        seed: Optional[int] = None
+    ):
+        self.sections = sections
+        self.room_ids = room_ids
+        self.days = days
+        self.times = times
+        self.existing_slots = existing_slots
+        self.rng = random.Random(seed)
+
+
+    def _initial_order(self) -> List[SolverSection]:
+        professor_load: Dict[str, int] = {}
+        for slot in self.existing_slots:
+            for professor_id in slot.professor_ids:
+                professor_load[professor_id] = professor_load.get(professor_id, 0) + 1
+        for section in self.sections:
+            for professor_id in section.professor_ids:
+                professor_load[professor_id] = professor_load.get(professor_id, 0) + section.meetings
+
+        def difficulty(section: SolverSection) -> Tuple[int, int, str]:
+            load = max((professor_load[professor_id] for professor_id in section.professor_ids), default=0)
+            return (-load, -section.meetings, section.section_code)
+
+        return sorted(self.sections, key=difficulty)
+
+
+    def _place_meeting(
+        self,
+        section: SolverSection,
+        used_days: set,
+        index: ScheduleConflictIndex,
+        day_load: Dict[int, int],
+        room_offset: int
+    ) -> Optional[ScheduleSlot]:
+        days = sorted(
+            (day for day in self.days if day not in used_days),
+            key=lambda day: (day_load[day], self.rng.random())
+        )
+        rooms = self.room_ids[room_offset:] + self.room_ids[:room_offset]
+
+        for day in days:
+            # earliest start first, packs the day without unusable gaps
+            for start_time, end_time in self.times:
+                # professors first, they do not depend on the room
+                if any(
+                    index.is_busy(ScheduleConflictType.PROFESSOR, professor_id, day, start_time, end_time)
+                    for professor_id in section.professor_ids
+                ):
+                    continue
+
+                for room_id in rooms:
+                    if not index.is_busy(ScheduleConflictType.ROOM, room_id, day, start_time, end_time):
+                        return ScheduleSlot(
+                            class_section_id=section.class_section_id,
+                            section_code=section.section_code,
+                            day_of_week=day,
+                            start_time=start_time,
+                            end_time=end_time,
+                            room_id=room_id,
+                            professor_ids=section.professor_ids
+                        )
+
+        return None
+
+
+    def _attempt(self, order: List[SolverSection]) -> Tuple[List[ScheduleSlot], List[SolverSection]]:
+        index = ScheduleConflictIndex()
+        for slot in self.existing_slots:
+            index.add(slot)
+
+        day_load: Dict[int, int] = {day: 0 for day in self.days}
+        for slot in self.existing_slots:
+            if slot.day_of_week in day_load:
+                day_load[slot.day_of_week] += 1
+
+        placed: List[ScheduleSlot] = []
+        failed: List[SolverSection] = []
+        for section in order:
+            room_offset = self.rng.randrange(len(self.room_ids))
+            section_slots: List[ScheduleSlot] = []
+            used_days: set = set()
+
+            for _ in range(section.meetings):
+                slot = self._place_meeting(section, used_days, index, day_load, room_offset)
+                if slot is None:
+                    break
+                index.add(slot)
+                used_days.add(slot.day_of_week)
+                day_load[slot.day_of_week] += 1
+                section_slots.append(slot)
+
+            if len(section_slots) == section.meetings:
+                placed.extend(section_slots)
+                continue
+
+            # whole section or nothing
+            for slot in section_slots:
+                index.remove(slot)
+                day_load[slot.day_of_week] -= 1
+            failed.append(section)
+
+        return placed, failed
+
+
+    def solve(
+        self,
+        time_budget_seconds: float,
+        on_progress: Optional[Callable[[float, int, int], None]] = None,
+        should_stop: Optional[Callable[[], bool]] = None
+    ) -> SolverResult:
+        """
+            Best attempt found within the time budget.
+            on_progress(fraction of budget used, attempts, meetings placed by the best attempt)
+        """
+        best = SolverResult()
+        if not self.sections or not self.room_ids or not self.times:
+            return best
+
+        started = clock.monotonic()
+        order = self._initial_order()
+
+        while True:
+            placed, failed = self._attempt(order)
+            best.attempts += 1
+
+            if len(self.sections) - len(failed) > best.placed_sections or best.attempts == 1:
+                best.slots = placed
+                best.placed_sections = len(self.sections) - len(failed)
+
+            elapsed = clock.monotonic() - started
+            if on_progress is not None:
+                on_progress(min(elapsed / time_budget_seconds, 1.0), best.attempts, len(best.slots))
+
+            if not failed or elapsed >= time_budget_seconds:
+                break
+            if should_stop is not None and should_stop():
+                break
+
+            # squeaky wheel: the sections that failed go first next time
+            failed_ids = {section.class_section_id for section in failed}
+            self.rng.shuffle(failed)
+            order = failed + [section for section in order if section.class_section_id not in failed_ids]
+
+        return best
+
+
+# ============================================
+# BACKGROUND JOBS
+# ============================================
+class TimetableSolverRun:
+    """The part of a solver job that lives in the worker running it."""
+    def __init__(self, job_id: str, term_id: str, request: TimetableSolverRequestSchema):
+        self.job_id = job_id
+        self.term_id = term_id
+        self.request = request
+
+        # written by the solver thread, saved with every heartbeat
+        self.progress = 0.0
+        self.attempts = 0
+        self.meetings_assigned = 0
+
+        self.task: Optional[asyncio.Task] = None
+        # the solver runs in a worker thread, it checks this flag between attempts
+        self.stop_requested = threading.Event()
+
+
+class TimetableSolverJobs:
+    """
+        Timetable solver jobs, stored in the timetable_solver_job table.
+            - submit validates the term and rooms, then solves in the background
+              of the worker that took the request (data loaded with its own
+              session, search in a worker thread)
+            - the job row is the shared state: any worker answers the polls,
+              cancels and commits of a job, one running job per term across
+              workers (unique index on the running job of a term)
+            - the running worker saves the progress with a heartbeat and
+              stops when it finds the job cancelled, a job whose heartbeat
+              stopped is failed by the next submit of its term
+            - commit imports the reviewed proposal through the bulk timetable
+              import, so it is validated again against the schedules stored
+              since the proposal was made
+        max_running_jobs caps the solver threads of one worker.
+    """
+    def __init__(
+        self,
+        max_running_jobs: int,
+        max_budget_seconds: int,
+        job_ttl_seconds: int,
+        heartbeat_seconds: float,
+        session_factory=async_session
+    ):
+        self.max_running_jobs = max_running_jobs
+        self.max_budget_seconds = max_budget_seconds
+        self.job_ttl = timedelta(seconds=job_ttl_seconds)
+        self.heartbeat_seconds = heartbeat_seconds
+        # a few missed heartbeats before the job counts as abandoned
+        self.stale_after = timedelta(seconds=heartbeat_seconds * 5)
+        self.session_factory = session_factory
+
+        self._runs: Dict[str, TimetableSolverRun] = {}
+
+
+    async def submit(
+        self,
+        db: AsyncSession,
+        term_id: str,
+        request: TimetableSolverRequestSchema,
+        requested_by: str,
+        requested_by_id: str
+    ) -> TimetableSolverJob:
+        term: Term = await TermRepository(db).get_by_id(term_id)
+        if term is None:
+            raise ResourceNotFoundException(f"Term not found by id: {term_id}.")
+        if term.status != TermStatus.OPEN:
+            raise InvalidRequestException(f"Invalid request. Term {term.status} currently not open.")
+
+        if request.time_budget_seconds > self.max_budget_seconds:
+            raise InvalidRequestException(
+                f"Invalid request. Time budget must not exceed {self.max_budget_seconds} seconds."
+            )
+        if not start_times(request.day_start, request.day_end, request.meeting_minutes, request.slot_step_minutes):
+            raise InvalidRequestException(
+                f"Invalid request. No {request.meeting_minutes} minute meeting fits between "
+                f"{request.day_start} and {request.day_end}."
+            )
+
+        if request.room_ids is not None:
+            existing_room_ids = set(await RoomRepository(db).get_existing_ids(set(request.room_ids)))
+            missing = [room_id for room_id in request.room_ids if room_id not in existing_room_ids]
+            if missing:
+                raise ResourceNotFoundException(f"Room not found: {', '.join(missing)}.")
+
+        if len(self._runs) >= self.max_running_jobs:
+            raise ServiceUnavailableException("Timetable solver is busy. Please try again later.")
+
+        job_repo = TimetableSolverJobRepository(db)
+        now = datetime.now(timezone.utc)
+        await job_repo.delete_expired_jobs(now - self.job_ttl)
+        await job_repo.fail_stale_jobs(term_id, heartbeat_before=now - self.stale_after, completed_at=now)
+
+        try:
+            job: TimetableSolverJob = await job_repo.create(
+                id=str(uuid.uuid4()),
+                term_id=term_id,
+                status=TimetableJobStatus.QUEUED,
+                request=request.model_dump(mode="json"),
+                requested_by=requested_by,
+                requested_by_id=requested_by_id
+            )
+        except IntegrityError:
+            # the running job of the term, submitted to this or another worker
+            await db.rollback()
+            raise InvalidRequestException(f"A timetable solver job of term {term_id} is already running.")
+
+        run = TimetableSolverRun(job_id=job.id, term_id=term_id, request=request)
+        self._runs[job.id] = run
+        run.task = asyncio.create_task(self._run(run), name=f"timetable-solver-{job.id}")
+        return job
+
+
+    async def get_job(self, db: AsyncSession, job_id: str) -> TimetableSolverJob:
+        job = await TimetableSolverJobRepository(db).get_by_id(job_id)
+        if job is None:
+            raise ResourceNotFoundException(f"Timetable solver job not found by id: {job_id}.")
+        return job
+
+
+    async def cancel(self, db: AsyncSession, job_id: str) -> TimetableSolverJob:
+        job = await TimetableSolverJobRepository(db).transition(
+            job_id,
+            ACTIVE_STATUSES,
+            status=TimetableJobStatus.CANCELLED,
+            completed_at=datetime.now(timezone.utc)
+        )
+        if job is None:
+            job = await self.get_job(db, job_id)
+            raise InvalidRequestException(f"Invalid request. Timetable solver job {job.status.lower()}.")
+
+        # the solver returns its best attempt so far, the proposal is dropped;
+        # a job running on another worker stops at its next heartbeat
+        run = self._runs.get(job_id)
+        if run is not None:
+            run.stop_requested.set()
+        return job
+
+
+    async def commit(
+        self, db: AsyncSession, job_id: str, requested_by: str = None
+    ) -> ScheduleImportResponseSchema:
+        """Import the proposal of a finished job to the term timetable."""
+        job_repo = TimetableSolverJobRepository(db)
+        job = await self.get_job(db, job_id)
+        if job.status != TimetableJobStatus.DONE:
+            raise InvalidRequestException(
+                f"Invalid request. Timetable solver job {job.status.lower()}, only a finished proposal can be committed."
+            )
+        if not job.proposal:
+            raise InvalidRequestException("Invalid request. Timetable solver job has nothing to commit.")
+
+        # one commit per proposal, concurrent commit requests (any worker) are refused
+        job = await job_repo.transition(job_id, (TimetableJobStatus.DONE,), status=TimetableJobStatus.COMMITTED)
+        if job is None:
+            raise InvalidRequestException("Invalid request. Timetable solver job already committed.")
+
+        try:
+            return await ScheduleImportService(db).import_schedules(
+                term_id=job.term_id,
+                schedules=[
+                    ClassScheduleRequestSchema(
+                        class_section_id=row["class_section_id"],
+                        room_id=row["room_id"],
+                        day_of_week=row["day_of_week"],
+                        start_time=row["start_time"],
+                        end_time=row["end_time"]
+                    )
+                    for row in job.proposal
+                ],
+                requested_by=requested_by
+            )
+        except Exception:
+            async with self.session_factory() as session:
+                await TimetableSolverJobRepository(session).transition(
+                    job_id, (TimetableJobStatus.COMMITTED,), status=TimetableJobStatus.DONE
+                )
+            raise
+
+
+    def format_job_response(
+        self, job: TimetableSolverJob, requested_by: str = None
+    ) -> TimetableSolverJobResponseSchema:
+        elapsed_seconds = job.elapsed_seconds
+        if job.status == TimetableJobStatus.RUNNING and job.started_at is not None:
+            elapsed_seconds = (datetime.now(timezone.utc) - job.started_at).total_seconds()
+
+        return TimetableSolverJobResponseSchema(
+            job_id=job.id,
+            term_id=job.term_id,
+            status=job.status,
+            progress=round(job.progress, 3),
+            attempts=job.attempts,
+            sections_total=job.sections_total,
+            meetings_total=job.meetings_total,
+            meetings_assigned=job.meetings_assigned,
+            elapsed_seconds=round(elapsed_seconds, 3),
+            submitted_at=job.submitted_at,
+            completed_at=job.completed_at,
+            proposal=job.proposal or [],
+            unassigned=job.unassigned or [],
+            error=job.error,
+            request_log=GenericResponse(
+                success=job.status != TimetableJobStatus.FAILED,
+                requested_at=datetime.now(timezone.utc),
+                requested_by=requested_by,
+                description=f"Timetable solver job {job.status.lower()}."
+            )
+        )
+
+
+    async def stop(self) -> None:
+        runs = list(self._runs.values())
+        for run in runs:
+            run.stop_requested.set()
+        tasks = [run.task for run in runs if run.task is not None and not run.task.done()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        # frees the terms at once instead of after the stale heartbeat
+        if runs:
+            try:
+                async with self.session_factory() as db:
+                    job_repo = TimetableSolverJobRepository(db)
+                    for run in runs:
+                        await job_repo.transition(
+                            run.job_id,
+                            ACTIVE_STATUSES,
+                            status=TimetableJobStatus.CANCELLED,
+                            error="The server stopped while solving the timetable.",
+                            completed_at=datetime.now(timezone.utc)
+                        )
+            except Exception as e:
+                logger.error("Cancelling the timetable solver jobs on shutdown failed: %s", str(e))
+
+
+    async def _load(self, run: TimetableSolverRun) -> Tuple[TimetableSolver, List[TimetableUnassignedSectionSchema], Dict[str, SolverSection]]:
+        request = run.request
+
+        async with self.session_factory() as db:
+            sections = await ClassSectionRepository(db).get_unscheduled_sections(run.term_id)
+            professor_ids = await ProfessorClassSectionRepository(db).get_professor_ids_by_sections(
+                [section.class_section_id for section in sections]
+            )
+            rooms = await RoomRepository(db).list_rooms(request.room_ids)
+            existing_slots = await ScheduleConflictService(db).load_term_slots(run.term_id)
+
+        unassigned: List[TimetableUnassignedSectionSchema] = []
+        solver_sections: Dict[str, SolverSection] = {}
+        for section in sections:
+            meetings = meetings_per_week(section.units, request.meeting_minutes)
+            if not professor_ids.get(section.class_section_id):
+                unassigned.append(TimetableUnassignedSectionSchema(
+                    class_section_id=section.class_section_id,
+                    section_code=section.section_code,
+                    meetings_required=meetings,
+                    meetings_assigned=0,
+                    detail="No professor assigned to class section"
+                ))
+                continue
+            if meetings > len(request.days):
+                # every meeting of a section falls on a different day
+                unassigned.append(TimetableUnassignedSectionSchema(
+                    class_section_id=section.class_section_id,
+                    section_code=section.section_code,
+                    meetings_required=meetings,
+                    meetings_assigned=0,
+                    detail=f"Needs {meetings} meetings per week but only {len(request.days)} days are schedulable"
+                ))
+                continue
+            solver_sections[section.class_section_id] = SolverSection(
+                class_section_id=section.class_section_id,
+                section_code=section.section_code,
+                meetings=meetings,
+                professor_ids=tuple(professor_ids[section.class_section_id])
+            )
+
+        solver = TimetableSolver(
+            sections=list(solver_sections.values()),
+            room_ids=[room.id for room in rooms],
+            days=request.days,
+            times=start_times(request.day_start, request.day_end, request.meeting_minutes, request.slot_step_minutes),
+            existing_slots=existing_slots
+        )
+        return solver, unassigned, solver_sections
+
+
+    async def _heartbeat(self, run: TimetableSolverRun) -> None:
+        """Save the progress of the run, stop it once the job is cancelled (from any worker)."""
+        while not run.stop_requested.is_set():
+            await asyncio.sleep(self.heartbeat_seconds)
+            try:
+                async with self.session_factory() as db:
+                    job = await TimetableSolverJobRepository(db).transition(
+                        run.job_id,
+                        (TimetableJobStatus.RUNNING,),
+                        progress=run.progress,
+                        attempts=run.attempts,
+                        meetings_assigned=run.meetings_assigned,
+                        heartbeat_at=datetime.now(timezone.utc)
+                    )
+            except Exception as e:
+                logger.warning("Timetable solver job %s heartbeat failed: %s", run.job_id, str(e))
+                continue
+            if job is None:
+                run.stop_requested.set()
+
+
+    async def _run(self, run: TimetableSolverRun) -> None:
+        heartbeat: Optional[asyncio.Task] = None
+        try:
+            solver, unassigned, solver_sections = await self._load(run)
+
+            async with self.session_factory() as db:
+                job_repo = TimetableSolverJobRepository(db)
+                started_at = datetime.now(timezone.utc)
+                job = await job_repo.transition(
+                    run.job_id,
+                    (TimetableJobStatus.QUEUED,),
+                    status=TimetableJobStatus.RUNNING,
+                    sections_total=len(solver_sections) + len(unassigned),
+                    meetings_total=sum(section.meetings for section in solver_sections.values()),
+                    started_at=started_at,
+                    heartbeat_at=started_at
+                )
+            if job is None:
+                # cancelled while loading
+                return
+            heartbeat = asyncio.create_task(self._heartbeat(run), name=f"timetable-solver-heartbeat-{run.job_id}")
+
+            def on_progress(progress: float, attempts: int, meetings_assigned: int) -> None:
+                run.progress = progress
+                run.attempts = attempts
+                run.meetings_assigned = meetings_assigned
+
+            # CPU bound search off the event loop
+            started = clock.monotonic()
+            result: SolverResult = await asyncio.to_thread(
+                solver.solve,
+                run.request.time_budget_seconds,
+                on_progress,
+                run.stop_requested.is_set
+            )
+            elapsed_seconds = clock.monotonic() - started
+            if run.stop_requested.is_set():
+                return
+
+            proposal: List[TimetableProposalRowSchema] = []
+            assigned: Dict[str, int] = {}
+            for slot in sorted(result.slots, key=lambda slot: (slot.section_code, slot.day_of_week, slot.start_time)):
+                assigned[slot.class_section_id] = assigned.get(slot.class_section_id, 0) + 1
+                proposal.append(TimetableProposalRowSchema(
+                    class_section_id=slot.class_section_id,
+                    section_code=slot.section_code,
+                    room_id=slot.room_id,
+                    day_of_week=slot.day_of_week,
+                    start_time=slot.start_time,
+                    end_time=slot.end_time
+                ))
+
+            for section in solver_sections.values():
+                if section.class_section_id not in assigned:
+                    unassigned.append(TimetableUnassignedSectionSchema(
+                        class_section_id=section.class_section_id,
+                        section_code=section.section_code,
+                        meetings_required=section.meetings,
+                        meetings_assigned=0,
+                        detail=f"No free room and time left for {section.meetings} weekly meetings of {section.section_code}."
+                    ))
+
+            # a cancel that came in after the search keeps the job cancelled
+            async with self.session_factory() as db:
+                await TimetableSolverJobRepository(db).transition(
+                    run.job_id,
+                    (TimetableJobStatus.RUNNING,),
+                    status=TimetableJobStatus.DONE,
+                    progress=1.0,
+                    attempts=result.attempts,
+                    meetings_assigned=len(proposal),
+                    elapsed_seconds=elapsed_seconds,
+                    proposal=[row.model_dump(mode="json") for row in proposal],
+                    unassigned=[
+                        section.model_dump(mode="json")
+                        for section in sorted(unassigned, key=lambda section: section.section_code)
+                    ],
+                    completed_at=datetime.now(timezone.utc)
+                )
+
+        except asyncio.CancelledError:
+            # server shutdown, stop() cancels the job row
+            raise
+        except Exception as e:
+            logger.error("Timetable solver job %s failed: %s", run.job_id, str(e))
+            try:
+                async with self.session_factory() as db:
+                    await TimetableSolverJobRepository(db).transition(
+                        run.job_id,
+                        ACTIVE_STATUSES,
+                        status=TimetableJobStatus.FAILED,
+                        error="An error occurred while solving the timetable.",
+                        completed_at=datetime.now(timezone.utc)
+                    )
+            except Exception as error:
+                logger.error("Timetable solver job %s could not be marked failed: %s", run.job_id, str(error))
+        finally:
+            run.stop_requested.set()
+            if heartbeat is not None:
+                heartbeat.cancel()
+            self._runs.pop(run.job_id, None)
+
+
+timetable_solver_jobs = TimetableSolverJobs(
+    max_running_jobs=settings.TIMETABLE_SOLVER_MAX_RUNNING_JOBS,
+    max_budget_seconds=settings.TIMETABLE_SOLVER_MAX_BUDGET_SECONDS,
+    job_ttl_seconds=settings.TIMETABLE_SOLVER_JOB_TTL_SECONDS,
+    heartbeat_seconds=settings.TIMETABLE_SOLVER_HEARTBEAT_SECONDS
+)
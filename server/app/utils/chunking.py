@@ -0,0 +1,12 @@
+"""
+    Date Written: 10/19/2026 at 1:15 PM
+"""
+
+from typing import Iterator, List, Sequence, TypeVar
+
+T = TypeVar("T")
+
+def chunked(items: Sequence[T], size: int) -> Iterator[List[T]]:
+    """Split items into lists of at most size items (in order)."""
+    for start in range(0, len(items), size):
+        yield list(items[start:start + size])
@@ -0,0 +1,146 @@
+"""
+    Date Written: 10/19/2026 at 3:00 PM
+
+    Augmented interval tree for in-memory schedule planning.
+    Randomized treap ordered by interval start, every node keeps the
+    max end of its subtree so overlap queries can skip whole subtrees.
+        - add / remove: O(log n) expected
+        - overlaps(start, end): O(log n + k)
+    Intervals are half-open [start, end), touching intervals do not overlap.
+"""
+
+import itertools
+import random
+from typing import Any, Generic, Iterator, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+# (start, end, insertion sequence), unique key of an interval in the tree
+IntervalHandle = Tuple[int, int, int]
+
+
+class _Node:
+    __slots__ = ("key", "value", "priority", "max_end", "left", "right")
+
+    def __init__(self, key: IntervalHandle, value: Any):
+        self.key = key
+        self.value = value
+        self.priority = random.random()
+        self.max_end = key[1]
+        self.left: Optional["_Node"] = None
+        self.right: Optional["_Node"] = None
+
+
+def _refresh(node: _Node) -> _Node:
+    max_end = node.key[1]
+    if node.left is not None and node.left.max_end > max_end:
+        max_end = node.left.max_end
+    if node.right is not None and node.right.max_end > max_end:
+        max_end = node.right.max_end
+    node.max_end = max_end
+    return node
+
+
+def _split(node: Optional[_Node], key: IntervalHandle) -> Tuple[Optional[_Node], Optional[_Node]]:
+    """Split into (keys < key, keys >= key)."""
+    if node is None:
+        return None, None
+
+    if node.key < key:
+        node.right, right = _split(node.right, key)
+        return _refresh(node), right
+
+    left, node.left = _split(node.left, key)
+    return left, _refresh(node)
+
+
+def _merge(left: Optional[_Node], right: Optional[_Node]) -> Optional[_Node]:
+    """Merge two treaps, every key of left < every key of right."""
+    if left is None:
+        return right
+    if right is None:
+        return left
+
+    if left.priority > right.priority:
+        left.right = _merge(left.right, right)
+        return _refresh(left)
+
+    right.left = _merge(left, right.left)
+    return _refresh(right)
+
+
+class IntervalTree(Generic[T]):
+    def __init__(self):
+        self._root: Optional[_Node] = None
+        self._size = 0
+        self._seq = itertools.count()
+
+
+    def __len__(self) -> int:
+        return self._size
+
+
+    def add(self, start: int, end: int, value: T) -> IntervalHandle:
+        """Add [start, end) and return its handle (needed to remove it)."""
+        if start >= end:
+            raise ValueError(f"Invalid interval [{start}, {end}).")
+
+        key: IntervalHandle = (start, end, next(self._seq))
+        left, right = _split(self._root, key)
+        self._root = _merge(_merge(left, _Node(key, value)), right)
+        self._size += 1
+        return key
+
+
+    def remove(self, handle: IntervalHandle) -> bool:
+        """Remove the interval added with the handle."""
+        left, rest = _split(self._root, handle)
+        middle, right = _split(rest, (handle[0], handle[1], handle[2] + 1))
+        self._root = _merge(left, right)
+
+        if middle is None:
+            return False
+        self._size -= 1
+        return True
+
+
+    def overlaps(self, start: int, end: int) -> List[Tuple[int, int, T]]:
+        """Every interval overlapping [start, end), ordered by start."""
+        found: List[Tuple[int, int, T]] = []
+        stack: List[Tuple[_Node, bool]] = []
+        if self._root is not None:
+            stack.append((self._root, False))
+
+        # iterative in-order walk, pruned by max_end (left side) and start (right side)
+        while stack:
+            node, visited = stack.pop()
+            if node.max_end <= start:
+                continue
+
+            if visited:
+                node_start, node_end, _ = node.key
+                if node_end > start:
+                    found.append((node_start, node_end, node.value))
+                continue
+
+            if node.right is not None and node.key[0] < end:
+                stack.append((node.right, False))
+            if node.key[0] < end:
+                stack.append((node, True))
+            if node.left is not None:
+                stack.append((node.left, False))
+
+        return found
+
+
+    def __iter__(self) -> Iterator[Tuple[int, int, T]]:
+        """Every interval ordered by start."""
+        stack: List[_Node] = []
+        node = self._root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.key[0], node.key[1], node.value
+            node = node.right
@@ -0,0 +1,76 @@
+"""
+    Date Written: 10/19/2026 at 9:20 PM
+
+    JSON response of a list of response schemas, serialized straight to
+    bytes by pydantic-core (TypeAdapter.dump_json).
+        - returned by the route instead of the list, FastAPI then skips the
+          response_model validation of every item (keep response_model on
+          the route for the docs)
+        - the items are trusted, built by the services from database rows
+          in one validation pass (models_from_rows)
+        - envelope=True: {"request_log": ..., "items": [...]}, the request
+          log shared by the items is written once instead of on every item
+"""
+
+from functools import lru_cache
+from typing import Any, List, Mapping, Optional, Sequence, Type
+
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
+
+
+@lru_cache(maxsize=None)
+def list_adapter(model: Type[BaseModel]) -> TypeAdapter:
+    # building an adapter compiles a serializer, one per schema
+    return TypeAdapter(List[model])
+
+
+def models_from_rows(model: Type[BaseModel], rows: Sequence[Any], **shared: Any) -> List[BaseModel]:
+    """
+        Response schemas of many database rows (ORM objects or Rows) in one
+        pydantic-core pass, reading the fields from the row attributes.
+        shared: values set on every item, not validated again (e.g. one request_log per response).
+    """
+    items = list_adapter(model).validate_python(rows, from_attributes=True)
+    for item in items:
+        # stored as model_copy(update=) does, without copying every item:
+        # the shared values count as set (exclude_unset dumps keep them)
+        item.__dict__.update(shared)
+        item.__pydantic_fields_set__.update(shared)
+    return items
+
+
+def dump_models_json(items: Sequence[BaseModel], model: Type[BaseModel]) -> bytes:
+    return list_adapter(model).dump_json(list(items), warnings=False)
+
+
+def dump_envelope_json(items: Sequence[BaseModel], model: Type[BaseModel]) -> bytes:
+    """The items without their request log, the (shared) log of the first item once."""
+    request_log = getattr(items[0], "request_log", None) if items else None
+    log_json = request_log.model_dump_json().encode() if request_log is not None else b"null"
+    items_json = list_adapter(model).dump_json(
+        list(items), exclude={"__all__": {"request_log"}}, warnings=False
+    )
+    return b'{"request_log":' + log_json + b',"items":' + items_json + b"}"
+
+
+class ModelListResponse(Response):
+    media_type = "application/json"
+
+    def __init__(
+        self,
+        content: Sequence[BaseModel],
+        model: Type[BaseModel],
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+        envelope: bool = False,
+    ) -> None:
+        self.model = model
+        self.envelope = envelope
+        super().__init__(content=content, status_code=status_code, headers=headers)
+
+
+    def render(self, content: Any) -> bytes:
+        if self.envelope:
+            return dump_envelope_json(content, self.model)
+        return dump_models_json(content, self.model)
@@ -0,0 +1,86 @@
+"""
+    Date Written: 10/20/2026 at 2:10 AM
+
+    Prometheus metrics of the API, scraped on GET /metrics.
+    Several uvicorn workers: set PROMETHEUS_MULTIPROC_DIR to an empty
+    directory (wiped before every start) in the environment of all of them,
+    every process then writes its samples to mmap files there and /metrics
+    aggregates the files of every worker, whichever worker answers. The face
+    inference worker may share the directory, its pool processes add the
+    face stage timings. Without the variable /metrics only shows the
+    answering process.
+
+    Verification success ratio:
+        sum(rate(face_verifications_total{result="verified"}[5m]))
+            / sum(rate(face_verifications_total[5m]))
+"""
+
+import os
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Gauge, Histogram, generate_latest, multiprocess
+)
+
+MULTIPROCESS = "PROMETHEUS_MULTIPROC_DIR" in os.environ
+
+REQUEST_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 5)
+FACE_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERY_OPERATIONS = {"SELECT", "INSERT", "UPDATE", "DELETE"}
+
+# HTTP
+http_request_duration = Histogram(
+    "http_request_duration_seconds", "Request latency by route template.",
+    ["method", "route", "status"], buckets=REQUEST_BUCKETS
+)
+http_requests_in_progress = Gauge(
+    "http_requests_in_progress", "Requests being handled.", multiprocess_mode="livesum"
+)
+
+# database
+db_pool_checkout_wait = Histogram(
+    "db_pool_checkout_wait_seconds", "Wait for a pooled connection (new connections included).",
+    buckets=QUERY_BUCKETS
+)
+db_pool_checked_out = Gauge(
+    "db_pool_checked_out_connections", "Connections checked out of the pool.", multiprocess_mode="livesum"
+)
+db_pool_timeouts = Counter("db_pool_timeouts", "Checkouts failed on the pool timeout.")
+db_query_duration = Histogram(
+    "db_query_duration_seconds", "Statement latency.", ["operation"], buckets=QUERY_BUCKETS
+)
+
+# face pipeline
+face_stage_duration = Histogram(
+    "face_stage_duration_seconds", "Face engine stage latency (decode per image, detect/encode/compare per batch).",
+    ["stage"], buckets=FACE_BUCKETS
+)
+face_request_duration = Histogram(
+    "face_request_duration_seconds", "Face encode/compare latency seen by the API, batching wait included.",
+    ["op", "backend"], buckets=FACE_BUCKETS
+)
+face_verifications = Counter("face_verifications", "Face verifications by outcome.", ["result"])
+
+# authentication
+auth_failures = Counter("auth_failures", "Failed token requests by reason.", ["reason"])
+auth_bans = Counter("auth_bans", "Users banned after too many failed attempts.")
+
+
+def observe_query(statement: str, parameters, elapsed: float) -> None:
+    operation = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else ""
+    db_query_duration.labels(operation if operation in QUERY_OPERATIONS else "OTHER").observe(elapsed)
+
+
+def metrics_payload() -> bytes:
+    """Text exposition of every metric, of all the worker processes in multiprocess mode."""
+    if MULTIPROCESS:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry)
+    return generate_latest(REGISTRY)
+
+
+def mark_process_dead() -> None:
+    """Drop the live gauges of this process from the aggregate (worker shutdown)."""
+    if MULTIPROCESS:
+        multiprocess.mark_process_dead(os.getpid())
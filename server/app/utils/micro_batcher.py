@@ -0,0 +1,102 @@
+"""
+    Date Written: 10/20/2026 at 12:50 AM
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Generic, List, Optional, Set, Tuple, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class MicroBatcher(Generic[T, R]):
+    """
+        Groups the items submitted by concurrent coroutines into one call of
+        handler(items) -> results (same order), flushed when max_size items
+        are waiting or max_wait seconds after the first one. Every submitter
+        gets its own result (or the exception of its batch, cancelled
+        when the batch is).
+        At most max_concurrency batches run at once (None: no limit), while
+        they all run the new items wait and leave together in the next batch,
+        so the batches grow with the load even with max_wait 0.
+        max_size 1: no batching.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[List[T]], Awaitable[List[R]]],
+        max_size: int,
+        max_wait: float,
+        max_concurrency: Optional[int] = None,
+    ):
+        self.handler = handler
+        self.max_size = max(1, max_size)
+        self.max_wait = max_wait
+        self.max_concurrency = max_concurrency
+        self._waiting: List[Tuple[T, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._running: Set[asyncio.Task] = set()
+        self.batch_cnt = 0
+        self.item_cnt = 0
+
+
+    async def submit(self, item: T) -> R:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._waiting.append((item, future))
+
+        if len(self._waiting) >= self.max_size or self.max_wait <= 0:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+        return await future
+
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        while self._waiting and (self.max_concurrency is None or len(self._running) < self.max_concurrency):
+            batch, self._waiting = self._waiting[:self.max_size], self._waiting[self.max_size:]
+            task = asyncio.create_task(self._run(batch))
+            self._running.add(task)
+            task.add_done_callback(lambda task, batch=batch: self._batch_done(task, batch))
+
+
+    def _batch_done(self, task: asyncio.Task, batch: List[Tuple[T, asyncio.Future]]) -> None:
+        self._running.discard(task)
+        # cancelled before its first step, _run never started
+        for _, future in batch:
+            if not future.done():
+                future.cancel()
+        # items held back while every slot was busy
+        if self._waiting:
+            self._flush()
+
+
+    async def _run(self, batch: List[Tuple[T, asyncio.Future]]) -> None:
+        self.batch_cnt += 1
+        self.item_cnt += len(batch)
+        try:
+            results = await self.handler([item for item, _ in batch])
+            if len(results) != len(batch):
+                # the results cannot be matched to the items
+                raise RuntimeError(f"Batch handler returned {len(results)} results for {len(batch)} items.")
+        except BaseException as e:
+            # cancelled too (shutdown): no submitter may be left waiting
+            for _, future in batch:
+                if future.done():
+                    continue
+                if isinstance(e, Exception):
+                    future.set_exception(e)
+                else:
+                    future.cancel()
+            if not isinstance(e, Exception):
+                raise
+            return
+
+        for (_, future), result in zip(batch, results):
+            # done: the submitter was cancelled meanwhile
+            if not future.done():
+                future.set_result(result)
@@ -0,0 +1,65 @@
+"""
+    Date Written: 10/19/2026 at 6:20 PM
+
+    Weekly timetable as a bitset, one bit per minute of the week
+    (7 x 1440 bits held in a Python int).
+        - a meeting is the run of bits [start, end) of its day
+        - two timetables clash when their bitsets share a bit (a & b)
+    Half-open like the schedule conflict checks, back to back meetings
+    (one ends 10:00, the next starts 10:00) do not clash.
+"""
+
+from datetime import time
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+MINUTES_PER_DAY = 24 * 60
+
+
+def meeting_mask(day_of_week: int, start_time: time, end_time: time) -> int:
+    """Bits of one weekly meeting (day_of_week 1=Mon .. 7=Sun)."""
+    start = start_time.hour * 60 + start_time.minute
+    end = end_time.hour * 60 + end_time.minute
+    if end <= start:
+        return 0
+
+    offset = (day_of_week - 1) * MINUTES_PER_DAY
+    return ((1 << (end - start)) - 1) << (offset + start)
+
+
+def section_masks(schedules: Iterable[Any]) -> Dict[str, int]:
+    """Weekly bits of every class section (rows with class_section_id and meeting times)."""
+    masks: Dict[str, int] = {}
+    for schedule in schedules:
+        if schedule.day_of_week is None or schedule.start_time is None or schedule.end_time is None:
+            masks.setdefault(schedule.class_section_id, 0)
+            continue
+        masks[schedule.class_section_id] = masks.get(schedule.class_section_id, 0) | meeting_mask(
+            schedule.day_of_week, schedule.start_time, schedule.end_time
+        )
+    return masks
+
+
+class WeeklyTimetable:
+    """Occupied minutes of one student in one term, with the sections occupying them."""
+    def __init__(self):
+        self.mask = 0
+        self._sections: Dict[str, Tuple[str, int]] = {}
+
+
+    def add(self, class_section_id: str, section_code: str, mask: int) -> None:
+        self._sections[class_section_id] = (section_code, mask)
+        self.mask |= mask
+
+
+    def fits(self, mask: int) -> bool:
+        return self.mask & mask == 0
+
+
+    def clash_with(self, mask: int) -> Optional[str]:
+        """Section code of a section clashing with the bits, None when they fit."""
+        if self.fits(mask):
+            return None
+        return next(
+            section_code for section_code, section_mask in self._sections.values()
+            if section_mask & mask
+        )
@@ -0,0 +1,104 @@
+"""
+    Date Written: 10/20/2026 at 4:10 AM
+
+    Scheduling check of the enrollment admission queue, no database needed:
+    the enrollment itself is replaced by a fixed sleep. Submits a burst of
+    tickets on one hot class section, mixed with tickets of other sections,
+    and checks that the other sections still progress while the hot section
+    runs its tickets one slot at a time (the workers must not all park on
+    the hot section).
+
+    Run from the server directory:
+        python -m scripts.admission_queue_harness --hot 40 --sections 10 --per-section 2
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+from typing import Dict, List
+
+from app.services.enrollment_admission_queue import EnrollmentAdmissionQueue, EnrollmentTicket
+
+HOT_SECTION = "hot-section"
+
+
+class SimulatedQueue(EnrollmentAdmissionQueue):
+    """Admission queue whose enrollment is a sleep, records the finish time per section."""
+    def __init__(self, service_time: float, **kwargs):
+        super().__init__(**kwargs)
+        self.service_time = service_time
+        self.running: Dict[str, int] = {}
+        self.max_running: Dict[str, int] = {}
+        self.finished_at: Dict[str, List[float]] = {}
+
+
+    async def _run(self, ticket: EnrollmentTicket) -> None:
+        section_id = ticket.class_section_id
+        self.running[section_id] = self.running.get(section_id, 0) + 1
+        self.max_running[section_id] = max(self.max_running.get(section_id, 0), self.running[section_id])
+        try:
+            await asyncio.sleep(self.service_time)
+        finally:
+            self.running[section_id] -= 1
+        self.finished_at.setdefault(section_id, []).append(time.perf_counter())
+        self._finish(ticket)
+
+
+async def main(args) -> int:
+    queue = SimulatedQueue(
+        service_time=args.service_ms / 1000,
+        workers=args.workers,
+        section_concurrency=args.section_concurrency,
+        max_size=args.hot + args.sections * args.per_section,
+        ticket_ttl_seconds=60
+    )
+    await queue.start()
+
+    other_sections = [f"section-{i}" for i in range(args.sections)]
+    started = time.perf_counter()
+    # the hot burst first, then the other sections interleaved with more hot tickets
+    tickets = [queue.submit(str(uuid.uuid4()), HOT_SECTION, "harness", "harness") for _ in range(args.hot // 2)]
+    for round in range(args.per_section):
+        for section_id in other_sections:
+            tickets.append(queue.submit(str(uuid.uuid4()), section_id, "harness", "harness"))
+            if round == 0 and len(tickets) < args.hot:
+                tickets.append(queue.submit(str(uuid.uuid4()), HOT_SECTION, "harness", "harness"))
+    tickets += [
+        queue.submit(str(uuid.uuid4()), HOT_SECTION, "harness", "harness")
+        for _ in range(args.hot - sum(ticket.class_section_id == HOT_SECTION for ticket in tickets))
+    ]
+
+    await asyncio.gather(*(ticket.finished.wait() for ticket in tickets))
+    await queue.stop()
+
+    hot_done = (queue.finished_at[HOT_SECTION][-1] - started) * 1000
+    other_done = [
+        (finished - started) * 1000 for section_id in other_sections for finished in queue.finished_at[section_id]
+    ]
+    # other sections: their own work spread over the workers left next to the hot slot
+    other_budget = args.service_ms * (args.sections * args.per_section / max(args.workers - args.section_concurrency, 1) + 2)
+
+    print(f"hot section:    {args.hot} tickets done after {hot_done:.0f} ms "
+          f"(max {queue.max_running[HOT_SECTION]} running)")
+    print(f"other sections: {len(other_done)} tickets, median {statistics.median(other_done):.0f} ms, "
+          f"last {max(other_done):.0f} ms (budget {other_budget:.0f} ms)")
+
+    ok = (
+        max(other_done) <= other_budget
+        and all(running <= args.section_concurrency for running in queue.max_running.values())
+    )
+    print("OK" if ok else "FAILED: other sections waited behind the hot section or a section exceeded its slots")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--hot", type=int, default=40, help="tickets of the hot section")
+    parser.add_argument("--sections", type=int, default=10, help="other sections")
+    parser.add_argument("--per-section", type=int, default=2, help="tickets of every other section")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--section-concurrency", type=int, default=1)
+    parser.add_argument("--service-ms", type=float, default=20, help="simulated enrollment time")
+    raise SystemExit(asyncio.run(main(parser.parse_args())))
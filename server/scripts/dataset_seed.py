@@ -0,0 +1,356 @@
+"""
+    Date Written: 10/19/2026 at 10:30 PM
+
+    Bulk seeded academic dataset for plan checks, load tests and benchmarks.
+        - one building with rooms, departments / programs / curricula, a
+          course list per program, three terms of one far future academic
+          year (FIRST is OPEN), course offerings, class sections with two
+          weekly meetings and one professor each
+        - students spread over the programs, each enrolled in up to
+          enrollments_per_student sections of the open term, and one face
+          encoding per student
+        - registrars, if any
+    Every user gets password_hash (a real hash for login load tests).
+    Plain Core INSERTs in chunks, every row tagged so cleanup removes
+    exactly what was seeded.
+
+    Run from the server directory against a local (non production) database:
+        python -m scripts.dataset_seed --students 10000 --keep
+        python -m scripts.dataset_seed --cleanup TAG
+"""
+
+import argparse
+import asyncio
+import random
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, time, timedelta, timezone
+from typing import Any, Dict, List
+
+from sqlalchemy import delete, insert, select
+
+from app.db.db_session import async_session, engine
+from app.db.model_registry import import_all_models
+from app.models.academic_structures.class_schedule import ClassSchedule
+from app.models.academic_structures.class_section import ClassSection
+from app.models.academic_structures.course import Course
+from app.models.academic_structures.course_offering import CourseOffering
+from app.models.academic_structures.curriculum import Curriculum
+from app.models.academic_structures.curriculum_course import CurriculumCourse
+from app.models.academic_structures.department import Department
+from app.models.academic_structures.professor_class_section import ProfessorClassSection
+from app.models.academic_structures.program import Program
+from app.models.academic_structures.term import Term
+from app.models.enrollment_and_gradings.enrollment import Enrollment
+from app.models.enums.academic_structure_state import *
+from app.models.enums.enrollment_and_grading_state import EnrollmentStatus
+from app.models.enums.user_state import UserGender, UserRole, UserStatus
+from app.models.face_recognitions.face_encoding import FaceEncoding
+from app.models.locations.building import Building
+from app.models.locations.room import Room
+from app.models.users.base_user import BaseUser
+from app.models.users.professor import Professor
+from app.models.users.registrar import Registrar
+from app.models.users.student import Student
+from app.utils.chunking import chunked
+
+import_all_models()
+
+INSERT_CHUNK_SIZE = 5000
+
+# (day pair, start hour) of the two weekly meetings of a section
+MEETING_PATTERNS = [((1, 3), hour) for hour in range(7, 19)] + [((2, 4), hour) for hour in range(7, 19)]
+
+
+@dataclass
+class SeededDataset:
+    tag: str
+    rows: Dict[str, List[str]] = field(default_factory=dict)
+    open_term_id: str = None
+
+    def ids(self, table: str) -> List[str]:
+        return self.rows.get(table, [])
+
+    def counts(self) -> Dict[str, int]:
+        return {table: len(ids) for table, ids in self.rows.items()}
+
+
+def _uid() -> str:
+    return str(uuid.uuid4())
+
+
+def _user(tag: str, kind: str, i: int, role: UserRole, password_hash: str = "x") -> Dict[str, Any]:
+    return {
+        "id": _uid(), "first_name": kind.title(), "last_name": f"{tag} {i}", "gender": UserGender.MALE,
+        "complete_address": "N/A", "email": f"{kind}.{tag.lower()}.{i}@example.com",
+        "cellphone_number": "09000000000", "password_hash": password_hash, "role": role,
+        "status": UserStatus.APPROVED, "is_active": True,
+    }
+
+
+async def _insert(db, model, rows: List[Dict[str, Any]], dataset: SeededDataset) -> None:
+    for chunk in chunked(rows, INSERT_CHUNK_SIZE):
+        # the table, not the mapper: joined inheritance would write base_user too
+        await db.execute(insert(model.__table__), chunk)
+    dataset.rows.setdefault(model.__tablename__, []).extend(row["id"] for row in rows)
+
+
+async def seed_dataset(
+    students: int,
+    programs: int = 4,
+    courses_per_program: int = 10,
+    sections_per_offering: int = 4,
+    enrollments_per_student: int = 5,
+    professors: int = 40,
+    rooms: int = 30,
+    registrars: int = 0,
+    password_hash: str = "x",
+    seed: int = 7,
+) -> SeededDataset:
+    rng = random.Random(seed)
+    tag = uuid.uuid4().hex[:6].upper()
+    dataset = SeededDataset(tag=tag)
+    now = datetime.now(timezone.utc)
+
+    async with async_session() as db:
+        building = {"id": _uid(), "name": f"Seed Building {tag}", "room_capacity": rooms}
+        await _insert(db, Building, [building], dataset)
+        room_rows = [{"id": _uid(), "room_code": f"R{tag}{i:03d}"[:10], "building_id": building["id"]} for i in range(rooms)]
+        await _insert(db, Room, room_rows, dataset)
+
+        department_rows, program_rows, curriculum_rows = [], [], []
+        for p in range(programs):
+            department_rows.append({
+                "id": _uid(), "title": f"Seed Department {tag} {p}", "department_code": f"D{tag}{p}",
+                "building_id": building["id"]
+            })
+            program_rows.append({
+                "id": _uid(), "title": f"Seed Program {tag} {p}", "program_code": f"P{tag}{p}",
+                "department_id": department_rows[-1]["id"]
+            })
+            curriculum_rows.append({
+                "id": _uid(), "title": f"Seed Curriculum {tag} {p}", "effective_from": now.year,
+                "status": CurriculumStatus.ACTIVE, "program_id": program_rows[-1]["id"]
+            })
+        await _insert(db, Department, department_rows, dataset)
+        await _insert(db, Program, program_rows, dataset)
+        await _insert(db, Curriculum, curriculum_rows, dataset)
+
+        course_rows, curriculum_course_rows = [], []
+        for p, curriculum in enumerate(curriculum_rows):
+            for c in range(courses_per_program):
+                number = p * courses_per_program + c
+                course_rows.append({
+                    "id": _uid(), "title": f"Seed Course {tag} {number}", "course_code": f"C{tag}{number:03d}",
+                    "units": 3
+                })
+                curriculum_course_rows.append({
+                    "id": _uid(), "curriculum_id": curriculum["id"], "course_id": course_rows[-1]["id"],
+                    "year_level": 1, "semester": 1
+                })
+        await _insert(db, Course, course_rows, dataset)
+        await _insert(db, CurriculumCourse, curriculum_course_rows, dataset)
+
+        # one academic year no real term uses, FIRST is the one open for enrollment
+        while True:
+            year = rng.randint(2500, 2999)
+            taken = await db.execute(select(Term.id).where(Term.academic_year_start == year).limit(1))
+            if taken.first() is None:
+                break
+        term_rows = [
+            {
+                "id": _uid(), "academic_year_start": year, "academic_year_end": year + 1,
+                "enrollment_start": now - timedelta(days=1), "enrollment_end": now + timedelta(days=30),
+                "semester_period": period, "status": TermStatus.OPEN if period == SemesterPeriod.FIRST else TermStatus.DRAFT
+            }
+            for period in (SemesterPeriod.FIRST, SemesterPeriod.SECOND, SemesterPeriod.SUMMER)
+        ]
+        await _insert(db, Term, term_rows, dataset)
+        dataset.open_term_id = term_rows[0]["id"]
+
+        professor_users = [_user(tag, "professor", i, UserRole.PROFESSOR, password_hash) for i in range(professors)]
+        await _insert(db, BaseUser, professor_users, dataset)
+        await _insert(db, Professor, [
+            {"id": user["id"], "department_id": rng.choice(department_rows)["id"]} for user in professor_users
+        ], dataset)
+
+        registrar_users = [_user(tag, "registrar", i, UserRole.REGISTRAR, password_hash) for i in range(registrars)]
+        if registrar_users:
+            await _insert(db, BaseUser, registrar_users, dataset)
+            await _insert(db, Registrar, [{"id": user["id"]} for user in registrar_users], dataset)
+
+        # room for every student of a program in each of its courses
+        capacity = max(50, students // (programs * sections_per_offering) + 1)
+        offering_rows, section_rows, schedule_rows, assignment_rows = [], [], [], []
+        # open term sections per curriculum course, the enrollment candidates
+        open_sections: Dict[str, List[Dict[str, Any]]] = {}
+        for term in term_rows:
+            for curriculum_course in curriculum_course_rows:
+                offering_rows.append({
+                    "id": _uid(), "term_id": term["id"], "curriculum_course_id": curriculum_course["id"],
+                    "status": CourseOfferingStatus.APPROVED
+                })
+                for s in range(sections_per_offering):
+                    section = {
+                        "id": _uid(), "section_code": f"S{s}{len(section_rows) % 100000:05d}",
+                        "student_capacity": capacity, "current_student_cnt": 0, "status": ClassSectionStatus.OPEN,
+                        "course_offering_id": offering_rows[-1]["id"]
+                    }
+                    section_rows.append(section)
+                    if term["id"] == dataset.open_term_id:
+                        open_sections.setdefault(curriculum_course["id"], []).append(section)
+
+                    (day_a, day_b), hour = MEETING_PATTERNS[len(section_rows) % len(MEETING_PATTERNS)]
+                    room_id = room_rows[len(section_rows) % rooms]["id"]
+                    for day in (day_a, day_b):
+                        schedule_rows.append({
+                            "id": _uid(), "class_section_id": section["id"], "room_id": room_id,
+                            "day_of_week": day, "start_time": time(hour, 0), "end_time": time(hour, 50)
+                        })
+                    assignment_rows.append({
+                        "id": _uid(), "professor_id": rng.choice(professor_users)["id"],
+                        "class_section_id": section["id"]
+                    })
+
+        student_users = [_user(tag, "student", i, UserRole.STUDENT, password_hash) for i in range(students)]
+        student_rows, enrollment_rows, encoding_rows = [], [], []
+        courses_by_curriculum: Dict[str, List[Dict[str, Any]]] = {}
+        for curriculum_course in curriculum_course_rows:
+            courses_by_curriculum.setdefault(curriculum_course["curriculum_id"], []).append(curriculum_course)
+
+        for i, user in enumerate(student_users):
+            p = i % programs
+            student_rows.append({"id": user["id"], "program_id": program_rows[p]["id"], "year_level": 1})
+            encoding_rows.append({
+                "id": _uid(), "user_id": user["id"], "encoding": bytes(1024), "is_active": True
+            })
+
+            picked = rng.sample(
+                courses_by_curriculum[curriculum_rows[p]["id"]],
+                min(enrollments_per_student, courses_per_program)
+            )
+            for curriculum_course in picked:
+                candidates = [
+                    section for section in open_sections[curriculum_course["id"]]
+                    if section["current_student_cnt"] < section["student_capacity"]
+                ]
+                if not candidates:
+                    continue
+                section = rng.choice(candidates)
+                section["current_student_cnt"] += 1
+                enrollment_rows.append({
+                    "id": _uid(), "student_id": user["id"], "class_section_id": section["id"],
+                    "term_id": dataset.open_term_id, "status": EnrollmentStatus.PENDING
+                })
+
+        await _insert(db, CourseOffering, offering_rows, dataset)
+        await _insert(db, ClassSection, section_rows, dataset)
+        await _insert(db, ClassSchedule, schedule_rows, dataset)
+        await _insert(db, ProfessorClassSection, assignment_rows, dataset)
+        await _insert(db, BaseUser, student_users, dataset)
+        await _insert(db, Student, student_rows, dataset)
+        await _insert(db, FaceEncoding, encoding_rows, dataset)
+        await _insert(db, Enrollment, enrollment_rows, dataset)
+        await db.commit()
+
+    # fresh statistics, the planner sees the seeded sizes right away
+    async with engine.connect() as conn:
+        await conn.exec_driver_sql("ANALYZE")
+        # statistics are transactional, a rolled back ANALYZE is lost
+        await conn.commit()
+
+    return dataset
+
+
+# children first, professor/student rows before their base_user rows
+CLEANUP_ORDER = [
+    (Enrollment, "enrollment"), (FaceEncoding, "face_encoding"), (ProfessorClassSection, "professor_class_section"),
+    (ClassSchedule, "class_schedule"), (ClassSection, "class_section"), (CourseOffering, "course_offering"),
+    (Student, "student"), (Professor, "professor"), (Registrar, "registrar"), (BaseUser, "base_user"), (Term, "term"),
+    (CurriculumCourse, "curriculum_course"), (Course, "course"), (Curriculum, "curriculum"),
+    (Program, "program"), (Department, "department"), (Room, "room"), (Building, "building"),
+]
+
+
+async def cleanup_dataset(dataset: SeededDataset) -> None:
+    async with async_session() as db:
+        # rows written on top of the seed (enrollments of the load tests...)
+        section_ids = dataset.ids("class_section")
+        for chunk in chunked(section_ids, INSERT_CHUNK_SIZE):
+            await db.execute(delete(Enrollment).where(Enrollment.class_section_id.in_(chunk)))
+
+        for model, table in CLEANUP_ORDER:
+            for chunk in chunked(dataset.ids(table), INSERT_CHUNK_SIZE):
+                await db.execute(delete(model.__table__).where(model.__table__.c.id.in_(chunk)))
+        await db.commit()
+
+
+async def cleanup_tag(tag: str) -> None:
+    """Remove a kept dataset by its tag (the seeded rows are named after it)."""
+    dataset = SeededDataset(tag=tag)
+    async with async_session() as db:
+        building = (await db.execute(select(Building.id).where(Building.name == f"Seed Building {tag}"))).scalar()
+        department_ids = (await db.execute(
+            select(Department.id).where(Department.title.like(f"Seed Department {tag} %"))
+        )).scalars().all()
+        program_ids = (await db.execute(select(Program.id).where(Program.department_id.in_(department_ids)))).scalars().all()
+        curriculum_ids = (await db.execute(select(Curriculum.id).where(Curriculum.program_id.in_(program_ids)))).scalars().all()
+        curriculum_course_rows = (await db.execute(
+            select(CurriculumCourse.id, CurriculumCourse.course_id).where(CurriculumCourse.curriculum_id.in_(curriculum_ids))
+        )).all()
+        offering_rows = (await db.execute(
+            select(CourseOffering.id, CourseOffering.term_id)
+            .where(CourseOffering.curriculum_course_id.in_([row.id for row in curriculum_course_rows]))
+        )).all()
+        section_ids = (await db.execute(
+            select(ClassSection.id).where(ClassSection.course_offering_id.in_([row.id for row in offering_rows]))
+        )).scalars().all()
+        user_ids = (await db.execute(
+            select(BaseUser.id).where(BaseUser.last_name.like(f"{tag} %"))
+        )).scalars().all()
+
+        dataset.rows = {
+            "building": [building] if building else [],
+            "room": (await db.execute(select(Room.id).where(Room.building_id == building))).scalars().all(),
+            "department": department_ids, "program": program_ids, "curriculum": curriculum_ids,
+            "curriculum_course": [row.id for row in curriculum_course_rows],
+            "course": [row.course_id for row in curriculum_course_rows],
+            "course_offering": [row.id for row in offering_rows],
+            "term": list({row.term_id for row in offering_rows}),
+            "class_section": section_ids,
+            "class_schedule": (await db.execute(
+                select(ClassSchedule.id).where(ClassSchedule.class_section_id.in_(section_ids))
+            )).scalars().all(),
+            "professor_class_section": (await db.execute(
+                select(ProfessorClassSection.id).where(ProfessorClassSection.class_section_id.in_(section_ids))
+            )).scalars().all(),
+            "face_encoding": (await db.execute(
+                select(FaceEncoding.id).where(FaceEncoding.user_id.in_(user_ids))
+            )).scalars().all(),
+            "student": user_ids, "professor": user_ids, "registrar": user_ids, "base_user": user_ids,
+        }
+    await cleanup_dataset(dataset)
+
+
+async def main(students: int, keep: bool, cleanup: str = None) -> None:
+    if cleanup:
+        await cleanup_tag(cleanup)
+        print(f"removed dataset {cleanup}")
+    else:
+        started = asyncio.get_running_loop().time()
+        dataset = await seed_dataset(students)
+        elapsed = asyncio.get_running_loop().time() - started
+        print(f"seeded dataset {dataset.tag} in {elapsed:.1f}s: {dataset.counts()}")
+        if not keep:
+            await cleanup_dataset(dataset)
+            print("removed (use --keep to leave it)")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--students", type=int, default=1000)
+    parser.add_argument("--keep", action="store_true")
+    parser.add_argument("--cleanup", metavar="TAG")
+    args = parser.parse_args()
+    asyncio.run(main(args.students, args.keep, args.cleanup))
@@ -0,0 +1,153 @@
+"""
+    Date Written: 10/19/2026 at 9:10 AM
+
+    Concurrency stress check for the atomic class section seat reservation.
+    Seeds one OPEN class section with a small capacity, enrolls many students
+    into it in parallel (one session per student, like separate requests) and
+    checks that the section was never overbooked.
+
+    Run from the server directory against a local (non production) database:
+        python -m scripts.enrollment_seat_stress --students 200 --capacity 25
+"""
+
+import argparse
+import asyncio
+import random
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, func, select
+
+from app.db.db_session import async_session, engine
+from app.db.base import Base
+from app.db.model_registry import import_all_models
+from app.exceptions.customed_exception import InvalidRequestException
+from app.models.academic_structures.class_section import ClassSection
+from app.models.academic_structures.course import Course
+from app.models.academic_structures.course_offering import CourseOffering
+from app.models.academic_structures.curriculum import Curriculum
+from app.models.academic_structures.curriculum_course import CurriculumCourse
+from app.models.academic_structures.program import Program
+from app.models.academic_structures.term import Term
+from app.models.enrollment_and_gradings.enrollment import Enrollment
+from app.models.users.base_user import BaseUser
+from app.models.users.student import Student
+from app.models.enums.academic_structure_state import *
+from app.models.enums.user_state import UserGender, UserStatus
+from app.services.enrollment_grading_service import EnrollmentGradingService
+
+import_all_models()
+
+
+async def seed_section(capacity: int, students: int) -> tuple[str, list[str], list]:
+    """
+        Create program -> curriculum -> course -> term -> offering -> section
+        and the students to enroll. Returns the class section id, the student ids
+        and every created row in insert order (for cleanup).
+    """
+    tag = uuid.uuid4().hex[:6].upper()
+    now = datetime.now(timezone.utc)
+
+    program = Program(title=f"Stress Program {tag}", program_code=f"SP{tag}")
+    curriculum = Curriculum(
+        title=f"Stress Curriculum {tag}", effective_from=now.year,
+        status=CurriculumStatus.ACTIVE, program=program
+    )
+    course = Course(title=f"Stress Course {tag}", course_code=f"SC{tag}", units=3)
+    curriculum_course = CurriculumCourse(curriculum=curriculum, course=course, year_level=1, semester=1)
+    # far future academic year so the seeded term never collides with real ones
+    academic_year = random.randint(2500, 2999)
+    term = Term(
+        academic_year_start=academic_year, academic_year_end=academic_year + 1,
+        enrollment_start=now - timedelta(days=1), enrollment_end=now + timedelta(days=1),
+        semester_period=SemesterPeriod.FIRST, status=TermStatus.OPEN
+    )
+    course_offering = CourseOffering(
+        term=term, curriculum_course=curriculum_course, status=CourseOfferingStatus.APPROVED
+    )
+    class_section = ClassSection(
+        section_code=f"S{tag}", student_capacity=capacity, current_student_cnt=0,
+        status=ClassSectionStatus.OPEN, course_offering=course_offering
+    )
+    student_rows = [
+        Student(
+            first_name="Stress", last_name=f"Student {i}", gender=UserGender.MALE,
+            complete_address="N/A", email=f"stress.{tag.lower()}.{i}@example.com",
+            cellphone_number="09000000000", password_hash="x", status=UserStatus.APPROVED,
+            is_active=True, program=program
+        )
+        for i in range(students)
+    ]
+
+    rows = [program, curriculum, course, curriculum_course, term, course_offering, class_section, *student_rows]
+    async with async_session() as db:
+        db.add_all(rows)
+        await db.commit()
+
+    return class_section.id, [s.id for s in student_rows], rows
+
+
+async def enroll(class_section_id: str, student_id: str) -> str:
+    async with async_session() as db:
+        service = EnrollmentGradingService(db)
+        try:
+            await service.enroll_student_class_section(
+                student_id=student_id, class_section_id=class_section_id, requested_by="stress"
+            )
+            return "enrolled"
+        except InvalidRequestException as e:
+            return "full" if "full" in e.detail else e.detail
+
+
+async def cleanup(class_section_id: str, rows: list) -> None:
+    # plain DELETE statements in FK order, no ORM cascades (they lazy load)
+    async with async_session() as db:
+        await db.execute(delete(Enrollment).where(Enrollment.class_section_id == class_section_id))
+        student_ids = [row.id for row in rows if isinstance(row, Student)]
+        await db.execute(delete(Student).where(Student.id.in_(student_ids)))
+        await db.execute(delete(BaseUser).where(BaseUser.id.in_(student_ids)))
+        for row in reversed(rows):
+            if not isinstance(row, Student):
+                await db.execute(delete(type(row)).where(type(row).id == row.id))
+        await db.commit()
+
+
+async def main(students: int, capacity: int, keep: bool) -> int:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    class_section_id, student_ids, rows = await seed_section(capacity, students)
+
+    started = asyncio.get_running_loop().time()
+    outcomes = await asyncio.gather(*(enroll(class_section_id, s_id) for s_id in student_ids))
+    elapsed = asyncio.get_running_loop().time() - started
+
+    async with async_session() as db:
+        enrolled_rows = (await db.execute(
+            select(func.count(Enrollment.id)).where(Enrollment.class_section_id == class_section_id)
+        )).scalar_one()
+        counter = (await db.execute(
+            select(ClassSection.current_student_cnt).where(ClassSection.id == class_section_id)
+        )).scalar_one()
+
+    summary = {outcome: outcomes.count(outcome) for outcome in set(outcomes)}
+    print(f"{students} parallel enrollments in {elapsed:.2f}s -> {summary}")
+    print(f"enrollment rows: {enrolled_rows}, current_student_cnt: {counter}, capacity: {capacity}")
+
+    ok = enrolled_rows == counter == min(students, capacity)
+    print("OK" if ok else "FAILED: class section overbooked or counter drifted")
+
+    if not keep:
+        await cleanup(class_section_id, rows)
+    await engine.dispose()
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--students", type=int, default=200)
+    parser.add_argument("--capacity", type=int, default=25)
+    parser.add_argument("--keep", action="store_true", help="keep the seeded rows")
+    args = parser.parse_args()
+
+    raise SystemExit(asyncio.run(main(args.students, args.capacity, args.keep)))
@@ -0,0 +1,218 @@
+"""
+    Date Written: 10/19/2026 at 10:45 PM
+
+    Index advisor: plans of the repositories' read queries on a seeded dataset.
+        - runs every catalogue entry (a repository call) once, capturing the
+          SQL statements it sends with their parameters
+        - runs each SELECT again under EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON)
+          in a rolled back transaction
+        - flags sequential scans of tables with at least --min-rows rows
+        - with --baseline (a file written by --save): flags plan regressions,
+          an index scan turned sequential, execution time or buffers growing
+          past the tolerance
+    Exit status 1 when anything is flagged.
+
+    Run from the server directory against a local (non production) database:
+        python -m scripts.explain_advisor --students 20000 --save plans.json
+        alembic upgrade head
+        python -m scripts.explain_advisor --students 20000 --baseline plans.json
+"""
+
+import argparse
+import asyncio
+import json
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
+from sqlalchemy import event, text
+
+from app.db.db_session import async_session, engine
+from app.repository.academic_structures.class_schedule_repository import ClassScheduleRepository
+from app.repository.academic_structures.class_section_repository import ClassSectionRepository
+from app.repository.academic_structures.course_offering_repository import CourseOfferingRepository
+from app.repository.academic_structures.professor_class_section_repository import ProfessorClassSectionRepository
+from app.repository.academic_structures.term_repository import TermRepository
+from app.repository.enrollments_and_gradings.enrollment_repository import EnrollmentRepository
+from app.repository.face_recognition_repository import FaceRecognitionRepository
+from app.repository.users.student_repository import StudentRepository
+from scripts.dataset_seed import SeededDataset, cleanup_dataset, seed_dataset
+
+SCAN_NODES = {"Seq Scan", "Index Scan", "Index Only Scan", "Bitmap Heap Scan"}
+
+# name -> call of the repository on the seeded dataset
+CATALOGUE: Dict[str, Callable[[Any, SeededDataset], Awaitable[Any]]] = {
+    "StudentRepository.get_student_allowed_sections":
+        lambda db, ds: StudentRepository(db).get_student_allowed_sections(ds.ids("student")[0]),
+    "StudentRepository.get_student_current_enrolled_section":
+        lambda db, ds: StudentRepository(db).get_student_current_enrolled_section(ds.ids("student")[0]),
+    "EnrollmentRepository.get_student_term_schedules":
+        lambda db, ds: EnrollmentRepository(db).get_student_term_schedules(ds.ids("student")[0], [ds.open_term_id]),
+    "EnrollmentRepository.get_enrollment_eligibility_batch":
+        lambda db, ds: EnrollmentRepository(db).get_enrollment_eligibility_batch(
+            ds.ids("student")[0], ds.ids("class_section")[:20]
+        ),
+    "EnrollmentRepository.get_enrollment_details":
+        lambda db, ds: EnrollmentRepository(db).get_enrollment_details(ds.ids("enrollment")[:50]),
+    "EnrollmentRepository.get_filtered_enrollments":
+        lambda db, ds: EnrollmentRepository(db).get_filtered_enrollments(
+            program_id=ds.ids("program")[0], term_id=ds.open_term_id
+        ),
+    "ClassSectionRepository.current_student_count":
+        lambda db, ds: ClassSectionRepository(db).current_student_count(ds.ids("class_section")[0]),
+    "ClassSectionRepository.get_unscheduled_sections":
+        lambda db, ds: ClassSectionRepository(db).get_unscheduled_sections(ds.open_term_id),
+    "ClassSectionRepository.list_class_sections_by_course_offering":
+        lambda db, ds: ClassSectionRepository(db).list_class_sections_by_course_offering(ds.ids("course_offering")[0]),
+    "ClassScheduleRepository.get_term_schedule_slots":
+        lambda db, ds: ClassScheduleRepository(db).get_term_schedule_slots(ds.open_term_id),
+    "TermRepository.get_student_current_term":
+        lambda db, ds: TermRepository(db).get_student_current_term(ds.ids("student")[0]),
+    "TermRepository.get_student_next_term":
+        lambda db, ds: TermRepository(db).get_student_next_term(ds.ids("student")[0]),
+    "CourseOfferingRepository.list_course_offering_by_term":
+        lambda db, ds: CourseOfferingRepository(db).list_course_offering_by_term(ds.open_term_id),
+    "ProfessorClassSectionRepository.get_professor_ids_by_sections":
+        lambda db, ds: ProfessorClassSectionRepository(db).get_professor_ids_by_sections(ds.ids("class_section")[:50]),
+    "FaceRecognitionRepository.get_user_encoding":
+        lambda db, ds: FaceRecognitionRepository(db).get_user_encoding(ds.ids("student")[0]),
+}
+
+
+@dataclass
+class PlanReport:
+    name: str
+    statement: str
+    execution_ms: float
+    buffers: int
+    # relation -> scan node types over the plan
+    scans: Dict[str, List[str]] = field(default_factory=dict)
+    flags: List[str] = field(default_factory=list)
+
+
+def walk(node: Dict[str, Any], scans: Dict[str, List[str]]) -> None:
+    if node["Node Type"] in SCAN_NODES and "Relation Name" in node:
+        scans.setdefault(node["Relation Name"], []).append(node["Node Type"])
+    for child in node.get("Plans", []):
+        walk(child, scans)
+
+
+async def capture(name: str, dataset: SeededDataset) -> Tuple[List[Tuple[str, Any]], str]:
+    """(statement, parameters) of every SELECT the catalogue entry sends, and its error if it raised."""
+    statements, error = [], None
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith(("SELECT", "WITH")):
+            statements.append((statement, parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        async with async_session() as db:
+            try:
+                await CATALOGUE[name](db, dataset)
+            except Exception as exc:
+                # the statement ran, its plan is still worth reading
+                error = f"{type(exc).__name__}: {exc}".splitlines()[0]
+            await db.rollback()
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    return statements, error
+
+
+async def explain(name: str, statement: str, parameters: Any, table_rows: Dict[str, int], min_rows: int) -> PlanReport:
+    async with engine.connect() as conn:
+        result = await conn.exec_driver_sql(
+            "EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) " + statement, parameters
+        )
+        raw = result.scalar()
+        await conn.rollback()
+
+    plan = (json.loads(raw) if isinstance(raw, str) else raw)[0]
+    root = plan["Plan"]
+    report = PlanReport(
+        name=name, statement=" ".join(statement.split()),
+        execution_ms=plan["Execution Time"],
+        buffers=root.get("Shared Hit Blocks", 0) + root.get("Shared Read Blocks", 0),
+    )
+    walk(root, report.scans)
+
+    for relation, nodes in report.scans.items():
+        if "Seq Scan" in nodes and table_rows.get(relation, 0) >= min_rows:
+            report.flags.append(f"seq scan on {relation} ({table_rows[relation]} rows)")
+    return report
+
+
+def compare(report: PlanReport, baseline: Dict[str, Any], tolerance: float) -> None:
+    for relation, nodes in report.scans.items():
+        before = baseline["scans"].get(relation, [])
+        if "Seq Scan" in nodes and before and "Seq Scan" not in before:
+            report.flags.append(f"regression: {relation} {'/'.join(sorted(set(before)))} -> Seq Scan")
+
+    # small plans jitter, only count growth past 1 ms / 100 buffers
+    if report.execution_ms > baseline["execution_ms"] * (1 + tolerance) and report.execution_ms - baseline["execution_ms"] > 1:
+        report.flags.append(f"regression: {baseline['execution_ms']:.2f} -> {report.execution_ms:.2f} ms")
+    if report.buffers > baseline["buffers"] * (1 + tolerance) and report.buffers - baseline["buffers"] > 100:
+        report.flags.append(f"regression: {baseline['buffers']} -> {report.buffers} buffers")
+
+
+async def table_sizes() -> Dict[str, int]:
+    async with engine.connect() as conn:
+        result = await conn.execute(text(
+            "SELECT relname, reltuples::bigint FROM pg_class "
+            "WHERE relkind = 'r' AND relnamespace = 'public'::regnamespace"
+        ))
+        return {name: rows for name, rows in result.all()}
+
+
+async def main(students: int, min_rows: int, tolerance: float, baseline_path: str, save_path: str, keep: bool) -> int:
+    dataset = await seed_dataset(students)
+    try:
+        table_rows = await table_sizes()
+        reports: List[PlanReport] = []
+        errors: Dict[str, str] = {}
+        for name in CATALOGUE:
+            statements, error = await capture(name, dataset)
+            if error:
+                errors[name] = error
+            for i, (statement, parameters) in enumerate(statements):
+                reports.append(await explain(f"{name}#{i}", statement, parameters, table_rows, min_rows))
+    finally:
+        if not keep:
+            await cleanup_dataset(dataset)
+        await engine.dispose()
+
+    if baseline_path:
+        with open(baseline_path) as file:
+            baseline = json.load(file)
+        for report in reports:
+            if report.name in baseline:
+                compare(report, baseline[report.name], tolerance)
+
+    if save_path:
+        with open(save_path, "w") as file:
+            json.dump(
+                {r.name: {"execution_ms": r.execution_ms, "buffers": r.buffers, "scans": r.scans, "statement": r.statement}
+                 for r in reports},
+                file, indent=2
+            )
+
+    print(f"{len(reports)} statements, {students} seeded students (tables with >= {min_rows} rows checked)")
+    for report in reports:
+        status = "FLAG" if report.flags else "ok  "
+        print(f"  {status} {report.name:<62} {report.execution_ms:8.2f} ms {report.buffers:7d} buf")
+        for flag in report.flags:
+            print(f"         - {flag}")
+    for name, error in errors.items():
+        print(f"  note: {name} raised {error}")
+    return 1 if any(report.flags for report in reports) else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--students", type=int, default=20000)
+    parser.add_argument("--min-rows", type=int, default=1000)
+    parser.add_argument("--tolerance", type=float, default=0.5, help="allowed growth, 0.5 = +50%%")
+    parser.add_argument("--baseline", help="plans file written by --save")
+    parser.add_argument("--save", help="write the plans of this run")
+    parser.add_argument("--keep", action="store_true", help="leave the seeded dataset")
+    args = parser.parse_args()
+    raise SystemExit(asyncio.run(main(args.students, args.min_rows, args.tolerance, args.baseline, args.save, args.keep)))
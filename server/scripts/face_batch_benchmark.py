@@ -0,0 +1,119 @@
+"""
+    Date Written: 10/20/2026 at 1:20 AM
+
+    Throughput vs latency of the face encoding micro-batcher.
+    N verifications arrive at once (a class at exam start) or at --rate per
+    second, every one submits one image to a MicroBatcher; for every
+    (max batch size, max wait) the report gives the throughput, latency
+    percentiles and the mean batch size.
+        - real: face_engine.encode_images on --image (needs the face stack),
+          at most --parallel batches at once in threads, like the API worker
+          (FACE_BATCH_MAX_CONCURRENCY) or the inference worker (--processes)
+        - --simulate FIXED_MS,PER_ITEM_MS: a batch costs FIXED + n * PER_ITEM
+          (GIL released), to see the batcher trade-off without the models
+
+    Run from the server directory:
+        python -m scripts.face_batch_benchmark --image face.jpg --requests 300
+        python -m scripts.face_batch_benchmark --simulate 40,15 --requests 300
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List
+
+from app.utils.micro_batcher import MicroBatcher
+
+SIZES = (1, 4, 8, 16, 32)
+WAITS_MS = (0, 2, 5, 10, 20)
+
+
+def percentile(values: List[float], q: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+def simulated_batch(fixed_ms: float, per_item_ms: float) -> Callable[[list], list]:
+    def run(images: list) -> list:
+        time.sleep((fixed_ms + per_item_ms * len(images)) / 1000)
+        return [None] * len(images)
+    return run
+
+
+def real_batch() -> Callable[[list], list]:
+    from app.ai.face_recognition import face_engine
+
+    def run(images: list) -> list:
+        return face_engine.encode_images(images)
+    return run
+
+
+async def run_config(batch_fn, image: bytes, requests: int, rate: float, size: int, wait_ms: float, parallel: int):
+    executor = ThreadPoolExecutor(max_workers=parallel)
+    loop = asyncio.get_running_loop()
+
+    async def handler(images: list) -> list:
+        return await loop.run_in_executor(executor, batch_fn, images)
+
+    batcher = MicroBatcher(handler, size, wait_ms / 1000, parallel)
+    latencies: List[float] = []
+
+    async def verify() -> None:
+        started = time.perf_counter()
+        await batcher.submit(image)
+        latencies.append((time.perf_counter() - started) * 1000)
+
+    rng = random.Random(7)
+    started = time.perf_counter()
+    tasks = []
+    for _ in range(requests):
+        tasks.append(asyncio.create_task(verify()))
+        if rate > 0:
+            await asyncio.sleep(rng.expovariate(rate))
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - started
+    executor.shutdown()
+
+    return {
+        "throughput": requests / elapsed,
+        "p50": percentile(latencies, 0.50),
+        "p95": percentile(latencies, 0.95),
+        "p99": percentile(latencies, 0.99),
+        "mean_batch": batcher.item_cnt / batcher.batch_cnt,
+    }
+
+
+async def main(args) -> None:
+    if args.simulate:
+        fixed_ms, per_item_ms = (float(v) for v in args.simulate.split(","))
+        batch_fn, image = simulated_batch(fixed_ms, per_item_ms), b""
+        mode = f"simulated batch cost {fixed_ms} ms + {per_item_ms} ms/image"
+    else:
+        with open(args.image, "rb") as file:
+            image = file.read()
+        batch_fn, mode = real_batch(), f"face_engine on {args.image}"
+        batch_fn([image])  # load the models before timing
+
+    arrival = f"{args.rate}/s" if args.rate > 0 else "all at once"
+    print(f"{mode}, {args.requests} requests {arrival}, {args.parallel} batch(es) in parallel")
+    print(f"  {'size':>4} {'wait':>6} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'batch':>6}")
+    for size in SIZES:
+        for wait_ms in (WAITS_MS if size > 1 else (0,)):
+            result = await run_config(batch_fn, image, args.requests, args.rate, size, wait_ms, args.parallel)
+            print(
+                f"  {size:>4} {wait_ms:>4}ms {result['throughput']:8.1f} {result['p50']:8.1f} "
+                f"{result['p95']:8.1f} {result['p99']:8.1f} {result['mean_batch']:6.1f}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--image", help="a face photo (JPEG/PNG)")
+    source.add_argument("--simulate", metavar="FIXED_MS,PER_ITEM_MS")
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--rate", type=float, default=0, help="arrivals per second, 0 for all at once")
+    parser.add_argument("--parallel", type=int, default=1)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,184 @@
+"""
+    Date Written: 10/19/2026 at 8:10 PM
+
+    Cross-process check of the LISTEN/NOTIFY invalidation bus.
+    Starts two app instances as separate processes against one database,
+    each with its own engine, warmed reference data cache and bus (the
+    same wiring as main.life_span):
+        - writer: changes the status of a seeded term through TermRepository
+        - reader: must see its cached term evicted and read the new status
+    Reports the commit to eviction latency of every round.
+
+    Run from the server directory against a local (non production) database:
+        python -m scripts.invalidation_bus_harness --rounds 20
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import sys
+import time as clock
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, event
+
+from app.db.db_session import async_session, engine
+from app.db.invalidation_bus import invalidation_bus
+from app.db.model_registry import import_all_models
+from app.models.academic_structures.term import Term
+from app.models.enums.academic_structure_state import SemesterPeriod, TermStatus
+from app.repository.academic_structures.term_repository import TermRepository
+from app.services.reference_data_cache import reference_data_cache
+
+import_all_models()
+
+# statuses the writer cycles through
+STATUS_CYCLE = (TermStatus.CLOSED, TermStatus.OPEN)
+
+ROUND_TIMEOUT_SECONDS = 5
+
+
+def emit(**message) -> None:
+    print(json.dumps(message), flush=True)
+
+
+async def start_instance() -> None:
+    """Cache and bus of one app instance, like main.life_span."""
+    for entity in reference_data_cache.entities:
+        invalidation_bus.subscribe(
+            entity,
+            lambda id, entity=entity: reference_data_cache.invalidate(entity, id, notify=False)
+        )
+    await invalidation_bus.start()
+    if not await invalidation_bus.wait_connected():
+        raise RuntimeError("Invalidation bus did not connect.")
+    await reference_data_cache.warm(async_session)
+
+
+async def run_writer() -> None:
+    await start_instance()
+    emit(event="ready")
+
+    loop = asyncio.get_running_loop()
+    while True:
+        line = await loop.run_in_executor(None, sys.stdin.readline)
+        if not line:
+            break
+        command = json.loads(line)
+        committed = []
+        async with async_session() as db:
+            # the update refreshes the row after the commit, time from the commit call
+            event.listen(db.sync_session, "before_commit", lambda session: committed.append(clock.time()))
+            await TermRepository(db).update(command["term_id"], status=TermStatus(command["status"]))
+        emit(event="written", at=committed[0])
+
+    await invalidation_bus.stop()
+    await engine.dispose()
+
+
+async def run_reader(term_id: str) -> None:
+    evicted = asyncio.Queue()
+    invalidation_bus.subscribe("term", lambda id: id == term_id and evicted.put_nowait(clock.time()))
+    await start_instance()
+
+    async with async_session() as db:
+        term = await reference_data_cache.terms.get(db, term_id)
+    emit(event="ready", status=term.status.value)
+
+    while True:
+        at = await evicted.get()
+        async with async_session() as db:
+            term = await reference_data_cache.terms.get(db, term_id)
+        emit(event="evicted", at=at, status=term.status.value)
+
+
+async def spawn(*args: str) -> asyncio.subprocess.Process:
+    return await asyncio.create_subprocess_exec(
+        sys.executable, "-m", "scripts.invalidation_bus_harness", *args,
+        stdin=asyncio.subprocess.PIPE, stdout=asyncio.subprocess.PIPE
+    )
+
+
+async def read_event(process: asyncio.subprocess.Process, event: str) -> dict:
+    while True:
+        line = await asyncio.wait_for(process.stdout.readline(), ROUND_TIMEOUT_SECONDS * 4)
+        if not line:
+            raise RuntimeError(f"Instance exited while waiting for {event}.")
+        try:
+            message = json.loads(line)
+        except ValueError:
+            continue
+        if message.get("event") == event:
+            return message
+
+
+async def main(rounds: int) -> None:
+    now = datetime.now(timezone.utc)
+    # far future academic year so the seeded term never collides with real ones
+    academic_year = random.randint(2500, 2999)
+    async with async_session() as db:
+        term = Term(
+            academic_year_start=academic_year, academic_year_end=academic_year + 1,
+            enrollment_start=now, enrollment_end=now + timedelta(days=1),
+            semester_period=SemesterPeriod.FIRST, status=TermStatus.OPEN
+        )
+        db.add(term)
+        await db.commit()
+        term_id = term.id
+
+    writer = await spawn("--role", "writer")
+    reader = await spawn("--role", "reader", "--term-id", term_id)
+    latencies = []
+    stale = 0
+    try:
+        await read_event(writer, "ready")
+        await read_event(reader, "ready")
+
+        for round_number in range(rounds):
+            status = STATUS_CYCLE[round_number % len(STATUS_CYCLE)]
+            writer.stdin.write((json.dumps({"term_id": term_id, "status": status.value}) + "\n").encode())
+            await writer.stdin.drain()
+
+            written = await read_event(writer, "written")
+            seen = await asyncio.wait_for(read_event(reader, "evicted"), ROUND_TIMEOUT_SECONDS)
+            latencies.append((seen["at"] - written["at"]) * 1000)
+            if seen["status"] != status.value:
+                stale += 1
+
+    finally:
+        writer.stdin.close()
+        for process in (writer, reader):
+            if process.returncode is None:
+                process.terminate()
+            await process.wait()
+        async with async_session() as db:
+            await db.execute(delete(Term).where(Term.id == term_id))
+            await db.commit()
+        await engine.dispose()
+
+    latencies.sort()
+    print(f"rounds: {len(latencies)}  stale reads after eviction: {stale}")
+    if latencies:
+        print(
+            f"commit -> eviction ms  median: {statistics.median(latencies):.2f}  "
+            f"p95: {latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]:.2f}  "
+            f"max: {latencies[-1]:.2f}"
+        )
+    print("OK" if stale == 0 and len(latencies) == rounds else "FAILED")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--role", choices=("writer", "reader"))
+    parser.add_argument("--term-id")
+    args = parser.parse_args()
+
+    if args.role == "writer":
+        asyncio.run(run_writer())
+    elif args.role == "reader":
+        asyncio.run(run_reader(args.term_id))
+    else:
+        asyncio.run(main(args.rounds))
@@ -0,0 +1,388 @@
+"""
+    Date Written: 10/20/2026 at 3:20 AM
+
+    End-to-end load test of the API on a seeded university (dataset_seed):
+    scripted scenarios, run one after the other, each with --concurrency
+    virtual users:
+        - login_storm: students request tokens (bcrypt on every request)
+        - enrollment_open: every student reads its allowed sections and
+          enrolls in one of them
+        - registrar_bulk_approve: a registrar approves the pending
+          enrollments in batches of --approve-batch
+        - face_verify_burst: students verify their face at exam start
+          (--face-image, a real photo; without the face stack installed or
+          a real photo the requests fail and are reported as errors)
+    Every request records its latency and status, the report gives per
+    request the throughput, p50/p90/p99/max latency and the error rate.
+    The results are written as JSON named after the commit, --compare
+    prints the change against an earlier result.
+
+    In-process by default (the ASGI app with its lifespan, no server, no
+    network), --url drives a running server instead (needs httpx), whose
+    database must be the one this script seeds.
+
+    Run from the server directory against a local (non production) database:
+        python -m scripts.load_test --students 20000 --users 2000 --concurrency 50
+        python -m scripts.load_test --scenarios login_storm --compare load_test_results/ab12cd3.json
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import random
+import subprocess
+import time
+import urllib.parse
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import select
+
+from scripts.dataset_seed import SeededDataset, cleanup_dataset, seed_dataset
+from app.db.db_session import async_session, engine
+from app.models.academic_structures.class_section import ClassSection
+from app.models.academic_structures.course_offering import CourseOffering
+from app.models.enrollment_and_gradings.enrollment import Enrollment
+from app.models.enums.enrollment_and_grading_state import EnrollmentStatus
+from app.models.users.base_user import BaseUser
+from app.services.auth_service import AuthService
+from app.utils.chunking import chunked
+
+LOAD_TEST_PASSWORD = "LoadTest#2026"
+ERROR_SAMPLES = 3
+RESULTS_DIR = Path(__file__).resolve().parents[1] / "load_test_results"
+SCENARIOS = ("login_storm", "enrollment_open", "registrar_bulk_approve", "face_verify_burst")
+
+
+# ============================================
+# CLIENTS
+# ============================================
+class AsgiClient:
+    """Calls the ASGI app directly, one request at a time per call, no network."""
+    def __init__(self, app):
+        self.app = app
+
+    async def request(self, method: str, path: str, headers: Dict[str, str], body: bytes = b"") -> Tuple[int, bytes]:
+        path, _, query = path.partition("?")
+        messages = []
+
+        async def receive():
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        async def send(message):
+            messages.append(message)
+
+        await self.app({
+            "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": method,
+            "scheme": "http", "path": path, "raw_path": path.encode(), "query_string": query.encode(),
+            "root_path": "", "server": ("load-test", 80), "client": ("127.0.0.1", 0),
+            "headers": [(key.lower().encode(), value.encode()) for key, value in headers.items()],
+        }, receive, send)
+        status = next(message["status"] for message in messages if message["type"] == "http.response.start")
+        return status, b"".join(message.get("body", b"") for message in messages if message["type"] == "http.response.body")
+
+
+class HttpClient:
+    def __init__(self, url: str, connections: int):
+        import httpx
+
+        self.client = httpx.AsyncClient(
+            base_url=url, timeout=60, limits=httpx.Limits(max_connections=connections)
+        )
+
+    async def request(self, method: str, path: str, headers: Dict[str, str], body: bytes = b"") -> Tuple[int, bytes]:
+        response = await self.client.request(method, path, headers=headers, content=body)
+        return response.status_code, response.content
+
+
+@asynccontextmanager
+async def open_client(url: Optional[str], concurrency: int):
+    if url:
+        client = HttpClient(url, concurrency)
+        try:
+            yield client
+        finally:
+            await client.client.aclose()
+        return
+
+    from app.main import app
+
+    # startup / shutdown of the app (schema check, caches, invalidation bus...)
+    async with app.router.lifespan_context(app):
+        yield AsgiClient(app)
+
+
+# ============================================
+# RECORDING
+# ============================================
+class Recorder:
+    def __init__(self, client):
+        self.client = client
+        self.samples: Dict[str, List[Tuple[float, int]]] = defaultdict(list)
+        # a few distinct error bodies per request, to tell rejections from failures
+        self.errors: Dict[str, List[str]] = defaultdict(list)
+
+    async def request(
+        self, name: str, method: str, path: str, token: Optional[str] = None,
+        body: bytes = b"", content_type: str = "application/json"
+    ) -> Tuple[int, bytes]:
+        headers = {"content-type": content_type}
+        if token:
+            headers["authorization"] = f"Bearer {token}"
+        started = time.perf_counter()
+        try:
+            status, payload = await self.client.request(method, path, headers, body)
+        except Exception as e:
+            # unhandled in the app (in-process) or transport error
+            status, payload = 599, f"{type(e).__name__}: {e}".encode()
+        self.samples[name].append((time.perf_counter() - started, status))
+
+        error = error_detail(status, payload)
+        if status >= 400 and len(self.errors[name]) < ERROR_SAMPLES and error not in self.errors[name]:
+            self.errors[name].append(error)
+        return status, payload
+
+
+def error_detail(status: int, payload: bytes) -> str:
+    """Status and detail of an error response (without its timestamp)."""
+    try:
+        body = json.loads(payload)
+        detail = body.get("error", {}).get("detail") or body.get("detail")
+    except (ValueError, AttributeError):
+        detail = None
+    return f"{status}: {detail or payload.decode(errors='replace')[:200]}"
+
+
+def percentile(values: List[float], q: float) -> float:
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+def summarize(samples: List[Tuple[float, int]], errors: List[str], elapsed: float) -> Dict[str, Any]:
+    latencies = sorted(latency * 1000 for latency, _ in samples)
+    statuses: Dict[str, int] = defaultdict(int)
+    for _, status in samples:
+        statuses[str(status)] += 1
+    failed = sum(1 for _, status in samples if status >= 400)
+    return {
+        "requests": len(samples),
+        "throughput": round(len(samples) / elapsed, 2) if elapsed else None,
+        "p50_ms": round(percentile(latencies, 0.50), 2),
+        "p90_ms": round(percentile(latencies, 0.90), 2),
+        "p99_ms": round(percentile(latencies, 0.99), 2),
+        "max_ms": round(latencies[-1], 2),
+        "error_rate": round(failed / len(samples), 4),
+        "statuses": dict(statuses),
+        "error_samples": errors,
+    }
+
+
+async def run_users(flows: List[Callable[[], Awaitable[None]]], concurrency: int) -> float:
+    """Run the user flows with at most concurrency at once, returns the elapsed seconds."""
+    queue = iter(flows)
+
+    async def virtual_user():
+        for flow in queue:
+            await flow()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(virtual_user() for _ in range(concurrency)))
+    return time.perf_counter() - started
+
+
+# ============================================
+# SCENARIOS
+# ============================================
+class Scenarios:
+    def __init__(self, dataset: SeededDataset, users: List[BaseUser], registrar: BaseUser, args):
+        self.dataset = dataset
+        self.users = users
+        self.registrar = registrar
+        self.args = args
+        # tokens minted directly, only login_storm goes through the login route
+        self.tokens = {user.id: AuthService(None).generate_access_token({"sub": user.email}) for user in users}
+        self.tokens[registrar.id] = AuthService(None).generate_access_token({"sub": registrar.email})
+
+
+    async def login_storm(self, recorder: Recorder) -> List[Callable]:
+        def flow(user):
+            async def run():
+                form = urllib.parse.urlencode({"username": user.email, "password": LOAD_TEST_PASSWORD}).encode()
+                await recorder.request(
+                    "POST /api/user/authenticate/token", "POST", "/api/user/authenticate/token",
+                    body=form, content_type="application/x-www-form-urlencoded"
+                )
+            return run
+        return [flow(user) for user in self.users]
+
+
+    async def enrollment_open(self, recorder: Recorder) -> List[Callable]:
+        rng = random.Random(self.args.seed)
+        # the allowed sections include the seeded DRAFT terms, only the open one takes enrollments
+        async with async_session() as db:
+            open_sections = set((await db.execute(
+                select(ClassSection.id)
+                .join(CourseOffering, CourseOffering.id == ClassSection.course_offering_id)
+                .where(CourseOffering.term_id == self.dataset.open_term_id)
+            )).scalars().all())
+
+        def flow(user):
+            async def run():
+                token = self.tokens[user.id]
+                status, payload = await recorder.request(
+                    "GET /api/enrollment/allowed-sections", "GET", "/api/enrollment/allowed-sections", token
+                )
+                sections = [
+                    section for section in (json.loads(payload) if status == 200 else [])
+                    if section["class_section_id"] in open_sections
+                ]
+                if not sections:
+                    return
+                section = rng.choice(sections)
+                await recorder.request(
+                    "POST /api/enrollment/student/{student_id}/class_section/{class_section_id}", "POST",
+                    f"/api/enrollment/student/{user.id}/class_section/{section['class_section_id']}", token
+                )
+            return run
+        return [flow(user) for user in self.users]
+
+
+    async def registrar_bulk_approve(self, recorder: Recorder) -> List[Callable]:
+        async with async_session() as db:
+            pending = (await db.execute(
+                select(Enrollment.id).where(
+                    Enrollment.term_id == self.dataset.open_term_id,
+                    Enrollment.status == EnrollmentStatus.PENDING
+                )
+            )).scalars().all()
+
+        token = self.tokens[self.registrar.id]
+
+        def flow(enrollment_ids):
+            async def run():
+                body = json.dumps({"status": EnrollmentStatus.APPROVED.value, "enrollment_ids": enrollment_ids})
+                await recorder.request(
+                    "PATCH /api/enrollment/update/status", "PATCH", "/api/enrollment/update/status", token,
+                    body=body.encode()
+                )
+            return run
+        return [flow(list(batch)) for batch in chunked(pending, self.args.approve_batch)]
+
+
+    async def face_verify_burst(self, recorder: Recorder) -> List[Callable]:
+        image = Path(self.args.face_image).read_bytes() if self.args.face_image else b"not an image"
+        body = json.dumps({
+            "image_base64": "data:image/jpeg;base64," + base64.b64encode(image).decode(), "action": "exam_start"
+        }).encode()
+
+        def flow(user):
+            async def run():
+                await recorder.request(
+                    "POST /api/face-recognition/verify", "POST", "/api/face-recognition/verify",
+                    self.tokens[user.id], body=body
+                )
+            return run
+        return [flow(user) for user in self.users]
+
+
+# ============================================
+# RESULTS
+# ============================================
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def print_report(results: Dict[str, Any], baseline: Optional[Dict[str, Any]]) -> None:
+    print(f"  {'request':<72} {'n':>6} {'req/s':>8} {'p50':>8} {'p90':>8} {'p99':>8} {'max':>8} {'err%':>6}")
+    for scenario, requests in results["scenarios"].items():
+        print(f"{scenario} ({requests['elapsed_seconds']}s)")
+        for name, stats in requests["requests"].items():
+            print(
+                f"  {name:<72} {stats['requests']:>6} {stats['throughput']:>8} {stats['p50_ms']:>8} "
+                f"{stats['p90_ms']:>8} {stats['p99_ms']:>8} {stats['max_ms']:>8} {stats['error_rate'] * 100:>6.1f}"
+            )
+            before = (baseline or {}).get("scenarios", {}).get(scenario, {}).get("requests", {}).get(name)
+            if before:
+                print(
+                    f"  {'  vs ' + baseline['commit']:<72} {'':>6} "
+                    f"{stats['throughput'] - before['throughput']:>+8.1f} {stats['p50_ms'] - before['p50_ms']:>+8.1f} "
+                    f"{stats['p90_ms'] - before['p90_ms']:>+8.1f} {stats['p99_ms'] - before['p99_ms']:>+8.1f} "
+                    f"{stats['max_ms'] - before['max_ms']:>+8.1f} {(stats['error_rate'] - before['error_rate']) * 100:>+6.1f}"
+                )
+
+
+async def main(args) -> None:
+    baseline = json.loads(Path(args.compare).read_text()) if args.compare else None
+    password_hash = AuthService(None).hash_password(LOAD_TEST_PASSWORD)
+
+    started = time.perf_counter()
+    dataset = await seed_dataset(args.students, registrars=1, password_hash=password_hash, seed=args.seed)
+    print(f"seeded dataset {dataset.tag} in {time.perf_counter() - started:.1f}s: {dataset.counts()}")
+
+    try:
+        async with async_session() as db:
+            user_ids = random.Random(args.seed).sample(dataset.ids("student"), min(args.users, args.students))
+            users = (await db.execute(select(BaseUser).where(BaseUser.id.in_(user_ids)))).scalars().all()
+            registrar = (await db.execute(
+                select(BaseUser).where(BaseUser.id == dataset.ids("registrar")[0])
+            )).scalar_one()
+        scenarios = Scenarios(dataset, users, registrar, args)
+
+        results = {
+            "commit": git_commit(),
+            "run_at": datetime.now(timezone.utc).isoformat(),
+            "mode": args.url or "in-process",
+            "dataset": dataset.counts(),
+            "users": len(users),
+            "concurrency": args.concurrency,
+            "scenarios": {},
+        }
+        async with open_client(args.url, args.concurrency) as client:
+            for scenario in args.scenarios:
+                recorder = Recorder(client)
+                flows = await getattr(scenarios, scenario)(recorder)
+                elapsed = await run_users(flows, args.concurrency)
+                results["scenarios"][scenario] = {
+                    "elapsed_seconds": round(elapsed, 2),
+                    "requests": {
+                        name: summarize(samples, recorder.errors[name], elapsed)
+                        for name, samples in recorder.samples.items()
+                    },
+                }
+                print(f"{scenario} done in {elapsed:.1f}s")
+    finally:
+        if args.keep:
+            print(f"kept dataset {dataset.tag} (python -m scripts.dataset_seed --cleanup {dataset.tag})")
+        else:
+            await cleanup_dataset(dataset)
+        await engine.dispose()
+
+    output = Path(args.output) if args.output else RESULTS_DIR / f"{results['commit']}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2))
+    print_report(results, baseline)
+    print(f"results written to {output}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--students", type=int, default=20000, help="seeded students")
+    parser.add_argument("--users", type=int, default=1000, help="students taking part in the scenarios")
+    parser.add_argument("--concurrency", type=int, default=50, help="virtual users at once")
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=list(SCENARIOS))
+    parser.add_argument("--approve-batch", type=int, default=100)
+    parser.add_argument("--face-image", help="a face photo (JPEG/PNG) for face_verify_burst")
+    parser.add_argument("--url", help="base URL of a running server instead of the in-process app")
+    parser.add_argument("--output", help=f"results JSON (default {RESULTS_DIR.name}/<commit>.json)")
+    parser.add_argument("--compare", metavar="RESULTS_JSON", help="earlier results to compare with")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--keep", action="store_true", help="leave the seeded dataset in the database")
+    asyncio.run(main(parser.parse_args()))
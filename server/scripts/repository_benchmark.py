@@ -0,0 +1,168 @@
+"""
+    Date Written: 10/20/2026 at 3:50 AM
+
+    Micro-benchmarks of the hot repository methods on seeded data
+    (dataset_seed) at several scales of enrollments (5 per student).
+    Every benchmark runs --warmup then --rounds calls, each in a fresh
+    session (no identity map carried over), on a rotating student /
+    professor / section so one cached row does not decide the result.
+    For every method the report gives the wall time (min, median, mean,
+    p95 in ms) and the SQL statements per call, counted by the query
+    stats hooks (query_stats), the number that moves with N+1 fixes.
+    The results are written as JSON named after the commit, --compare
+    prints the change against an earlier result.
+
+    Run from the server directory against a local (non production) database:
+        python -m scripts.repository_benchmark --scales 1000 10000 100000
+        python -m scripts.repository_benchmark --scales 10000 --only create_many --compare benchmark_results/ab12cd3.json
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from app.db.db_session import async_session, engine
+from app.db.query_stats import start_request_stats
+from app.repository.academic_structures.class_schedule_repository import ClassScheduleRepository
+from app.repository.academic_structures.professor_class_section_repository import ProfessorClassSectionRepository
+from app.repository.academic_structures.term_repository import TermRepository
+from app.repository.enrollments_and_gradings.enrollment_repository import EnrollmentRepository
+from app.repository.locations.room_repository import RoomRepository
+from app.repository.users.student_repository import StudentRepository
+from scripts.dataset_seed import SeededDataset, cleanup_dataset, seed_dataset
+from scripts.load_test import git_commit, percentile
+
+ENROLLMENTS_PER_STUDENT = 5
+CREATE_MANY_ROWS = 100
+RESULTS_DIR = Path(__file__).resolve().parents[1] / "benchmark_results"
+
+
+def _create_rooms(db, ds: SeededDataset, i: int) -> Awaitable[Any]:
+    rows = [
+        {"id": str(uuid.uuid4()), "room_code": uuid.uuid4().hex[:10], "building_id": ds.ids("building")[0]}
+        for _ in range(CREATE_MANY_ROWS)
+    ]
+    # removed with the dataset
+    ds.rows["room"].extend(row["id"] for row in rows)
+    return RoomRepository(db).create_many(rows)
+
+
+def _nth(ids: List[str], i: int) -> str:
+    return ids[i % len(ids)]
+
+
+# name -> call(session, dataset, round), one repository call per round
+BENCHMARKS: Dict[str, Callable[[Any, SeededDataset, int], Awaitable[Any]]] = {
+    "EnrollmentRepository.get_all_enrollments":
+        lambda db, ds, i: EnrollmentRepository(db).get_all_enrollments(),
+    "EnrollmentRepository.get_filtered_enrollments":
+        lambda db, ds, i: EnrollmentRepository(db).get_filtered_enrollments(
+            program_id=_nth(ds.ids("program"), i), term_id=ds.open_term_id
+        ),
+    "StudentRepository.get_student_allowed_sections":
+        lambda db, ds, i: StudentRepository(db).get_student_allowed_sections(_nth(ds.ids("student"), i)),
+    "TermRepository.get_student_next_term":
+        lambda db, ds, i: TermRepository(db).get_student_next_term(_nth(ds.ids("student"), i)),
+    "ClassScheduleRepository.get_schedules_by_professor":
+        lambda db, ds, i: ClassScheduleRepository(db).get_schedules_by_professor(
+            _nth(ds.ids("professor"), i), 1 + i % 5, ds.open_term_id
+        ),
+    "ProfessorClassSectionRepository.check_prof_class_section_assignment":
+        lambda db, ds, i: ProfessorClassSectionRepository(db).check_prof_class_section_assignment(
+            _nth(ds.ids("professor"), i), ds.ids("class_section")[i % 10 * 50:][:50]
+        ),
+    f"BaseRepository.create_many ({CREATE_MANY_ROWS} rooms)": _create_rooms,
+}
+
+
+async def run_benchmark(
+    call: Callable[[Any, SeededDataset, int], Awaitable[Any]], dataset: SeededDataset, warmup: int, rounds: int
+) -> Dict[str, Any]:
+    timings, queries = [], []
+    for i in range(warmup + rounds):
+        async with async_session() as db:
+            stats = start_request_stats()
+            started = time.perf_counter()
+            await call(db, dataset, i)
+            elapsed = time.perf_counter() - started
+            await db.rollback()
+        if i >= warmup:
+            timings.append(elapsed * 1000)
+            queries.append(stats.query_cnt)
+
+    timings.sort()
+    return {
+        "rounds": rounds,
+        "min_ms": round(timings[0], 3),
+        "median_ms": round(statistics.median(timings), 3),
+        "mean_ms": round(statistics.fmean(timings), 3),
+        "p95_ms": round(percentile(timings, 0.95), 3),
+        "queries": round(statistics.fmean(queries), 2),
+    }
+
+
+def print_report(results: Dict[str, Any], baseline: Optional[Dict[str, Any]]) -> None:
+    for scale, benchmarks in results["scales"].items():
+        print(f"\n{scale} enrollments")
+        print(f"  {'method':<70} {'min':>9} {'median':>9} {'mean':>9} {'p95':>9} {'queries':>8}")
+        for name, stats in benchmarks.items():
+            print(
+                f"  {name:<70} {stats['min_ms']:>9.2f} {stats['median_ms']:>9.2f} {stats['mean_ms']:>9.2f} "
+                f"{stats['p95_ms']:>9.2f} {stats['queries']:>8}"
+            )
+            before = (baseline or {}).get("scales", {}).get(scale, {}).get(name)
+            if before:
+                print(
+                    f"  {'  vs ' + baseline['commit']:<70} {stats['min_ms'] - before['min_ms']:>+9.2f} "
+                    f"{stats['median_ms'] - before['median_ms']:>+9.2f} {stats['mean_ms'] - before['mean_ms']:>+9.2f} "
+                    f"{stats['p95_ms'] - before['p95_ms']:>+9.2f} {stats['queries'] - before['queries']:>+8}"
+                )
+
+
+async def main(args) -> None:
+    baseline = json.loads(Path(args.compare).read_text()) if args.compare else None
+    selected = {name: call for name, call in BENCHMARKS.items() if not args.only or any(key in name for key in args.only)}
+    results = {
+        "commit": git_commit(),
+        "run_at": datetime.now(timezone.utc).isoformat(),
+        "warmup": args.warmup,
+        "scales": {},
+    }
+
+    try:
+        for scale in args.scales:
+            started = time.perf_counter()
+            dataset = await seed_dataset(max(1, scale // ENROLLMENTS_PER_STUDENT), enrollments_per_student=ENROLLMENTS_PER_STUDENT)
+            print(f"seeded {dataset.counts()['enrollment']} enrollments in {time.perf_counter() - started:.1f}s")
+            try:
+                results["scales"][str(scale)] = {
+                    name: await run_benchmark(call, dataset, args.warmup, args.rounds)
+                    for name, call in selected.items()
+                }
+            finally:
+                await cleanup_dataset(dataset)
+    finally:
+        await engine.dispose()
+
+    output = Path(args.output) if args.output else RESULTS_DIR / f"{results['commit']}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2))
+    print_report(results, baseline)
+    print(f"\nresults written to {output}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scales", type=int, nargs="+", default=[1000, 10000, 100000], help="seeded enrollments")
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--only", nargs="+", metavar="NAME", help="benchmarks whose name contains one of these")
+    parser.add_argument("--output", help=f"results JSON (default {RESULTS_DIR.name}/<commit>.json)")
+    parser.add_argument("--compare", metavar="RESULTS_JSON", help="earlier results to compare with")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,161 @@
+"""
+    Date Written: 10/19/2026 at 9:40 PM
+
+    Serialization cost of a large list response (no database needed).
+    Builds N enrollment rows like EnrollmentRepository.get_all_enrollments
+    returns them and times, per strategy, row -> response schema -> JSON bytes:
+        - validated: schema + GenericResponse per item, validated again
+          through response_model then dumped (what FastAPI does with a list)
+        - validated_jsonable: same, dumped with jsonable_encoder + json.dumps
+          (FastAPI versions without the dump_json path)
+        - fast_path: models_from_rows (one pydantic-core pass, one shared
+          request log) dumped by ModelListResponse (TypeAdapter.dump_json)
+        - envelope: fast_path items dumped once as {request_log, items}
+          (ModelListResponse(envelope=True)), one request log per response
+        - model_construct: the same without validation, one model_construct
+          per row (runs in Python)
+        - orjson: fast_path items through model_dump + orjson (if installed)
+    Checks that every strategy returns the same payload (request logs aside).
+
+    Run from the server directory:
+        python -m scripts.serialization_benchmark --rows 10000
+"""
+
+import argparse
+import json
+import statistics
+import time as clock
+import uuid
+from datetime import datetime, time, timezone
+from types import SimpleNamespace
+from typing import Callable, List
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from app.models.enums.academic_structure_state import SemesterPeriod
+from app.models.enums.enrollment_and_grading_state import EnrollmentStatus
+from app.schemas.enrollments_and_gradings_schema import EnrollmentResponseSchema
+from app.schemas.generic_schema import GenericResponse
+from app.utils.json_response import ModelListResponse, models_from_rows
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def make_rows(count: int) -> List[SimpleNamespace]:
+    return [
+        SimpleNamespace(
+            enrollment_id=str(uuid.uuid4()), student_id=str(uuid.uuid4()), class_section_id=str(uuid.uuid4()),
+            term_id=str(uuid.uuid4()), program_id=str(uuid.uuid4()), enrollment_status=EnrollmentStatus.APPROVED,
+            section_code=f"S{i % 500:03d}", course_code=f"CS{i % 90:03d}", title=f"Course {i % 90}", units=3,
+            day_of_week=i % 6 + 1, start_time=time(8 + i % 8, 0), end_time=time(9 + i % 8, 30),
+            room_code=f"R{i % 40}", semester_period=SemesterPeriod.FIRST,
+            academic_year_start=2026, academic_year_end=2027, program_code="BSCS",
+            student_name=f"Student {i}", assigned_professor=f"Professor {i % 60}"
+        )
+        for i in range(count)
+    ]
+
+
+def validated(rows) -> bytes:
+    items = [
+        EnrollmentResponseSchema(
+            **vars(row),
+            request_log=GenericResponse(
+                success=True, requested_at=datetime.now(timezone.utc), description="Read all student enrollments."
+            )
+        )
+        for row in rows
+    ]
+    adapter = TypeAdapter(List[EnrollmentResponseSchema])
+    return adapter.dump_json(adapter.validate_python(items))
+
+
+def validated_jsonable(rows) -> bytes:
+    items = [
+        EnrollmentResponseSchema(
+            **vars(row),
+            request_log=GenericResponse(
+                success=True, requested_at=datetime.now(timezone.utc), description="Read all student enrollments."
+            )
+        )
+        for row in rows
+    ]
+    items = TypeAdapter(List[EnrollmentResponseSchema]).validate_python(items)
+    return json.dumps(jsonable_encoder(items)).encode()
+
+
+def shared_log() -> GenericResponse:
+    return GenericResponse(
+        success=True, requested_at=datetime.now(timezone.utc), description="Read all student enrollments."
+    )
+
+
+def fast_items(rows) -> List[EnrollmentResponseSchema]:
+    return models_from_rows(EnrollmentResponseSchema, rows, request_log=shared_log())
+
+
+def fast_path(rows) -> bytes:
+    return ModelListResponse(fast_items(rows), EnrollmentResponseSchema).body
+
+
+def envelope(rows) -> bytes:
+    return ModelListResponse(fast_items(rows), EnrollmentResponseSchema, envelope=True).body
+
+
+def constructed(rows) -> bytes:
+    request_log = shared_log()
+    items = [EnrollmentResponseSchema.model_construct(**vars(row), request_log=request_log) for row in rows]
+    return ModelListResponse(items, EnrollmentResponseSchema).body
+
+
+def orjson_path(rows) -> bytes:
+    return orjson.dumps([item.model_dump() for item in fast_items(rows)])
+
+
+def timed(strategy: Callable, rows, repeat: int):
+    runs = []
+    for _ in range(repeat):
+        started = clock.perf_counter()
+        body = strategy(rows)
+        runs.append((clock.perf_counter() - started) * 1000)
+    return statistics.median(runs), body
+
+
+def without_logs(body: bytes):
+    items = json.loads(body)
+    if isinstance(items, dict):
+        return items["items"]
+    for item in items:
+        item.pop("request_log")
+    return items
+
+
+def main(row_cnt: int, repeat: int) -> None:
+    rows = make_rows(row_cnt)
+    strategies = [
+        ("validated", validated), ("validated_jsonable", validated_jsonable),
+        ("fast_path", fast_path), ("envelope", envelope), ("model_construct", constructed)
+    ]
+    if orjson is not None:
+        strategies.append(("orjson", orjson_path))
+
+    baseline = None
+    print(f"{row_cnt} rows, median of {repeat} runs")
+    for name, strategy in strategies:
+        elapsed, body = timed(strategy, rows, repeat)
+        payload = without_logs(body)
+        baseline = baseline or (elapsed, payload)
+        same = "same payload" if payload == baseline[1] else "PAYLOAD DIFFERS"
+        print(f"  {name:<20} {elapsed:9.1f} ms  {baseline[0] / elapsed:5.2f}x  {len(body) / 1024:8.0f} KiB  {same}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    main(args.rows, args.repeat)
@@ -0,0 +1,74 @@
+"""
+    Date Written: 10/19/2026 at 11:30 PM
+
+    Cold start time and memory of an API worker, per way of loading the
+    face stack (face_recognition / dlib, cv2, numpy). Every run is a fresh
+    interpreter importing the application like uvicorn does:
+        - lazy: import app.main, the face stack stays unloaded until the
+          first face request (default)
+        - eager: import app.main then load_face_stack(), what every worker
+          paid before (and FACE_RECOGNITION_PRELOAD=true now)
+    Reports the median import time and the peak RSS of the worker.
+
+    Run from the server directory (needs the usual environment variables):
+        python -m scripts.startup_report --runs 5
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+CHILD = """
+import json, resource, sys, time
+started = time.perf_counter()
+import app.main
+if sys.argv[1] == "eager":
+    from app.ai.face_recognition.face_recognition import load_face_stack
+    load_face_stack()
+elapsed = time.perf_counter() - started
+print(json.dumps({
+    "import_ms": elapsed * 1000,
+    "rss_mib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    "face_loaded": "face_recognition" in sys.modules,
+}))
+"""
+
+MODES = ("lazy", "eager")
+
+
+def run_once(mode: str) -> dict:
+    env = dict(os.environ, PYTHONPATH=os.getcwd())
+    process = subprocess.run(
+        [sys.executable, "-c", CHILD, mode], capture_output=True, text=True, env=env
+    )
+    if process.returncode != 0:
+        # e.g. the face stack is not installed on this machine
+        return {"error": process.stderr.strip().splitlines()[-1]}
+    return json.loads(process.stdout.strip().splitlines()[-1])
+
+
+def main(runs: int) -> None:
+    print(f"median of {runs} cold starts")
+    for mode in MODES:
+        results = [run_once(mode) for _ in range(runs)]
+        errors = [result["error"] for result in results if "error" in result]
+        if errors:
+            print(f"  {mode:<6} unavailable: {errors[0]}")
+            continue
+
+        import_ms = statistics.median(result["import_ms"] for result in results)
+        rss_mib = statistics.median(result["rss_mib"] for result in results)
+        print(
+            f"  {mode:<6} import {import_ms:8.0f} ms   peak RSS {rss_mib:7.1f} MiB   "
+            f"face stack loaded: {results[0]['face_loaded']}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+    main(args.runs)